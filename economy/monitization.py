@@ -1,6 +1,6 @@
 # NyXX/encephalon/economy/monetization.py
 
-import random
+import numpy as np
 from NyXX.utils.logging import log_info, log_error
 
 class Monetization:
@@ -10,12 +10,14 @@ class Monetization:
     value exchange mechanisms that allow agents to earn and the system to generate revenue.
     """
 
-    def __init__(self, system_fee_rate=0.05, premium_service_fee=100):
+    def __init__(self, system_fee_rate=0.05, premium_service_fee=100, rng=None):
         """
         Initialize the monetization strategy for the system.
         :param system_fee_rate: The percentage of each transaction that the system takes as a fee.
         :param premium_service_fee: Fee for agents who opt for premium services.
+        :param rng: NumPy Generator for randomized incentives (e.g. environment.rng.stream("monetization")).
         """
+        self.rng = rng if rng is not None else np.random.default_rng()
         self.system_fee_rate = system_fee_rate  # Fee rate for transactions (5%)
         self.premium_service_fee = premium_service_fee  # Fee for premium services
         self.total_system_revenue = 0  # Total revenue generated by the system (e.g., transaction fees)
@@ -76,6 +78,6 @@ class Monetization:
         :param performance_metric: The performance metric determining the reward (e.g., number of successful trades).
         :return: None
         """
-        incentive = performance_metric * random.randint(10, 50)  # Randomized incentive based on performance
+        incentive = performance_metric * int(self.rng.integers(10, 51))  # Randomized incentive based on performance
         agent.update_balance(incentive)
         log_info(f"Agent {agent.agent_id} incentivized with {incentive} based on performance metric: {performance_metric}.")
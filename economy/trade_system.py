@@ -1,8 +1,11 @@
 # NyXX/encephalon/economy/trade_system.py
 
-import random
-from NyXX.utils.logging import log_info, log_error
-from NyXX.agents.agent import Agent
+import numpy as np
+from utils.loggings import log_info, log_error, log_hot, get_logger
+from organisms.agent import Agent
+from utils.telemetry import get_event_sink
+
+logger = get_logger(__name__)
 
 class TradeSystem:
     """
@@ -11,12 +14,14 @@ class TradeSystem:
     and tracks trade history.
     """
 
-    def __init__(self, trade_fee_rate=0.02):
+    def __init__(self, trade_fee_rate=0.02, rng=None):
         """
         Initialize the trade system.
         :param trade_fee_rate: The percentage fee charged on each transaction.
+        :param rng: NumPy Generator for trade timestamps and prices (e.g. environment.rng.stream("trades")).
         """
         self.trade_fee_rate = trade_fee_rate  # Default 2% fee for each trade
+        self.rng = rng if rng is not None else np.random.default_rng()
         self.trade_history = []  # List to store completed trade transactions
 
     def initiate_trade(self, buyer: Agent, seller: Agent, asset, amount, price):
@@ -37,15 +42,16 @@ class TradeSystem:
             buyer.update_balance(-total_price)
             seller.update_balance(net_price)
             self.record_trade(buyer, seller, asset, amount, price, trade_fee)
-            log_info(f"Trade successful! Agent {buyer.agent_id} bought {amount} of {asset} from Agent {seller.agent_id} for {total_price}.")
+            log_hot(logger, "Trade successful! Agent %s bought %s of %s from Agent %s for %s.",
+                    buyer.agent_id, amount, asset, seller.agent_id, total_price)
         else:
             log_error(f"Trade failed: Agent {buyer.agent_id} does not have enough funds.")
 
     def record_trade(self, buyer: Agent, seller: Agent, asset, amount, price, fee):
         """
         Record the trade transaction in the trade history.
-        :param buyer: The agent who bought the asset.
-        :param seller: The agent who sold the asset.
+        :param buyer: The agent (or agent id) who bought the asset.
+        :param seller: The agent (or agent id) who sold the asset.
         :param asset: The asset being traded.
         :param amount: The quantity of the asset being traded.
         :param price: The price of the asset.
@@ -53,18 +59,21 @@ class TradeSystem:
         :return: None
         """
         trade_details = {
-            "buyer_id": buyer.agent_id,
-            "seller_id": seller.agent_id,
+            "buyer_id": getattr(buyer, "agent_id", buyer),
+            "seller_id": getattr(seller, "agent_id", seller),
             "asset": asset,
             "amount": amount,
             "price_per_unit": price,
             "total_value": price * amount,
             "trade_fee": fee,
             "net_price_to_seller": (price * amount) - fee,
-            "trade_timestamp": random.randint(1, 1000000),  # Random timestamp for trade
+            "trade_timestamp": int(self.rng.integers(1, 1000001)),  # Random timestamp for trade
         }
         self.trade_history.append(trade_details)
-        log_info(f"Trade recorded: {trade_details}")
+        log_hot(logger, "Trade recorded: %s", trade_details)
+        sink = get_event_sink()
+        if sink is not None:
+            sink.emit("trade", **trade_details)
 
     def get_trade_history(self):
         """
@@ -89,7 +98,7 @@ class TradeSystem:
         :param supply_factor: The supply factor affecting price (e.g., limited supply = price increase).
         :return: Adjusted price of the asset.
         """
-        base_price = random.randint(50, 500)  # Base price for an asset
+        base_price = int(self.rng.integers(50, 501))  # Base price for an asset
         adjusted_price = base_price * demand_factor / supply_factor
         log_info(f"Adjusted price for {asset}: {adjusted_price}")
         return adjusted_price
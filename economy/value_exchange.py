@@ -1,7 +1,9 @@
 # NyXX/encephalon/economy/value_exchange.py
 
-from NyXX.agents.agent import Agent
-from NyXX.utils.logging import log_info, log_error
+import numpy as np
+from organisms.agent import Agent
+from utils.loggings import log_info, log_error
+from utils.telemetry import get_event_sink
 
 class ValueExchangeSystem:
     """
@@ -10,7 +12,11 @@ class ValueExchangeSystem:
     It facilitates bartering, collaborations, and sharing of expertise.
     """
 
-    def __init__(self):
+    def __init__(self, rng=None):
+        """
+        :param rng: NumPy Generator for exchange timestamps (e.g. environment.rng.stream("exchanges")).
+        """
+        self.rng = rng if rng is not None else np.random.default_rng()
         self.exchange_history = []  # List to store exchange records
 
     def initiate_exchange(self, initiator: Agent, receiver: Agent, value_type: str, value, trade_terms: str):
@@ -69,7 +75,10 @@ class ValueExchangeSystem:
             "exchange_timestamp": self.generate_timestamp(),
         }
         self.exchange_history.append(exchange_details)
-        log_info(f"Exchange recorded: {exchange_details}")
+        log_info("Exchange recorded: %s", exchange_details)
+        sink = get_event_sink()
+        if sink is not None:
+            sink.emit("exchange", **exchange_details)
 
     def validate_value(self, value_type: str, value) -> bool:
         """
@@ -89,8 +98,7 @@ class ValueExchangeSystem:
         Generate a unique timestamp for the exchange.
         :return: A simulated timestamp.
         """
-        import random
-        return random.randint(1, 1000000)
+        return int(self.rng.integers(1, 1000001))
 
     def get_exchange_history(self):
         """
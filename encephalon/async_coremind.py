@@ -0,0 +1,193 @@
+# NyXX/encephalon/async_coremind.py
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from encephalon.coremind import CoreMind
+from utils.loggings import log_info, log_error, log_hot, get_logger
+
+logger = get_logger(__name__)
+
+
+class AsyncCoreMind(CoreMind):
+    """
+    An asyncio-native CoreMind.
+    Agents push reports and feedback into bounded queues, so producers are slowed down
+    (backpressure) instead of the backlog growing without limit. Each pulse perceives the queued
+    reports, decides, and broadcasts the decision to every subscriber; reflection is handed to
+    a background task so feedback processing and memory writes overlap with the next pulses.
+    Feedback runs on the event loop (it shares the aggregator and strategy with perception), and
+    persistence runs on a single writer thread from a shallow copy of the state, which is
+    consistent because state values are replaced rather than mutated in place; encoding and disk
+    I/O happen on that thread and never block the loop. At most `max_pending_reflections` reflections wait; beyond that pulses wait too.
+    """
+
+    def __init__(self, pulse_interval: float = 1.0, max_reports: int = 10000, max_batch: int = None,
+                 max_pending_reflections: int = 2, subscriber_queue_size: int = 100, **kwargs):
+        """
+        :param pulse_interval: Seconds between pulse starts (the pulse rate); 0 pulses back to back.
+        :param max_reports: Capacity of the report and feedback queues; producers wait when full.
+        :param max_batch: Most reports perceived per pulse (None for everything queued).
+        :param max_pending_reflections: Reflections queued behind the one in progress before pulses wait.
+        :param subscriber_queue_size: Decisions buffered per subscriber; the oldest are dropped when full.
+        """
+        super().__init__(**kwargs)
+        self.pulse_interval = pulse_interval
+        self.max_batch = max_batch
+        self.subscriber_queue_size = subscriber_queue_size
+        self.reports = asyncio.Queue(maxsize=max_reports)
+        self.feedback_queue = asyncio.Queue(maxsize=max_reports)
+        self._reflections = asyncio.Queue(maxsize=max_pending_reflections)
+        self._subscribers = []
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="nyxx-coremind-memory")
+        self._reflector = None
+        self._running = False
+        self.pulses = 0
+        self.last_latency = 0.0  # Seconds from pulse start to decision broadcast
+        self.max_latency = 0.0
+        self.dropped_decisions = 0  # Decisions dropped for slow subscribers
+
+    async def submit_report(self, report: dict):
+        """
+        Queue an agent report for the next pulse, waiting while the queue is full.
+        """
+        await self.reports.put(report)
+
+    def submit_report_nowait(self, report: dict) -> bool:
+        """
+        Queue an agent report without waiting.
+        :return: False if the queue is full and the report was not accepted.
+        """
+        try:
+            self.reports.put_nowait(report)
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    async def submit_feedback(self, feedback: dict):
+        """
+        Queue agent feedback for the next reflection, waiting while the queue is full.
+        """
+        await self.feedback_queue.put(feedback)
+
+    def subscribe(self) -> asyncio.Queue:
+        """
+        :return: A queue receiving every decision broadcast from now on.
+        """
+        queue = asyncio.Queue(maxsize=self.subscriber_queue_size)
+        self._subscribers.append(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        if queue in self._subscribers:
+            self._subscribers.remove(queue)
+
+    def _broadcast(self, decision: dict):
+        for queue in self._subscribers:
+            if queue.full():
+                # A slow subscriber loses its oldest decision rather than stalling the pulse
+                queue.get_nowait()
+                self.dropped_decisions += 1
+            queue.put_nowait(decision)
+
+    @staticmethod
+    def _drain(queue: asyncio.Queue, limit: int = None) -> list:
+        items = []
+        while not queue.empty() and (limit is None or len(items) < limit):
+            items.append(queue.get_nowait())
+        return items
+
+    async def pulse_async(self) -> dict:
+        """
+        One non-blocking cycle: perceive queued reports, decide and broadcast, then queue the
+        reflection in the background (waiting only if too many reflections are behind).
+        :return: The decision.
+        """
+        start = time.perf_counter()
+        reports = self._drain(self.reports, self.max_batch)
+        if reports:
+            self.perceive(reports)
+        decision = self.act()
+        self._broadcast(decision)
+        latency = time.perf_counter() - start
+        self.last_latency = latency
+        self.max_latency = max(self.max_latency, latency)
+        self.pulses += 1
+        log_hot(logger, "Pulse %d perceived %d reports in %.4fs.", self.pulses, len(reports), latency)
+
+        self._ensure_reflector()
+        await self._reflections.put(self._drain(self.feedback_queue))
+        return decision
+
+    def _ensure_reflector(self):
+        if self._reflector is None or self._reflector.done():
+            self._reflector = asyncio.get_running_loop().create_task(self._reflect_forever())
+
+    async def _reflect_forever(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            feedback = await self._reflections.get()
+            try:
+                if feedback:
+                    self.feedback.process_feedback(feedback)
+                # The next pulses replace state values while the writer runs; a shallow copy pins the current ones
+                state = dict(self.current_state)
+                await loop.run_in_executor(self._writer, self.memory.save_state, state)
+            except Exception as e:
+                log_error(f"Background reflection error: {str(e)}")
+            finally:
+                self._reflections.task_done()
+
+    async def run(self, pulses: int = None):
+        """
+        Pulse at the configured rate until stop() is called or `pulses` pulses have run, then
+        wait for outstanding reflections.
+        """
+        loop = asyncio.get_running_loop()
+        self._running = True
+        log_info("Async CoreMind loop started (pulse interval %.3fs).", self.pulse_interval)
+        next_pulse = loop.time()
+        count = 0
+        try:
+            while self._running and (pulses is None or count < pulses):
+                await self.pulse_async()
+                count += 1
+                next_pulse += self.pulse_interval
+                delay = next_pulse - loop.time()
+                if delay < 0:
+                    # Running behind: don't try to catch up with a burst of pulses
+                    next_pulse = loop.time()
+                    delay = 0
+                await asyncio.sleep(delay)
+        finally:
+            self._running = False
+            await self.drain()
+            log_info("Async CoreMind loop stopped after %d pulses (max latency %.4fs).", count, self.max_latency)
+
+    def stop(self):
+        """
+        Stop the loop after the current pulse.
+        """
+        self._running = False
+
+    async def drain(self):
+        """
+        Wait until every queued reflection has been processed and persisted.
+        """
+        if self._reflector is not None and not self._reflector.done():
+            await self._reflections.join()
+
+    async def aclose(self):
+        """
+        Finish outstanding reflections, stop the background task and the writer thread, and close memory.
+        """
+        await self.drain()
+        if self._reflector is not None:
+            self._reflector.cancel()
+            try:
+                await self._reflector
+            except asyncio.CancelledError:
+                pass
+            self._reflector = None
+        self._writer.shutdown(wait=True)
+        self.memory.close()
@@ -5,7 +5,10 @@ from encephalon.strategy import Strategy
 from encephalon.data_aggregation import DataAggregator
 from encephalon.feedback_loop import FeedbackLoop
 from encephalon.memory import Memory
-from utils.loggings import log_info, log_error
+from encephalon.evaluation import PerformanceEvaluator
+from utils.loggings import log_info, log_error, log_hot, get_logger
+
+logger = get_logger(__name__)
 
 
 class CoreMind:
@@ -15,37 +18,64 @@ class CoreMind:
     and evolves strategy based on data and feedback.
     """
 
-    def __init__(self):
-        self.memory = Memory()
+    def __init__(self, evaluator: PerformanceEvaluator = None, memory: Memory = None):
+        """
+        :param evaluator: Evaluates agents' performance; defaults to a thread-pool PerformanceEvaluator.
+        :param memory: Long-term memory; defaults to Memory() in the working directory.
+        """
+        self.memory = memory if memory is not None else Memory()
         self.strategy = Strategy()
-        self.aggregator = DataAggregator()
+        self.evaluator = evaluator if evaluator is not None else PerformanceEvaluator()
+        self.aggregator = DataAggregator(evaluator=self.evaluator)
         self.feedback = FeedbackLoop(self.aggregator, self.strategy)
         self.current_state = {}
 
     def initialize(self):
         log_info("CoreMind initializing...")
-        self.memory.load_state()
+        self.current_state.update(self.memory.load_state())
         self.strategy.initialize()
         log_info("Initialization complete.")
 
     def perceive(self, agent_reports):
         """
         Ingest observations and status reports from agents.
+        :param agent_reports: A list of report dicts, or a columnar batch (dict of NumPy arrays or
+                              Arrow RecordBatch keyed by "agent_id") aggregated vectorized; a
+                              snapshot of the statistics is kept under current_state["agents"]
+                              and the live window stays on the aggregator.
         """
         try:
-            aggregated = self.aggregator.aggregate(agent_reports)
-            self.current_state.update(aggregated)
-            log_info("CoreMind perception complete.")
+            if isinstance(agent_reports, (list, tuple)):
+                aggregated = self.aggregator.aggregate(agent_reports)
+            else:
+                aggregated = {"agents": self.aggregator.aggregate_columns(agent_reports).snapshot()}
+            changed = self._merge_state(aggregated)
+            log_info("CoreMind perception complete (%d state keys changed).", changed)
         except Exception as e:
             log_error(f"Perception error: {str(e)}")
 
+    def _merge_state(self, updates: dict) -> int:
+        """
+        Merge only the keys whose value changed into the current state. Aggregators return fresh
+        summaries only for what changed, so an identity check is enough. State values are replaced,
+        never mutated in place, so a shallow copy of the state is a consistent snapshot of it.
+        :return: The number of keys merged.
+        """
+        state = self.current_state
+        changed = 0
+        for key, value in updates.items():
+            if state.get(key, state) is not value:
+                state[key] = value
+                changed += 1
+        return changed
+
     def think(self):
         """
         Generate high-level strategies based on the current global state.
         """
         try:
             decision = self.strategy.decide(self.current_state)
-            log_info(f"Strategic decision made: {decision}")
+            log_info("Strategic decision made: %s", decision)
             return decision
         except Exception as e:
             log_error(f"Thinking error: {str(e)}")
@@ -82,50 +112,50 @@ class CoreMind:
     def evaluate_environment(self, environment):
         """Evaluate the environment and provide feedback or decisions."""
         # Example logic for evaluating the environment
-        print(f"Evaluating the environment with {len(environment.agents)} agents.")
+        log_info("Evaluating the environment with %d agents.", len(environment.agents))
         # You can add more complex evaluation logic here based on your system's needs
         for agent in environment.agents:
-            print(f"Evaluating agent {agent.agent_id} in the environment.")
+            log_hot(logger, "Evaluating agent %s in the environment.", agent.agent_id)
         # Maybe process data, perform evaluations, or update strategies based on the environment's state
 
     def formulate_strategy(self, environment):
         """Formulate a strategy based on the current environment and agents' feedback."""
         # Example: collect data or feedback from the environment or agents
-        print("Formulating strategy based on environment data...")
+        log_info("Formulating strategy based on environment data...")
         data = self.aggregator.aggregate_data(environment)
 
         
         # Example logic: Adjust strategy based on aggregated data
         if len(data) > 0:
             self.strategy.update_strategy(data)  # Assume update_strategy is a method that adjusts the strategy
-            print("Strategy formulated based on aggregated data.")
+            log_info("Strategy formulated based on aggregated data.")
         else:
-            print("No data to formulate a strategy.")
+            log_info("No data to formulate a strategy.")
 
     def execute_task(self, environment):
         """Execute tasks based on the formulated strategy."""
-        print("Executing task based on current strategy...")
+        log_info("Executing task based on current strategy...")
         
         # Example: Apply strategy to agents or environment
         if self.strategy.is_ready():  # Assume is_ready checks if the strategy is ready
             for agent in environment.agents:
                 agent.perform_task(self.strategy)  # Assuming agents have a method perform_task()
-                print(f"Task executed by agent {agent.id}.")
+                log_hot(logger, "Task executed by agent %s.", agent.id)
         else:
-            print("Strategy not ready, cannot execute task.")
+            log_info("Strategy not ready, cannot execute task.")
 
     def evaluate_performance(self, environment):
-        """Evaluate the performance of agents and the environment based on defined metrics."""
-        print("Evaluating performance based on completed tasks and agent feedback...")
-        
-        performance_scores = {}
-        for agent in environment.agents:
-            performance_scores[agent.id] = agent.evaluate_performance()  # Assuming agents have a method to evaluate performance
-            
-        # For simplicity, print scores
-        for agent_id, score in performance_scores.items():
-            print(f"Agent {agent_id} performance score: {score}")
-        
-        # Adjust strategy based on performance if necessary
-        self.strategy.adjust_based_on_performance(performance_scores)  # Assuming adjust_based_on_performance exists
-        print("Performance evaluation completed.")        
\ No newline at end of file
+        """
+        Evaluate the performance of all agents in parallel and adjust the strategy to the scores.
+        :return: Score array aligned with environment.agents; NaN for agents that failed or timed out.
+        """
+        log_info("Evaluating performance based on completed tasks and agent feedback...")
+        agents = list(environment.agents)
+        scores = self.evaluator.evaluate(agents, environment)
+        agent_ids = [agent.agent_id for agent in agents]
+        for agent_id, score in zip(agent_ids, scores.tolist()):
+            log_hot(logger, "Agent %s performance score: %s", agent_id, score)
+
+        self.strategy.adjust_based_on_performance(scores, agent_ids)
+        log_info("Performance evaluation completed.")
+        return scores
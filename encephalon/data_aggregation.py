@@ -1,64 +1,413 @@
 # NyXX/encephalon/data_aggregation.py
 
-from utils.loggings import log_info, log_error
+import time
+from collections import deque
+from datetime import datetime
+from numbers import Real
+import numpy as np
+from encephalon.evaluation import PerformanceEvaluator
+from utils.loggings import log_info, log_error, log_hot, get_logger
+
+logger = get_logger(__name__)
+
+
+class RollingStats:
+    """
+    Count, mean, variance, min and max of a metric over a sliding window.
+    Values enter with add() and leave, oldest first, with remove(); both are O(1) (amortized
+    for min/max, which are tracked with monotonic deques). Mean and variance use Welford's
+    update and its inverse.
+    """
+
+    __slots__ = ("count", "mean", "_m2", "_minimum", "_maximum")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._minimum = deque()  # (sequence, value), values increasing
+        self._maximum = deque()  # (sequence, value), values decreasing
+
+    def add(self, sequence: int, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        minimum, maximum = self._minimum, self._maximum
+        while minimum and minimum[-1][1] >= value:
+            minimum.pop()
+        minimum.append((sequence, value))
+        while maximum and maximum[-1][1] <= value:
+            maximum.pop()
+        maximum.append((sequence, value))
+
+    def remove(self, sequence: int, value: float):
+        """
+        Remove the oldest value in the window (added under `sequence`).
+        """
+        if self.count <= 1:
+            self.count, self.mean, self._m2 = 0, 0.0, 0.0
+        else:
+            self.count -= 1
+            delta = value - self.mean
+            self.mean -= delta / self.count
+            self._m2 = max(self._m2 - delta * (value - self.mean), 0.0)
+        if self._minimum and self._minimum[0][0] == sequence:
+            self._minimum.popleft()
+        if self._maximum and self._maximum[0][0] == sequence:
+            self._maximum.popleft()
+
+    @property
+    def variance(self) -> float:
+        """
+        Population variance of the values in the window.
+        """
+        return self._m2 / self.count if self.count else 0.0
+
+    @property
+    def min(self):
+        return self._minimum[0][1] if self._minimum else None
+
+    @property
+    def max(self):
+        return self._maximum[0][1] if self._maximum else None
+
+    def summary(self) -> dict:
+        return {"count": self.count, "mean": self.mean, "variance": self.variance, "min": self.min, "max": self.max}
+
+
+class AgentWindow:
+    """
+    The rolling window of one agent's reports: numeric fields feed RollingStats, and the last
+    few reports are kept verbatim.
+    """
+
+    def __init__(self, window: int = None, max_age: float = None, last_n: int = 10):
+        self.window = window
+        self.max_age = max_age
+        self.metrics = {}  # field -> RollingStats
+        self.last = deque(maxlen=last_n)
+        self._entries = deque()  # (timestamp, sequence, {field: value}) in arrival order
+        self._sequence = 0
+
+    def add(self, report: dict, timestamp: float):
+        sequence = self._sequence
+        self._sequence += 1
+        values = {}
+        for field, value in report.items():
+            if isinstance(value, Real) and not isinstance(value, bool) and field != "timestamp":
+                values[field] = value
+                stats = self.metrics.get(field)
+                if stats is None:
+                    stats = self.metrics[field] = RollingStats()
+                stats.add(sequence, value)
+        self._entries.append((timestamp, sequence, values))
+        self.last.append(report)
+        self.evict(timestamp)
+
+    def evict(self, now: float):
+        """
+        Drop reports beyond the count limit or older than max_age seconds.
+        """
+        entries = self._entries
+        while entries and ((self.window is not None and len(entries) > self.window)
+                           or (self.max_age is not None and now - entries[0][0] > self.max_age)):
+            _, sequence, values = entries.popleft()
+            for field, value in values.items():
+                self.metrics[field].remove(sequence, value)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def summary(self) -> dict:
+        return {
+            "count": len(self._entries),
+            "metrics": {field: stats.summary() for field, stats in self.metrics.items() if stats.count},
+            "last": list(self.last),
+        }
+
+
+def _to_columns(batch) -> dict:
+    """
+    Return a columnar batch as a dict of NumPy arrays.
+    Accepts a dict of array-likes or an Arrow RecordBatch/Table (pyarrow itself is not required).
+    """
+    if hasattr(batch, "schema") and hasattr(batch, "column"):
+        return {name: batch.column(index).to_numpy(zero_copy_only=False)
+                for index, name in enumerate(batch.schema.names)}
+    return {name: np.asarray(values) for name, values in batch.items()}
+
+
+class ColumnarWindow:
+    """
+    Vectorized rolling statistics for every agent, fed by columnar batches.
+    Each agent owns a row in per-metric arrays of windowed counts, sums and sums of squares.
+    A batch is grouped by agent id with NumPy, folded into the totals and kept in a ring of the
+    last `window` batches; the oldest batch is subtracted out again when it leaves the ring.
+    Min and max are recomputed over the ring on demand. Work per batch is proportional to its
+    size, never to the history.
+    """
+
+    def __init__(self, window: int = 10, key: str = "agent_id"):
+        """
+        :param window: Number of batches (ticks) covered by the statistics.
+        :param key: The column holding the agent id.
+        """
+        self.window = window
+        self.key = key
+        self.ids = []  # Row -> agent id
+        self.index = {}  # Agent id -> row
+        self.totals = {}  # metric -> {"count", "sum", "sumsq"} arrays over rows
+        self.changed = np.empty(0, dtype=np.intp)  # Rows whose statistics changed in the last batch
+        self._ring = deque()  # Per batch: (rows, {metric: (count, sum, sumsq, min, max)})
+        self._capacity = 0
+
+    def _rows(self, agent_ids: np.ndarray) -> np.ndarray:
+        """
+        Map unique agent ids to rows, adding rows for agents seen for the first time.
+        """
+        index = self.index
+        rows = np.empty(len(agent_ids), dtype=np.intp)
+        for position, agent_id in enumerate(agent_ids.tolist()):
+            row = index.get(agent_id)
+            if row is None:
+                row = index[agent_id] = len(self.ids)
+                self.ids.append(agent_id)
+            rows[position] = row
+        if len(self.ids) > self._capacity:
+            self._grow(max(len(self.ids), 2 * self._capacity))
+        return rows
+
+    def _grow(self, capacity: int):
+        for totals in self.totals.values():
+            for name, values in totals.items():
+                totals[name] = np.pad(values, (0, capacity - len(values)))
+        self._capacity = capacity
+
+    def ingest(self, batch) -> np.ndarray:
+        """
+        Fold a columnar batch into the window.
+        :param batch: Dict of arrays or Arrow RecordBatch with one row per report and a key column.
+                      Every other numeric column is a metric; NaN marks a missing value.
+        :return: The rows whose statistics changed.
+        """
+        columns = _to_columns(batch)
+        agent_ids, inverse = np.unique(columns.pop(self.key), return_inverse=True)
+        columns.pop("timestamp", None)
+        rows = self._rows(agent_ids)
+        groups = len(agent_ids)
+
+        stats = {}
+        for metric, values in columns.items():
+            if values.dtype.kind not in "iuf":
+                continue
+            values = values.astype(np.float64, copy=False)
+            valid = ~np.isnan(values)
+            clean = np.where(valid, values, 0.0)
+            count = np.bincount(inverse, weights=valid, minlength=groups)
+            total = np.bincount(inverse, weights=clean, minlength=groups)
+            squares = np.bincount(inverse, weights=clean * clean, minlength=groups)
+            minimum = np.full(groups, np.inf)
+            maximum = np.full(groups, -np.inf)
+            np.minimum.at(minimum, inverse[valid], values[valid])
+            np.maximum.at(maximum, inverse[valid], values[valid])
+            stats[metric] = (count, total, squares, minimum, maximum)
+
+            totals = self.totals.get(metric)
+            if totals is None:
+                totals = self.totals[metric] = {name: np.zeros(self._capacity) for name in ("count", "sum", "sumsq")}
+            totals["count"][rows] += count  # Rows are unique within a batch
+            totals["sum"][rows] += total
+            totals["sumsq"][rows] += squares
+
+        self._ring.append((rows, stats))
+        changed = rows
+        while len(self._ring) > self.window:
+            old_rows, old_stats = self._ring.popleft()
+            for metric, (count, total, squares, _, _) in old_stats.items():
+                totals = self.totals[metric]
+                totals["count"][old_rows] -= count
+                totals["sum"][old_rows] -= total
+                totals["sumsq"][old_rows] -= squares
+            changed = np.union1d(changed, old_rows)
+        self.changed = changed
+        return changed
+
+    def summary(self, metric: str, rows=None) -> dict:
+        """
+        Windowed count, mean, variance, min and max of a metric as arrays, for all rows or the given rows.
+        """
+        totals = self.totals[metric]
+        size = len(self.ids)
+        count = totals["count"][:size]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = totals["sum"][:size] / count
+            variance = np.maximum(totals["sumsq"][:size] / count - mean * mean, 0.0)
+        minimum = np.full(size, np.inf)
+        maximum = np.full(size, -np.inf)
+        for ring_rows, stats in self._ring:
+            if metric in stats:
+                np.minimum.at(minimum, ring_rows, stats[metric][3])
+                np.maximum.at(maximum, ring_rows, stats[metric][4])
+        result = {"count": count, "mean": mean, "variance": variance,
+                  "min": np.where(np.isinf(minimum), np.nan, minimum),
+                  "max": np.where(np.isinf(maximum), np.nan, maximum)}
+        if rows is not None:
+            result = {name: values[rows] for name, values in result.items()}
+        return result
+
+    def get(self, agent_id) -> dict:
+        """
+        The windowed statistics of one agent, per metric.
+        """
+        row = self.index.get(agent_id)
+        if row is None:
+            return None
+        return {metric: {name: values[0].item() for name, values in self.summary(metric, [row]).items()}
+                for metric in self.totals}
+
+    def snapshot(self) -> dict:
+        """
+        A detached copy of the statistics of every agent: the row ids and, per metric, read-only
+        arrays of count, mean, variance, min and max. Later batches do not change it, so it can
+        be kept in state and persisted.
+        """
+        metrics = {}
+        for metric in self.totals:
+            stats = {}
+            for name, values in self.summary(metric).items():
+                values = np.array(values)
+                values.flags.writeable = False
+                stats[name] = values
+            metrics[metric] = stats
+        return {"ids": list(self.ids), "metrics": metrics}
+
+    def __len__(self):
+        return len(self.ids)
+
 
 class DataAggregator:
     """
     Collects, processes, and aggregates data from various agents.
     This class helps CoreMind to obtain a unified view of the system's state.
+    Reports are folded into per-agent rolling windows as they arrive, so memory and the cost
+    of each aggregation stay flat however long a simulation runs.
     """
 
-    def __init__(self):
-        self.data_store = {}
+    def __init__(self, window: int = 1000, max_age: float = None, last_n: int = 10,
+                 evaluator: PerformanceEvaluator = None):
+        """
+        :param window: Maximum number of reports kept per agent (None for no count limit).
+        :param max_age: Maximum age of a report in seconds (None for no time limit). Reports are
+                        timed by their "timestamp" field (epoch seconds or datetime), or on arrival.
+        :param last_n: Number of most recent raw reports kept per agent.
+        :param evaluator: Scores agents in aggregate_data(); defaults to a thread-pool PerformanceEvaluator.
+        """
+        self.window = window
+        self.max_age = max_age
+        self.last_n = last_n
+        self.windows = {}  # agent_id -> AgentWindow
+        self.columns = ColumnarWindow()  # Rolling statistics fed by columnar batches
+        self.evaluator = evaluator if evaluator is not None else PerformanceEvaluator()
+
+    @property
+    def data_store(self) -> dict:
+        """
+        The summary of every agent's window.
+        """
+        return self.get_aggregated_data()
 
     def aggregate(self, agent_reports):
         """
         Aggregates data reports from all agents into a unified data structure.
         (This method is used when you have a list of agent reports)
+        :return: The updated summaries of the agents that reported in this batch.
         """
         try:
             log_info("Aggregating data from agent reports...")
+            now = time.time()
+            updated = {}
             for report in agent_reports:
-                self._process_agent_report(report)
+                agent_id = self._process_agent_report(report, now)
+                if agent_id is not None:
+                    updated[agent_id] = self.windows[agent_id]
             log_info("Data aggregation from reports complete.")
-            return self.data_store
+            return {agent_id: window.summary() for agent_id, window in updated.items()}
         except Exception as e:
             log_error(f"Data aggregation error: {str(e)}")
             return {}
 
-    def _process_agent_report(self, report):
+    def aggregate_columns(self, batch) -> ColumnarWindow:
         """
-        Process a single agent report and store relevant data in the central repository.
+        Aggregate a columnar batch of agent reports (dict of NumPy arrays or Arrow RecordBatch,
+        keyed by an "agent_id" column) with vectorized group-bys.
+        :return: The columnar window; its `changed` attribute holds the rows updated by this batch.
+        """
+        try:
+            changed = self.columns.ingest(batch)
+            log_hot(logger, "Columnar aggregation updated %d agents.", len(changed))
+        except Exception as e:
+            log_error(f"Columnar data aggregation error: {str(e)}")
+        return self.columns
+
+    def _process_agent_report(self, report, now: float = None):
+        """
+        Fold a single agent report into that agent's rolling window.
+        :return: The agent id, or None for an invalid report.
         """
         agent_id = report.get("agent_id")
-        if agent_id:
-            if agent_id not in self.data_store:
-                self.data_store[agent_id] = []
-            self.data_store[agent_id].append(report)
-        else:
+        if agent_id is None or agent_id == "":
             log_error(f"Invalid agent report: {report}")
+            return None
+        window = self.windows.get(agent_id)
+        if window is None:
+            window = self.windows[agent_id] = AgentWindow(self.window, self.max_age, self.last_n)
+        timestamp = report.get("timestamp")
+        if isinstance(timestamp, datetime):
+            timestamp = timestamp.timestamp()
+        elif not isinstance(timestamp, Real):
+            timestamp = now if now is not None else time.time()
+        window.add(report, timestamp)
+        return agent_id
 
     def aggregate_data(self, environment):
         """
         Processes the current state of the environment to update the aggregated data.
-        For example, this method iterates through all agents in the environment
-        and collects performance metrics or other relevant data.
+        Agents are scored in parallel by the evaluator and each score is recorded as a
+        "performance" report; agents without a score (failed, timed out or not evaluable) are skipped.
+        :return: The updated summaries of the evaluated agents.
         """
         log_info("Aggregating data from the environment...")
-        aggregated = {}
+        reports = []
         try:
-            for agent in environment.agents:
-                # Assume each agent has an `evaluate_performance()` method returning a metric,
-                # and that agent objects have an 'id' attribute.
-                aggregated[agent.id] = agent.evaluate_performance()
-            self.data_store = aggregated
+            agents = list(environment.agents)
+            scores = self.evaluator.evaluate(agents, environment)
+            reports = [{"agent_id": agent.agent_id, "performance": score}
+                       for agent, score in zip(agents, scores.tolist()) if not np.isnan(score)]
             log_info("Data aggregation from environment complete.")
         except Exception as e:
             log_error(f"Error aggregating data from environment: {str(e)}")
-        return self.data_store
+        return self.aggregate(reports)
+
+    def expire(self, now: float = None):
+        """
+        Apply time-based eviction to every window, e.g. for agents that stopped reporting,
+        and forget agents whose window is empty.
+        """
+        now = time.time() if now is None else now
+        for agent_id in list(self.windows):
+            window = self.windows[agent_id]
+            window.evict(now)
+            if not len(window):
+                del self.windows[agent_id]
+        log_hot(logger, "%d agent windows after expiry.", len(self.windows))
+
+    def get_agent_summary(self, agent_id):
+        window = self.windows.get(agent_id)
+        return window.summary() if window is not None else None
 
     def get_aggregated_data(self):
         """
         Retrieve the aggregated data that has been stored.
         """
-        return self.data_store
+        return {agent_id: window.summary() for agent_id, window in self.windows.items()}
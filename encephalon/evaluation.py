@@ -0,0 +1,155 @@
+# NyXX/encephalon/evaluation.py
+
+import math
+import os
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+import numpy as np
+from utils.loggings import log_info, log_error, log_hot, get_logger
+
+logger = get_logger(__name__)
+
+
+def _score(agent, environment) -> float:
+    """
+    Score one agent; agents without `evaluate_performance` or returning a non-number score NaN.
+    """
+    evaluate = getattr(agent, "evaluate_performance", None)
+    if evaluate is None:
+        return math.nan
+    score = evaluate(environment)
+    return math.nan if score is None else float(score)
+
+
+def _evaluate_chunk(agents, environment, agent_timeout: float = None) -> list:
+    """
+    Score a chunk of agents in order. Runs inside the executor (so it must stay module-level to
+    be picklable for process pools). An agent that raises, or whose evaluation took longer than
+    `agent_timeout` seconds, scores NaN; the evaluation itself is not interrupted.
+    """
+    scores = []
+    for agent in agents:
+        start = time.perf_counter()
+        try:
+            score = _score(agent, environment)
+        except Exception as e:
+            log_hot(logger, "Performance evaluation failed for agent %s: %s",
+                    getattr(agent, "agent_id", None), e)
+            score = math.nan
+        if agent_timeout is not None and time.perf_counter() - start > agent_timeout:
+            score = math.nan
+        scores.append(score)
+    return scores
+
+
+class PerformanceEvaluator:
+    """
+    Evaluates agents' performance in parallel.
+    Agents are split into chunks that run on a pluggable executor (a thread pool, a process pool,
+    or any concurrent.futures.Executor), and the scores come back as one float array aligned with
+    the agents. Agents that fail score NaN.
+    Two limits can be set. `agent_timeout` discards slow scores: an agent whose evaluation took
+    longer scores NaN, but it is not interrupted. `chunk_timeout` is the actual deadline: each
+    chunk is waited for at most that many seconds past the chunks queued before it on the same
+    worker, and a chunk still running after that is abandoned (running Python code cannot be
+    interrupted), so all of its agents score NaN. A hung chunk keeps its worker busy, so chunks
+    queued behind it on that worker may time out too. The serial executor has no chunk deadline.
+    """
+
+    def __init__(self, executor="thread", max_workers: int = None, chunk_size: int = 256,
+                 agent_timeout: float = None, chunk_timeout: float = None):
+        """
+        :param executor: "thread", "process", "serial", or an Executor instance (not shut down by close()).
+        :param max_workers: Pool size for the "thread" and "process" executors, or the number of
+                            chunks an Executor instance runs at once (default 1), for chunk deadlines.
+        :param chunk_size: Agents evaluated per submitted task.
+        :param agent_timeout: Seconds after which an agent's score is discarded as NaN; None keeps every score.
+        :param chunk_timeout: Seconds each chunk is waited for once its worker is free; None waits indefinitely.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1.")
+        if not isinstance(executor, Executor) and executor not in ("thread", "process", "serial"):
+            raise ValueError(f"Unknown executor: {executor}")
+        self.executor = executor
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self.agent_timeout = agent_timeout
+        self.chunk_timeout = chunk_timeout
+        self._pool = executor if isinstance(executor, Executor) else None
+        self._workers = max_workers or 1  # Chunks that run at once; set when a pool is created
+        self.timed_out = 0  # Agents scored NaN because their chunk missed its deadline
+        self.elapsed = 0.0  # Seconds spent in the last evaluation
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            cpus = os.cpu_count() or 1
+            if self.executor == "process":
+                self._workers = self.max_workers or cpus
+                self._pool = ProcessPoolExecutor(max_workers=self._workers)
+            else:
+                self._workers = self.max_workers or min(32, cpus + 4)
+                self._pool = ThreadPoolExecutor(max_workers=self._workers,
+                                                thread_name_prefix="nyxx-evaluation")
+        return self._pool
+
+    def evaluate(self, agents, environment=None) -> np.ndarray:
+        """
+        Evaluate every agent.
+        :param agents: Sequence of agents.
+        :param environment: Passed to each agent's evaluate_performance().
+        :return: Float array of scores, in agent order; NaN for failed or timed-out agents.
+        """
+        agents = list(agents)
+        scores = np.full(len(agents), np.nan)
+        if not agents:
+            return scores
+
+        start = time.perf_counter()
+        size = self.chunk_size
+        chunks = [agents[i:i + size] for i in range(0, len(agents), size)]
+        if self.executor == "serial":
+            for index, chunk in enumerate(chunks):
+                scores[index * size:index * size + len(chunk)] = _evaluate_chunk(chunk, environment, self.agent_timeout)
+        else:
+            pool = self._get_pool()
+            futures = [pool.submit(_evaluate_chunk, chunk, environment, self.agent_timeout) for chunk in chunks]
+            timed_out = 0
+            for index, future in enumerate(futures):
+                wait_for = None
+                if self.chunk_timeout is not None:
+                    # The chunk may first wait for the chunks queued before it on its worker
+                    deadline = start + self.chunk_timeout * (index // self._workers + 1)
+                    wait_for = max(deadline - time.perf_counter(), 0.0)
+                try:
+                    chunk_scores = future.result(timeout=wait_for)
+                except FutureTimeoutError:
+                    future.cancel()
+                    self.timed_out += len(chunks[index])
+                    timed_out += 1
+                    continue
+                except Exception as e:
+                    log_error(f"Performance evaluation chunk {index} failed: {str(e)}")
+                    continue
+                scores[index * size:index * size + len(chunk_scores)] = chunk_scores
+            if timed_out:
+                log_error(f"Performance evaluation timed out for {timed_out} of {len(chunks)} chunks.")
+
+        self.elapsed = time.perf_counter() - start
+        log_info("Evaluated %d agents in %.3fs (%d without a score).",
+                 len(agents), self.elapsed, int(np.isnan(scores).sum()))
+        return scores
+
+    def close(self):
+        """
+        Shut down the pool this evaluator created; executors passed in are left running.
+        """
+        if self._pool is not None and not isinstance(self.executor, Executor):
+            self._pool.shutdown(wait=False, cancel_futures=True)
+        self._pool = self.executor if isinstance(self.executor, Executor) else None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
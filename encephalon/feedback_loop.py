@@ -1,50 +1,188 @@
 # NyXX/encephalon/feedback_loop.py
 
+import math
+from numbers import Real
+import numpy as np
 from utils.loggings import log_info, log_error
 
+# Report fields that identify a report rather than measure anything
+NON_METRIC_FIELDS = {"agent_id", "timestamp"}
+
+
+class MetricTrend:
+    """
+    Streaming trend state of one metric: an exponentially weighted level and variance, an
+    exponentially weighted slope of the level, and a two-sided CUSUM change-point detector.
+    Each update folds in a whole batch in O(batch): the batch mean enters the level as if all
+    its values had arrived one after another, so large batches move the level further.
+    """
+
+    __slots__ = ("alpha", "slope_alpha", "drift", "threshold", "level", "variance", "slope",
+                 "cusum_up", "cusum_down", "change", "count")
+
+    def __init__(self, alpha: float = 0.1, slope_alpha: float = 0.3, drift: float = 0.5,
+                 threshold: float = 5.0):
+        """
+        :param alpha: Per-value EWMA weight of the level and variance.
+        :param slope_alpha: Per-batch EWMA weight of the slope.
+        :param drift: CUSUM slack, in standard errors of the batch mean, ignored per batch.
+        :param threshold: CUSUM sum, in standard errors of the batch mean, that signals a change point.
+        """
+        self.alpha = alpha
+        self.slope_alpha = slope_alpha
+        self.drift = drift
+        self.threshold = threshold
+        self.level = None
+        self.variance = 0.0
+        self.slope = 0.0
+        self.cusum_up = 0.0
+        self.cusum_down = 0.0
+        self.change = None  # "up" or "down" when the last batch completed a change point
+        self.count = 0
+
+    def update(self, values) -> "MetricTrend":
+        """
+        Fold a batch of values (a scalar or array-like) into the trend.
+        """
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        n = values.size
+        if not n:
+            return self
+        mean = float(values.mean())
+        self.count += n
+        self.change = None
+        if self.level is None:
+            self.level = mean
+            self.variance = float(values.var())
+            return self
+
+        previous = self.level
+        weight = 1.0 - (1.0 - self.alpha) ** n
+        deviation = mean - previous
+        self.level = previous + weight * deviation
+        batch_spread = float(values.var()) if n > 1 else 0.0
+        self.variance = (1.0 - weight) * (self.variance + weight * deviation ** 2) + weight * batch_spread
+        self.slope += self.slope_alpha * ((self.level - previous) - self.slope)
+
+        # Standardize the batch mean by its standard error
+        std = math.sqrt(self.variance / n)
+        if std > 0:
+            z = deviation / std
+            self.cusum_up = max(0.0, self.cusum_up + z - self.drift)
+            self.cusum_down = max(0.0, self.cusum_down - z - self.drift)
+            if self.cusum_up > self.threshold:
+                self.change, self.cusum_up, self.cusum_down = "up", 0.0, 0.0
+            elif self.cusum_down > self.threshold:
+                self.change, self.cusum_up, self.cusum_down = "down", 0.0, 0.0
+        return self
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    @property
+    def strength(self) -> float:
+        """
+        The slope in standard deviations of the metric (0 while the metric has not varied).
+        """
+        std = self.std
+        return self.slope / std if std > 0 else 0.0
+
+    def summary(self) -> dict:
+        return {"level": self.level, "slope": self.slope, "std": self.std, "strength": self.strength,
+                "change": self.change, "count": self.count}
+
 
 class FeedbackLoop:
     """
     Facilitates the feedback loop between agents and CoreMind.
     The loop helps in refining strategies and adapting decisions based on agent outcomes.
+    Feedback is streamed into per-metric MetricTrends, and the market trends handed to the
+    strategy are read off their current slopes and change points, so each batch of feedback
+    costs O(batch) and the trends move with every batch.
     """
 
-    def __init__(self, data_aggregator, strategy_system):
+    def __init__(self, data_aggregator, strategy_system, alpha: float = 0.1, slope_alpha: float = 0.3,
+                 drift: float = 0.5, threshold: float = 5.0, trend_threshold: float = 0.05,
+                 trend_metrics: list = None):
+        """
+        :param alpha, slope_alpha, drift, threshold: MetricTrend parameters for every metric.
+        :param trend_threshold: Mean slope, in standard deviations, beyond which the market is
+                                called bullish or bearish.
+        :param trend_metrics: Metrics that make up the market trend (None for all).
+        """
         self.data_aggregator = data_aggregator
         self.strategy_system = strategy_system
+        self.trend_parameters = (alpha, slope_alpha, drift, threshold)
+        self.trend_threshold = trend_threshold
+        self.trend_metrics = set(trend_metrics) if trend_metrics is not None else None
+        self.trends = {}  # metric -> MetricTrend
+
+    def observe(self, metrics: dict):
+        """
+        Fold one batch of observations into the trends.
+        :param metrics: Metric name -> value or array of values.
+        """
+        for metric, values in metrics.items():
+            trend = self.trends.get(metric)
+            if trend is None:
+                trend = self.trends[metric] = MetricTrend(*self.trend_parameters)
+            trend.update(values)
+
+    def observe_market(self, market):
+        """
+        Fold a market's current asset prices into the trends (one "price:<asset>" metric each).
+        """
+        self.observe({f"price:{asset}": price for asset, price in market.assets.items()})
 
     def process_feedback(self, agent_feedbacks):
         """
         Process feedback received from the agents and update CoreMind's strategy.
         This allows CoreMind to adapt and improve over time.
+        :return: The updated strategy and the market trends it was decided on.
         """
         try:
             log_info("Processing feedback from agents...")
-            # Aggregate feedback data
-            aggregated_data = self.data_aggregator.aggregate(agent_feedbacks)
-            
-            # Decide on new strategies based on aggregated data
-            current_state = self._analyze_data(aggregated_data)
-            new_strategy = self.strategy_system.decide(current_state)
+            batch = {}
+            for feedback in agent_feedbacks:
+                for field, value in feedback.items():
+                    if field not in NON_METRIC_FIELDS and isinstance(value, Real):
+                        batch.setdefault(field, []).append(value)
+            self.observe(batch)
 
-            # Return the updated strategy and aggregated data
-            return new_strategy, aggregated_data
+            # Decide on new strategies based on the streamed trends
+            current_state = self._analyze_data()
+            new_strategy = self.strategy_system.decide(current_state)
+            return new_strategy, current_state["market_trends"]
 
         except Exception as e:
             log_error(f"Feedback processing error: {str(e)}")
             return None, None
 
-    def _analyze_data(self, aggregated_data):
+    process = process_feedback
+
+    def _analyze_data(self):
         """
-        Analyzes the aggregated data and returns the current state of the system.
-        The analysis helps in refining decisions made by CoreMind.
+        Derive the current state of the system from the streamed trends.
+        The market is bullish (bearish) when the mean slope of the trend metrics exceeds the
+        trend threshold upwards (downwards); without a clear slope, a fresh change point decides.
         """
-        # For now, just a placeholder. You could implement detailed analysis logic here.
-        # For example, calculating performance metrics or detecting patterns in the agents' behaviors.
+        trends = {metric: trend for metric, trend in self.trends.items()
+                  if self.trend_metrics is None or metric in self.trend_metrics}
+        strength = float(np.mean([trend.strength for trend in trends.values()])) if trends else 0.0
+        changes = {metric: trend.change for metric, trend in trends.items() if trend.change}
+        if abs(strength) > self.trend_threshold:
+            direction = 1 if strength > 0 else -1
+        else:
+            shifts = sum(1 if change == "up" else -1 for change in changes.values())
+            direction = (shifts > 0) - (shifts < 0)
         return {
             "market_trends": {
-                "bullish": True,  # Placeholder: can be determined from the aggregated data
-                "bearish": False
+                "bullish": direction > 0,
+                "bearish": direction < 0,
+                "strength": strength,
+                "change_points": changes,
+                "metrics": {metric: trend.summary() for metric, trend in trends.items()},
             }
         }
-
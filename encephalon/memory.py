@@ -1,48 +1,511 @@
 # NyXX/encephalon/memory.py
 
 import json
+import os
+import shutil
+import sqlite3
+from bisect import bisect_left, bisect_right
 from datetime import datetime
-from utils.loggings import log_info, log_error
+from utils.loggings import log_info, log_error, log_hot, get_logger
+
+logger = get_logger(__name__)
+
+
+def _timestamp_key(value) -> str:
+    """
+    Normalise a timestamp (datetime, epoch float or ISO string) to the ISO string events are indexed by.
+    """
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value).isoformat()
+    return value
+
+
+def _json_default(value):
+    """
+    Encode values json does not know: NumPy arrays and scalars as lists and numbers, anything else as its string.
+    """
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return str(value)
+
+
+def _event_type(event: dict):
+    return event.get("type", event.get("event_type"))
+
+
+def _field(event: dict, path: str):
+    """
+    Resolve a dotted path such as "market_trends.bearish" inside an event.
+    """
+    value = event
+    for key in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def _matches(event: dict, event_type=None, agent_id=None, fields: dict = None) -> bool:
+    if event_type is not None and _event_type(event) != event_type:
+        return False
+    if agent_id is not None and event.get("agent_id") != agent_id:
+        return False
+    return all(_field(event, path) == value for path, value in (fields or {}).items())
+
+
+class JSONMemoryBackend:
+    """
+    The original storage: every event in one dict keyed by timestamp, rewritten to a JSON file on each save.
+    Fine for small histories; each save costs time proportional to the whole history.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.data = self._load()
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, "r") as file:
+                data = json.load(file)
+            log_info("Memory successfully loaded.")
+            return data
+        except (FileNotFoundError, json.JSONDecodeError) as e:
+            log_error(f"Error loading memory: {str(e)}. Creating new memory file.")
+            return {}
+
+    def append(self, event: dict):
+        self.data[event["timestamp"]] = event
+        self.flush()
+
+    def get(self, timestamp: str):
+        return self.data.get(timestamp)
+
+    def recent(self, limit: int) -> list:
+        return list(self.data.values())[-limit:] if limit > 0 else []
+
+    def range(self, start: str = None, end: str = None):
+        for timestamp in sorted(self.data):
+            if (start is None or timestamp >= start) and (end is None or timestamp <= end):
+                yield self.data[timestamp]
+
+    def reverse(self):
+        return reversed(list(self.data.values()))
+
+    def flush(self):
+        try:
+            with open(self.path, "w") as file:
+                json.dump(self.data, file, indent=4, default=_json_default)
+            log_hot(logger, "Memory successfully saved.")
+        except Exception as e:
+            log_error(f"Error saving memory: {str(e)}")
+
+    def close(self):
+        pass
+
+    def __len__(self):
+        return len(self.data)
+
+
+class EventLog:
+    """
+    An append-only, log-structured event store.
+    Events are appended to a JSON-lines segment file and located through an in-memory index of
+    (timestamp, file offset) pairs kept sorted by timestamp, so appends cost O(1) I/O and range
+    queries by timestamp cost O(log N) plus the events returned. Events stored again under an
+    existing timestamp supersede the older record; compact() rewrites the file without them.
+    The file is not created until the first event is appended.
+    """
+
+    def __init__(self, path: str, sync: bool = False):
+        """
+        :param path: The segment file; existing records are indexed on open.
+        :param sync: Flush the file after every append (slower, but nothing is lost on a crash).
+        """
+        self.path = path
+        self.sync = sync
+        self._timestamps = []  # Sorted event timestamps
+        self._offsets = []  # File offset of each event, parallel to _timestamps
+        self._superseded = 0  # Records shadowed by a later event with the same timestamp
+        self._unflushed = False  # Appends still sitting in the write buffer
+        self._writer = None
+        self._reader = None
+        self._end = 0
+        self._build_index()
+
+    def _open(self):
+        """
+        Open the segment file for appending and reading.
+        """
+        self._writer = open(self.path, "ab")
+        self._reader = open(self.path, "rb")
+        self._end = self._writer.tell()
+
+    def _build_index(self):
+        """
+        Scan the segment file once and index every complete record.
+        A file in the original single-document JSON format is migrated first (see
+        _migrate_legacy). A torn final line (e.g. after a crash) is truncated away, but only
+        when every complete line was a readable record: a file that is not an event log is
+        refused with a ValueError and left untouched.
+        """
+        if not os.path.exists(self.path):
+            return
+        legacy = self._read_legacy()
+        if legacy is not None:
+            self._migrate_legacy(legacy)
+        entries = []
+        offset = 0
+        unreadable = 0
+        with open(self.path, "rb") as file:
+            for line in file:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    entries.append((json.loads(line)["timestamp"], offset))
+                except (ValueError, KeyError, TypeError):
+                    unreadable += 1
+                    log_error(f"Skipping unreadable memory record at offset {offset} in {self.path}.")
+                offset += len(line)
+        if unreadable and (not entries or offset != os.path.getsize(self.path)):
+            raise ValueError(f"{self.path} is not a memory log ({unreadable} unreadable lines); it was left untouched.")
+        if offset != os.path.getsize(self.path):
+            with open(self.path, "r+b") as file:
+                file.truncate(offset)
+        entries.sort()  # Offsets break ties, so records sharing a timestamp keep their write order
+        self._timestamps = [timestamp for timestamp, _ in entries]
+        self._offsets = [offset for _, offset in entries]
+        self._superseded = len(self._timestamps) - len(set(self._timestamps))
+
+    def _read_legacy(self):
+        """
+        Return the events of a file written in the original format (one JSON document mapping
+        timestamps to events, as JSONMemoryBackend writes it), or None for an event log.
+        """
+        with open(self.path, "rb") as file:
+            first = file.readline()
+            try:
+                if "timestamp" in json.loads(first):
+                    return None  # The first line is already a record
+            except (ValueError, TypeError):
+                pass
+            file.seek(0)
+            try:
+                data = json.load(file)
+            except ValueError:
+                return None
+        return data if isinstance(data, dict) and "timestamp" not in data else None
+
+    def _migrate_legacy(self, data: dict):
+        """
+        Rewrite a legacy JSON memory file as an event log, keeping the original next to it
+        as <path>.legacy.
+        """
+        temporary = f"{self.path}.migrate"
+        with open(temporary, "wb") as file:
+            for timestamp, event in data.items():
+                event = {"timestamp": timestamp, **event} if isinstance(event, dict) else \
+                    {"timestamp": timestamp, "value": event}
+                file.write(json.dumps(event, default=_json_default, separators=(",", ":")).encode() + b"\n")
+        shutil.copyfile(self.path, f"{self.path}.legacy")
+        os.replace(temporary, self.path)
+        log_info(f"Migrated {len(data)} events of legacy memory file {self.path} to the memory log format.")
+
+    def append(self, event: dict):
+        """
+        Append an event; it must carry an ISO "timestamp".
+        """
+        line = json.dumps(event, default=_json_default, separators=(",", ":")).encode() + b"\n"
+        if self._writer is None:
+            self._open()
+        offset = self._end
+        self._writer.write(line)
+        self._end += len(line)
+        if self.sync:
+            self._writer.flush()
+        else:
+            self._unflushed = True
+
+        timestamp = event["timestamp"]
+        if not self._timestamps or timestamp > self._timestamps[-1]:
+            self._timestamps.append(timestamp)
+            self._offsets.append(offset)
+        else:  # Equal or out-of-order timestamp (e.g. after a clock change)
+            index = bisect_right(self._timestamps, timestamp)
+            if index and self._timestamps[index - 1] == timestamp:
+                self._superseded += 1
+            self._timestamps.insert(index, timestamp)
+            self._offsets.insert(index, offset)
+
+    def _read(self, offset: int) -> dict:
+        if self._reader is None:
+            self._open()
+        if self._unflushed:
+            self._writer.flush()
+            self._unflushed = False
+        self._reader.seek(offset)
+        return json.loads(self._reader.readline())
+
+    def _live(self, start: int, stop: int):
+        """
+        Yield the live records between two index positions, skipping superseded ones.
+        """
+        timestamps, offsets = self._timestamps, self._offsets
+        for index in range(start, stop):
+            if index + 1 < len(timestamps) and timestamps[index + 1] == timestamps[index]:
+                continue
+            yield self._read(offsets[index])
+
+    def get(self, timestamp: str):
+        """
+        Return the latest event stored under a timestamp, or None.
+        """
+        index = bisect_right(self._timestamps, timestamp)
+        if index and self._timestamps[index - 1] == timestamp:
+            return self._read(self._offsets[index - 1])
+        return None
+
+    def range(self, start: str = None, end: str = None):
+        """
+        Yield the events with start <= timestamp <= end, oldest first.
+        """
+        low = bisect_left(self._timestamps, start) if start is not None else 0
+        high = bisect_right(self._timestamps, end) if end is not None else len(self._timestamps)
+        return self._live(low, high)
+
+    def recent(self, limit: int) -> list:
+        """
+        Return the `limit` most recent events, oldest first.
+        """
+        events = []
+        for event in self.reverse():
+            if len(events) >= limit:
+                break
+            events.append(event)
+        events.reverse()
+        return events
+
+    def reverse(self):
+        """
+        Yield events from the newest to the oldest.
+        """
+        timestamps, offsets = self._timestamps, self._offsets
+        previous = None
+        for index in range(len(timestamps) - 1, -1, -1):
+            if timestamps[index] != previous:
+                previous = timestamps[index]
+                yield self._read(offsets[index])
+
+    def compact(self, before: str = None):
+        """
+        Rewrite the segment in timestamp order without superseded records.
+        :param before: Optionally also drop every event older than this timestamp.
+        """
+        low = bisect_left(self._timestamps, before) if before is not None else 0
+        self.flush()
+        temporary = f"{self.path}.compact"
+        timestamps, offsets = [], []
+        with open(temporary, "wb") as file:
+            for event in self._live(low, len(self._timestamps)):
+                line = json.dumps(event, default=_json_default, separators=(",", ":")).encode() + b"\n"
+                timestamps.append(event["timestamp"])
+                offsets.append(file.tell())
+                file.write(line)
+        self.close()
+        os.replace(temporary, self.path)
+        self._timestamps, self._offsets, self._superseded = timestamps, offsets, 0
+        self._open()
+        log_info(f"Memory log {self.path} compacted to {len(timestamps)} events.")
+
+    @property
+    def superseded(self) -> int:
+        """
+        The number of dead records compact() would reclaim.
+        """
+        return self._superseded
+
+    def flush(self):
+        if self._writer is not None and not self._writer.closed:
+            self._writer.flush()
+            self._unflushed = False
+
+    def close(self):
+        self.flush()
+        if self._writer is not None:
+            self._writer.close()
+            self._reader.close()
+
+    def __len__(self):
+        return len(self._timestamps) - self._superseded
+
+
+class SQLiteMemoryBackend:
+    """
+    Stores events in a SQLite database for querying history without loading it into Python.
+    The event type, agent id and timestamp are kept in indexed columns next to the JSON payload.
+    The database runs in WAL mode, and appends are buffered and inserted in batches, one
+    transaction per batch. Pending events are written before any read.
+    """
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS events ("
+        "id INTEGER PRIMARY KEY, timestamp TEXT NOT NULL UNIQUE, type TEXT, agent_id TEXT, payload TEXT NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS events_type ON events (type, timestamp)",
+        "CREATE INDEX IF NOT EXISTS events_agent ON events (agent_id, timestamp)",
+    )
+
+    def __init__(self, path: str, batch_size: int = 256):
+        """
+        :param path: The database file.
+        :param batch_size: Number of events buffered before they are inserted in one transaction.
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self._pending = []
+        # Callers serialize access (e.g. AsyncCoreMind's persistence thread), so the connection
+        # may be used from a thread other than the one that opened it
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        with self.connection:
+            for statement in self.SCHEMA:
+                self.connection.execute(statement)
+
+    def append(self, event: dict):
+        agent_id = event.get("agent_id")
+        self._pending.append((
+            event["timestamp"],
+            _event_type(event),
+            str(agent_id) if agent_id is not None else None,
+            json.dumps(event, default=_json_default, separators=(",", ":")),
+        ))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if self._pending:
+            with self.connection:
+                self.connection.executemany(
+                    "INSERT OR REPLACE INTO events (timestamp, type, agent_id, payload) VALUES (?, ?, ?, ?)",
+                    self._pending)
+            self._pending.clear()
+
+    def query(self, start: str = None, end: str = None, event_type: str = None, agent_id=None,
+              fields: dict = None, limit: int = None, newest_first: bool = False):
+        """
+        Yield matching events, streaming rows from the database cursor.
+        :param fields: Equality filters on payload paths, e.g. {"market_trends.bearish": True}.
+        """
+        self.flush()
+        where, parameters = self._where(start, end, event_type, agent_id, fields)
+        sql = "SELECT payload FROM events" + where
+        sql += " ORDER BY timestamp DESC" if newest_first else " ORDER BY timestamp"
+        if limit is not None:
+            sql += " LIMIT ?"
+            parameters.append(limit)
+        for (payload,) in self.connection.execute(sql, parameters):
+            yield json.loads(payload)
+
+    def count(self, start: str = None, end: str = None, event_type: str = None, agent_id=None,
+              fields: dict = None) -> int:
+        """
+        Count matching events inside the database (same filters as query()).
+        """
+        self.flush()
+        where, parameters = self._where(start, end, event_type, agent_id, fields)
+        return self.connection.execute("SELECT COUNT(*) FROM events" + where, parameters).fetchone()[0]
+
+    @staticmethod
+    def _where(start, end, event_type, agent_id, fields) -> tuple:
+        """
+        Build the WHERE clause and its parameters for the query filters.
+        """
+        clauses, parameters = [], []
+        for clause, value in (("timestamp >= ?", start), ("timestamp <= ?", end), ("type = ?", event_type),
+                              ("agent_id = ?", str(agent_id) if agent_id is not None else None)):
+            if value is not None:
+                clauses.append(clause)
+                parameters.append(value)
+        for path, value in (fields or {}).items():
+            clauses.append("json_extract(payload, ?) = ?")
+            parameters.extend((f"$.{path}", value))
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), parameters
+
+    def get(self, timestamp: str):
+        return next(self.query(start=timestamp, end=timestamp), None)
+
+    def range(self, start: str = None, end: str = None):
+        return self.query(start=start, end=end)
+
+    def recent(self, limit: int) -> list:
+        events = list(self.query(limit=limit, newest_first=True))
+        events.reverse()
+        return events
+
+    def reverse(self):
+        return self.query(newest_first=True)
+
+    def close(self):
+        self.flush()
+        self.connection.close()
+
+    def __len__(self):
+        self.flush()
+        return self.connection.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+
+BACKENDS = {"json": JSONMemoryBackend, "log": EventLog, "sqlite": SQLiteMemoryBackend}
+DEFAULT_FILES = {"json": "memory.json", "log": "memory.jsonl", "sqlite": "memory.db"}
 
 
 class Memory:
     """
     A class that stores and manages CoreMind's memory.
     Memory helps CoreMind make decisions based on historical data.
+    Events are kept in an append-only log by default (see EventLog). A queryable SQLite database
+    is available as the "sqlite" backend, and the original single JSON file as the "json" backend.
     """
 
-    def __init__(self, memory_file="memory.json"):
+    def __init__(self, memory_file: str = None, backend: str = "log", full_state_interval: int = 100):
         """
         Initialize the memory system.
-        :param memory_file: The file where the memory is saved. (Defaults to memory.json)
+        :param memory_file: The file where the memory is saved. (Defaults to memory.jsonl, or memory.json for the json backend)
+        :param backend: "log" (append-only, indexed), "sqlite" (queryable database) or
+                        "json" (one JSON document rewritten on every save).
+        :param full_state_interval: save_state() records the whole state once every this many
+                                    saves, and only the changed keys in between.
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown memory backend '{backend}'.")
+        self.memory_file = memory_file or DEFAULT_FILES[backend]
+        self.backend = backend
+        self.store = BACKENDS[backend](self.memory_file)
+        self.full_state_interval = full_state_interval
+        self._state = None  # Cached result of load_state()
+        self._saved = None  # Key -> JSON encoding of the state as last saved by this process
+        self._deltas = 0  # Delta state events since the last full one
+
+    @property
+    def memory_data(self) -> dict:
+        """
+        Every event keyed by timestamp. This reads the whole history; prefer the query methods.
         """
-        self.memory_file = memory_file
-        self.memory_data = self.load_memory()
+        if isinstance(self.store, JSONMemoryBackend):
+            return self.store.data
+        return {event["timestamp"]: event for event in self.store.range()}
 
     def load_memory(self):
         """
-        Load the memory data from the specified memory file.
-        If the file does not exist, create a new empty memory.
+        Load the memory data from the memory file.
         """
-        try:
-            with open(self.memory_file, "r") as file:
-                memory_data = json.load(file)
-            log_info("Memory successfully loaded.")
-            return memory_data
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            log_error(f"Error loading memory: {str(e)}. Creating new memory file.")
-            return {}
+        return self.memory_data
 
     def save_memory(self):
         """
-        Save the current memory to the memory file.
+        Make sure every stored event has reached the memory file.
         """
-        try:
-            with open(self.memory_file, "w") as file:
-                json.dump(self.memory_data, file, indent=4)
-            log_info("Memory successfully saved.")
-        except Exception as e:
-            log_error(f"Error saving memory: {str(e)}")
+        self.store.flush()
 
     def store_event(self, event_data):
         """
@@ -51,9 +514,8 @@ class Memory:
         """
         event_timestamp = datetime.now().isoformat()
         event_data["timestamp"] = event_timestamp
-        self.memory_data[event_timestamp] = event_data
-        self.save_memory()
-        log_info(f"Event stored: {event_timestamp}")
+        self.store.append(event_data)
+        log_hot(logger, "Event stored: %s", event_timestamp)
 
     def get_recent_events(self, limit=10):
         """
@@ -61,8 +523,7 @@ class Memory:
         :param limit: The number of recent events to retrieve. Defaults to 10.
         :return: A list of recent events (dictionaries).
         """
-        recent_events = list(self.memory_data.values())[-limit:]
-        return recent_events
+        return self.store.recent(limit)
 
     def get_event_by_timestamp(self, timestamp):
         """
@@ -70,5 +531,93 @@ class Memory:
         :param timestamp: The timestamp of the event to retrieve.
         :return: The event data, or None if not found.
         """
-        return self.memory_data.get(timestamp, None)
+        return self.store.get(_timestamp_key(timestamp))
+
+    def get_events_between(self, start=None, end=None) -> list:
+        """
+        Retrieve the events stored between two timestamps (inclusive), oldest first.
+        :param start: datetime, epoch seconds or ISO string; open-ended if None.
+        :param end: datetime, epoch seconds or ISO string; open-ended if None.
+        """
+        return list(self.store.range(_timestamp_key(start), _timestamp_key(end)))
+
+    def query(self, start=None, end=None, event_type: str = None, agent_id=None, fields: dict = None,
+              limit: int = None, newest_first: bool = False) -> list:
+        """
+        Retrieve events by time range, type, agent and payload fields, e.g.
+        memory.query(event_type="strategy_decision", fields={"market_trends.bearish": True}) or
+        memory.query(agent_id=agent.agent_id, start=datetime.now() - timedelta(hours=1)).
+        The sqlite backend filters inside the database; the other backends scan the time range.
+        :param fields: Equality filters on (dotted) payload paths.
+        :param limit: Maximum number of events to return.
+        :param newest_first: Return the most recent events first.
+        """
+        start, end = _timestamp_key(start), _timestamp_key(end)
+        if isinstance(self.store, SQLiteMemoryBackend):
+            return list(self.store.query(start, end, event_type, agent_id, fields, limit, newest_first))
+        events = self.store.range(start, end)
+        if newest_first:
+            events = reversed(list(events))
+        matches = []
+        for event in events:
+            if limit is not None and len(matches) >= limit:
+                break
+            if _matches(event, event_type, agent_id, fields):
+                matches.append(event)
+        return matches
+
+    def save_state(self, state: dict):
+        """
+        Record CoreMind's current state as a "state" event. Only the keys whose value changed
+        since the previous save (and the keys removed) are recorded, so the memory grows with
+        what changes rather than with the whole state; every `full_state_interval` saves, and on
+        the first save of a process, the whole state is recorded instead.
+        """
+        encoded = {key: json.dumps(value, default=_json_default, sort_keys=True) for key, value in state.items()}
+        previous = self._saved
+        if previous is None or self._deltas + 1 >= self.full_state_interval:
+            event = {"type": "state", "full": True, "state": dict(state)}
+            self._deltas = 0
+        else:
+            changed = {key: state[key] for key, value in encoded.items() if previous.get(key) != value}
+            removed = [key for key in previous if key not in encoded]
+            if not changed and not removed:
+                return
+            event = {"type": "state", "full": False, "state": changed, "removed": removed}
+            self._deltas += 1
+        self._saved = encoded
+        self._state = dict(state)
+        self.store_event(event)
+
+    def load_state(self) -> dict:
+        """
+        Return the most recently saved CoreMind state, or an empty dict: the last full state
+        event with the deltas recorded after it applied on top.
+        """
+        if self._state is None:
+            events = []
+            for event in self.store.reverse():
+                if event.get("type") == "state":
+                    events.append(event)
+                    if event.get("full", True):  # State events without the flag hold the whole state
+                        break
+            state = {}
+            for event in reversed(events):
+                state.update(event["state"])
+                for key in event.get("removed", ()):
+                    state.pop(key, None)
+            self._state = state
+        return dict(self._state)
+
+    def compact(self, before=None):
+        """
+        Compact the memory log, optionally dropping events older than `before`.
+        """
+        if isinstance(self.store, EventLog):
+            self.store.compact(_timestamp_key(before))
+
+    def close(self):
+        self.store.close()
 
+    def __len__(self):
+        return len(self.store)
@@ -0,0 +1,221 @@
+# NyXX/encephalon/rules.py
+
+import json
+import os
+import numpy as np
+from utils.loggings import log_info, log_error
+
+# Comparison operators a condition may use, in op-code order
+OPERATORS = ("==", "!=", "<", "<=", ">", ">=")
+
+# The strategy's original heuristic: bullish markets win over bearish ones
+DEFAULT_RULES = {
+    "default": {"action": "maintain", "resource_allocation": "medium"},
+    "rules": [
+        {"name": "bullish", "priority": 2, "when": {"market_trends.bullish": True},
+         "then": {"action": "expand", "resource_allocation": "high"}},
+        {"name": "bearish", "priority": 1, "when": {"market_trends.bearish": True},
+         "then": {"action": "contract", "resource_allocation": "low"}},
+    ],
+}
+
+
+def _lookup(state, path: str):
+    """
+    Value of a dotted feature path in a nested state dict, or None if any part is missing.
+    """
+    value = state
+    for part in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def _validate_rule(rule, rule_number: int):
+    """
+    Raise ValueError unless `rule` is a rule object whose conditions compare against numbers,
+    booleans or strings.
+    """
+    if not isinstance(rule, dict):
+        raise ValueError(f"Rule {rule_number} is not an object.")
+    name = rule.get("name", rule_number)
+    if not isinstance(rule.get("then"), dict):
+        raise ValueError(f"Rule {name} has no 'then' decision.")
+    if not isinstance(rule.get("when", {}), dict):
+        raise ValueError(f"Rule {name}: 'when' must map features to conditions.")
+    if isinstance(rule.get("priority", 0), bool) or not isinstance(rule.get("priority", 0), (int, float)):
+        raise ValueError(f"Rule {name}: 'priority' must be a number.")
+    for feature, test in rule.get("when", {}).items():
+        for value in (test.values() if isinstance(test, dict) else [test]):
+            if not isinstance(value, (bool, int, float, str)):
+                raise ValueError(f"Rule {name}: condition on {feature!r} must compare with a number, "
+                                 f"boolean or string, not {value!r}.")
+
+
+class RuleEngine:
+    """
+    Declarative decision rules compiled into NumPy condition tables.
+    A rule set is a dict (or JSON file) of the form
+        {"default": {...decision...},
+         "rules": [{"name": ..., "priority": 1, "when": {"market_trends.bullish": true,
+                                                        "risk": {">": 0.5, "<=": 0.9}},
+                    "then": {...decision...}}, ...]}
+    Conditions compare dotted state features with ==, !=, <, <=, >, >= (a bare value means ==);
+    strings are compared by equality only. Every condition of every rule is evaluated in one
+    vectorized pass over the feature vector, and the matching rule with the highest priority
+    (earliest listed on ties) decides; if none matches, the default decision is returned.
+    A rule set loaded from a file is reloaded when the file changes.
+    """
+
+    def __init__(self, rules: dict = None, path: str = None):
+        """
+        :param rules: Rule set to compile; defaults to DEFAULT_RULES unless `path` is given.
+        :param path: JSON rule set file, watched for changes.
+        """
+        self.path = path
+        self._mtime = None
+        self.version = 0  # Incremented on every (re)compile
+        if path is not None:
+            self.reload(force=True)
+        else:
+            self.compile(rules if rules is not None else DEFAULT_RULES)
+
+    def compile(self, rule_set: dict):
+        """
+        Compile a rule set into condition tables. Raises ValueError for a malformed rule set
+        (wrong types included), leaving the current tables in place.
+        """
+        if not isinstance(rule_set, dict):
+            raise ValueError("A rule set must be a JSON object.")
+        if not isinstance(rule_set.get("rules", []), list):
+            raise ValueError("'rules' must be a list.")
+        if not isinstance(rule_set.get("default", {}), dict):
+            raise ValueError("'default' must be a decision object.")
+        for rule_number, rule in enumerate(rule_set.get("rules", [])):
+            _validate_rule(rule, rule_number)
+        rules = sorted(enumerate(rule_set.get("rules", [])),
+                       key=lambda item: (-item[1].get("priority", 0), item[0]))
+        features, vocabularies = [], []
+        feature_index = {}
+        cond_rule, cond_feature, cond_op, cond_value = [], [], [], []
+        names, decisions, sizes = [], [], []
+        for rule_number, (_, rule) in enumerate(rules):
+            conditions = 0
+            for feature, test in rule.get("when", {}).items():
+                if feature not in feature_index:
+                    feature_index[feature] = len(features)
+                    features.append(feature)
+                    vocabularies.append({})
+                index = feature_index[feature]
+                for op, value in (test.items() if isinstance(test, dict) else [("==", test)]):
+                    if op not in OPERATORS:
+                        raise ValueError(f"Unknown operator {op!r} in rule {rule.get('name', rule_number)}.")
+                    if isinstance(value, str):
+                        if op not in ("==", "!="):
+                            raise ValueError(f"Strings only support == and != (rule {rule.get('name', rule_number)}).")
+                        value = vocabularies[index].setdefault(value, len(vocabularies[index]))
+                    cond_rule.append(rule_number)
+                    cond_feature.append(index)
+                    cond_op.append(OPERATORS.index(op))
+                    cond_value.append(float(value))
+                    conditions += 1
+            names.append(rule.get("name", str(rule_number)))
+            decisions.append(dict(rule["then"]))
+            sizes.append(conditions)
+
+        self.features = features
+        self._vocabularies = vocabularies
+        self._cond_rule = np.asarray(cond_rule, dtype=np.intp)
+        self._cond_feature = np.asarray(cond_feature, dtype=np.intp)
+        self._cond_op = np.asarray(cond_op, dtype=np.int8)
+        self._cond_value = np.asarray(cond_value, dtype=float)
+        self._sizes = np.asarray(sizes, dtype=float)
+        self.names = names
+        self.decisions = decisions
+        self.default = dict(rule_set.get("default", {}))
+        self.version += 1
+        log_info("Compiled %d decision rules over %d features.", len(decisions), len(features))
+
+    def reload(self, force: bool = False) -> bool:
+        """
+        Recompile the rule set file if it changed since it was last loaded.
+        A file that fails to load or compile is logged and the current rules are kept.
+        :return: True if the rules were reloaded.
+        """
+        if self.path is None:
+            return False
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+            if not force and mtime == self._mtime:
+                return False
+            with open(self.path, "r") as f:
+                self.compile(json.load(f))
+            self._mtime = mtime
+            log_info("Loaded decision rules from %s (version %d).", self.path, self.version)
+            return True
+        except (OSError, ValueError, TypeError, AttributeError, KeyError) as e:
+            if force and self.version == 0:
+                raise
+            log_error(f"Failed to reload decision rules from {self.path}: {str(e)}")
+            return False
+
+    def feature_vector(self, state: dict) -> np.ndarray:
+        """
+        The state's values for every rule feature: numbers and booleans as floats, strings as
+        their vocabulary code (-1 when no rule mentions them), and NaN when missing.
+        """
+        vector = np.full(len(self.features), np.nan)
+        for index, feature in enumerate(self.features):
+            value = _lookup(state, feature)
+            if value is None:
+                continue
+            if isinstance(value, str):
+                vector[index] = self._vocabularies[index].get(value, -1)
+            else:
+                try:
+                    vector[index] = float(value)
+                except (TypeError, ValueError):
+                    pass
+        return vector
+
+    def fingerprint(self, state: dict, refresh: bool = True) -> tuple:
+        """
+        Hashable key of everything the rules read from `state` (and the rule set version).
+        :param refresh: Reload a changed rule set file first; callers that just reloaded pass False.
+        """
+        if refresh and self.path is not None:
+            self.reload()
+        # NaN never equals itself, so missing features are keyed as None
+        return (self.version,) + tuple(None if value != value else value
+                                       for value in self.feature_vector(state).tolist())
+
+    def match(self, state: dict) -> np.ndarray:
+        """
+        :return: Boolean array of the rules (in priority order) whose conditions all hold.
+        """
+        x = self.feature_vector(state)[self._cond_feature]
+        threshold = self._cond_value
+        op = self._cond_op
+        # NaN features fail every test, including !=
+        passed = np.select([op == 0, op == 1, op == 2, op == 3, op == 4, op == 5],
+                           [x == threshold, (x != threshold) & ~np.isnan(x), x < threshold,
+                            x <= threshold, x > threshold, x >= threshold])
+        satisfied = np.bincount(self._cond_rule, weights=passed, minlength=len(self.decisions))
+        return satisfied == self._sizes
+
+    def decide(self, state: dict, refresh: bool = True) -> dict:
+        """
+        The decision of the highest-priority matching rule, or the default decision.
+        :param refresh: Reload a changed rule set file first; callers that just reloaded pass False.
+        """
+        if refresh and self.path is not None:
+            self.reload()
+        if not self.decisions:
+            return dict(self.default)
+        matched = self.match(state)
+        rule = int(np.argmax(matched))
+        return dict(self.decisions[rule]) if matched[rule] else dict(self.default)
+
+    def __len__(self):
+        return len(self.decisions)
@@ -1,6 +1,47 @@
 # NyXX/encephalon/strategy.py
 
+from collections import OrderedDict, deque
+import numpy as np
+from encephalon.rules import RuleEngine
 from utils.loggings import log_info, log_error
+from utils.telemetry import get_event_sink
+
+
+class DecisionHistory:
+    """
+    Bounded, run-length encoded record of strategic decisions.
+    Consecutive identical decisions are stored once with a repeat count, so a strategy that
+    keeps deciding the same thing costs one comparison and one increment per decision.
+    Only the most recent `max_runs` runs are kept.
+    """
+
+    def __init__(self, max_runs: int = 1000):
+        self.runs = deque(maxlen=max_runs)  # [decision, count], oldest first
+        self.total = 0  # Decisions currently held
+
+    def append(self, decision):
+        runs = self.runs
+        if runs and (runs[-1][0] is decision or runs[-1][0] == decision):
+            runs[-1][1] += 1
+        else:
+            if len(runs) == runs.maxlen:
+                self.total -= runs[0][1]
+            runs.append([decision, 1])
+        self.total += 1
+
+    def last(self):
+        return self.runs[-1][0] if self.runs else None
+
+    def __len__(self):
+        return self.total
+
+    def __iter__(self):
+        for decision, count in self.runs:
+            for _ in range(count):
+                yield decision
+
+    def __repr__(self):
+        return f"DecisionHistory(decisions={self.total}, runs={len(self.runs)})"
 
 
 class Strategy:
@@ -8,11 +49,26 @@ class Strategy:
     High-level strategy formulation.
     The strategy module determines what the CoreMind will decide
     based on the current global state of the civilization.
+    Decisions come from a RuleEngine and are cached by a fingerprint of the state features its
+    rules read, so pulses that leave those features unchanged reuse the previous decision.
     """
 
-    def __init__(self):
+    def __init__(self, cache_size: int = 128, history_size: int = 1000, rules: dict = None,
+                 rules_file: str = None):
+        """
+        :param cache_size: Decisions kept in the LRU cache (0 disables caching).
+        :param history_size: Runs of identical decisions kept in the strategy history.
+        :param rules: Rule set dict (see RuleEngine); defaults to the built-in DEFAULT_RULES.
+        :param rules_file: JSON rule set file (e.g. config/strategy_rules.json), hot-reloaded on change.
+        """
         self.current_strategies = []
-        self.strategy_history = []
+        self.rules = RuleEngine(rules, path=rules_file)
+        self.strategy_history = DecisionHistory(history_size)
+        self.cache_size = cache_size
+        self._cache = OrderedDict()  # fingerprint -> decision, least recently used first
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.performance = {}  # Summary of the last performance adjustment
 
     def initialize(self):
         """
@@ -28,31 +84,99 @@ class Strategy:
         """
         try:
             log_info("Evaluating strategies based on current state...")
-            decision = self._generate_decision(current_state)
-            self.strategy_history.append(decision)
-            log_info(f"New strategic decision made: {decision}")
+            self.rules.reload()  # Once per decision; the fingerprint and the rules below don't check again
+            cached = self._cached_decision(current_state)
+            self.strategy_history.append(cached)
+            decision = dict(cached)  # Callers may change their copy without touching the cache
+            log_info("New strategic decision made: %s", decision)
+            sink = get_event_sink()
+            if sink is not None:
+                sink.emit("strategy_decision", action=decision.get("action"),
+                          resource_allocation=decision.get("resource_allocation"), decision=decision)
             return decision
         except Exception as e:
             log_error(f"Strategy decision-making error: {str(e)}")
             return {}
 
+    def _cached_decision(self, current_state) -> dict:
+        """
+        The decision for `current_state`, from the cache when its fingerprint was seen recently.
+        """
+        if not self.cache_size:
+            return self._generate_decision(current_state)
+        key = self._fingerprint(current_state)
+        cache = self._cache
+        decision = cache.get(key)
+        if decision is not None:
+            cache.move_to_end(key)
+            self.cache_hits += 1
+            return decision
+        self.cache_misses += 1
+        decision = cache[key] = self._generate_decision(current_state)
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+        return decision
+
+    def _fingerprint(self, current_state) -> tuple:
+        """
+        Hashable key of the state features the decision rules read (and the rule set version).
+        """
+        return self.rules.fingerprint(current_state, refresh=False)
+
+    def load_rules(self, rules: dict = None, rules_file: str = None):
+        """
+        Replace the decision rules without restarting, from a rule set dict or a watched JSON file.
+        """
+        self.rules = RuleEngine(rules, path=rules_file)
+        self.clear_cache()
+
+    def clear_cache(self):
+        self._cache.clear()
+
+    def cache_info(self) -> dict:
+        return {"hits": self.cache_hits, "misses": self.cache_misses,
+                "size": len(self._cache), "max_size": self.cache_size}
+
     def _generate_decision(self, current_state):
         """
-        Internal function to generate a decision based on state.
-        This could be a complex model or simple heuristic logic.
+        Internal function to generate a decision based on state: the highest-priority
+        decision rule matching the state, evaluated vectorized by the rule engine.
         """
-        # Placeholder for strategy generation algorithm
-        # For now, a simple heuristic example
-        if current_state.get("market_trends", {}).get("bullish", False):
-            return {"action": "expand", "resource_allocation": "high"}
-        elif current_state.get("market_trends", {}).get("bearish", False):
-            return {"action": "contract", "resource_allocation": "low"}
-        else:
-            return {"action": "maintain", "resource_allocation": "medium"}
+        return self.rules.decide(current_state, refresh=False)
+
+    def adjust_based_on_performance(self, scores, agent_ids=None) -> dict:
+        """
+        Adjust to a whole round of agent performance scores at once.
+        :param scores: Score array (NaN for agents that could not be evaluated), or a dict of
+                       agent id -> score.
+        :param agent_ids: Ids aligned with `scores`, used to name the underperformers.
+        :return: The performance summary, also kept in `self.performance`.
+        """
+        if isinstance(scores, dict):
+            agent_ids = list(scores)
+            scores = list(scores.values())
+        scores = np.asarray(scores, dtype=float)
+        valid = ~np.isnan(scores)
+        summary = {"evaluated": int(valid.sum()), "failed": int(scores.size - valid.sum()), "underperformers": []}
+        if summary["evaluated"]:
+            values = scores[valid]
+            mean, std = float(values.mean()), float(values.std())
+            summary.update(mean=mean, std=std, min=float(values.min()), max=float(values.max()),
+                           median=float(np.median(values)))
+            # Agents more than one standard deviation below the mean
+            if agent_ids is not None and std > 0:
+                below = np.flatnonzero(valid & (scores < mean - std))
+                summary["underperformers"] = [agent_ids[i] for i in below.tolist()]
+        self.performance = summary
+        log_info("Strategy adjusted to performance of %d agents (%d failed).", summary["evaluated"], summary["failed"])
+        sink = get_event_sink()
+        if sink is not None:
+            sink.emit("strategy_performance", **summary)
+        return summary
 
     def history(self):
         """
-        Return the historical strategy decisions made by the system.
+        Return the historical strategy decisions made by the system (the most recent runs only).
         """
-        return self.strategy_history
+        return list(self.strategy_history)
 
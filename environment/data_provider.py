@@ -1,4 +1,4 @@
-import random
+import numpy as np
 
 class BasicDataSource:
     """
@@ -6,7 +6,11 @@ class BasicDataSource:
     This will simulate basic learning opportunities within the environment.
     """
 
-    def __init__(self):
+    def __init__(self, rng=None):
+        """
+        :param rng: NumPy Generator used to pick facts (e.g. a stream from utils.rng.RNGRegistry).
+        """
+        self.rng = rng if rng is not None else np.random.default_rng()
         self.data = [
             "fact1: The sky is blue.",
             "fact2: Water is wet.",
@@ -24,4 +28,11 @@ class BasicDataSource:
         """
         Return a random fact from the data source for the citizens to learn.
         """
-        return random.choice(self.data)
+        return self.data[self.rng.integers(len(self.data))]
+
+    def get_random_facts(self, count: int) -> list:
+        """
+        Return `count` random facts in one call, so a whole tick's worth of learning
+        can be drawn in bulk instead of one call per citizen.
+        """
+        return [self.data[index] for index in self.rng.integers(0, len(self.data), size=count)]
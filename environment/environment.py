@@ -1,8 +1,13 @@
-import random
-from typing import List
 from utils.loggings import log_info, log_error
-from organisms.citizen import Citizen
+from utils.rng import RNGRegistry
+from organisms.citizen import BaseCitizen, Citizen
+from organisms.evolution import EvolutionPipeline
 from environment.data_provider import BasicDataSource  # Import the basic data source class
+from environment.market import Market
+from environment.registry import OrganismRegistry
+from environment.scheduler import TickScheduler
+from environment.sharding import ShardedRunner
+from environment.snapshot import write_snapshot, restore_snapshot
 
 class Environment:
     """
@@ -10,15 +15,27 @@ class Environment:
     This is the central simulation space where citizens learn, grow, and evolve into agents.
     """
 
-    def __init__(self, name: str = "NyXX-World"):
+    def __init__(self, name: str = "NyXX-World", seed=None):
+        """
+        :param seed: Root seed for every random stream in the world (see utils.rng.RNGRegistry).
+        """
         self.name = name
-        self.organisms: List[Citizen] = []  # All citizens, including agents
+        self.rng = RNGRegistry(seed)  # Independent random streams per subsystem, from one root seed
+        self.organisms = OrganismRegistry(on_change=self._on_organism_change)  # All citizens, including agents, indexed by id, status and role
+        self.scheduler = TickScheduler()  # Wake-up queue: only organisms due on a tick are stepped
         self.markets = {}  # Market simulations
         self.external_data_sources = []  # APIs, files, generated data
         self.scenarios = []  # Optional global scenarios
+        self.population = None  # Optional vectorized population (see environment.population)
+        self.evolution_pipeline = None  # Optional batch evolution into agents (see organisms.evolution)
+
+        # Changes since the last snapshot, for incremental snapshots
+        self._last_snapshot = None
+        self._digests = {}  # Organism -> fingerprint of its state at the last snapshot
+        self._removed = set()  # Citizen ids of removed organisms
 
         # Create a basic data source for initial learning
-        self.basic_data_source = BasicDataSource()
+        self.basic_data_source = BasicDataSource(rng=self.rng.stream("data_source"))
 
         log_info(f"[{self.name}] Environment initialized.")
 
@@ -26,28 +43,145 @@ class Environment:
         """
         Add a new citizen (or agent) into the world.
         """
-        if isinstance(citizen, Citizen):
-            self.organisms.append(citizen)
-            log_info(f"Citizen {citizen.name} (ID: {citizen.citizen_id}) entered {self.name}.")
+        if isinstance(citizen, BaseCitizen):
+            self.organisms.add(citizen)
+            self.scheduler.wake(citizen)
+            log_info("Citizen %s entered %s.", citizen.name, self.name)
         else:
             log_error("Only citizens (including agents) can be added to the environment.")
 
+    def add_agent(self, agent):
+        """
+        Add an evolved agent into the world.
+        """
+        self.add_organism(agent)
+
+    def remove_organism(self, organism_or_id):
+        """
+        Remove a citizen or agent from the world, given the organism or its id.
+        """
+        try:
+            organism = self.organisms.remove(organism_or_id)
+        except KeyError:
+            log_error(f"No organism {organism_or_id} in {self.name}.")
+            return None
+        self.scheduler.cancel(organism)
+        self._digests.pop(organism, None)
+        self._removed.add(organism.citizen_id)
+        log_info("Citizen %s left %s.", organism.name, self.name)
+        return organism
+
+    def get_organism(self, organism_id: str):
+        """
+        Look up a citizen by its citizen id, or an agent by its agent id.
+        """
+        return self.organisms.get(organism_id)
+
+    @property
+    def agents(self) -> list:
+        """
+        All agents living in the world.
+        """
+        return self.organisms.agents
+
+    def enable_evolution_pipeline(self, role_classes: dict = None, roles: list = None) -> EvolutionPipeline:
+        """
+        Evolve ready citizens in one batch per tick, turning them into the agent class of their role.
+        :param role_classes: Optional role -> Agent subclass mapping (see organisms.evolution.ROLE_CLASSES).
+        :param roles: Optional roles to draw from; defaults to the citizen ROLES.
+        """
+        self.evolution_pipeline = EvolutionPipeline(role_classes, roles=roles, rng=self.rng.stream("evolution"))
+        log_info(f"Batch evolution enabled in {self.name}.")
+        return self.evolution_pipeline
+
+    def attach_population(self, population):
+        """
+        Attach a vectorized Population to the world.
+        The population is advanced in bulk on every step, alongside the individual organisms.
+        """
+        self.population = population
+        log_info(f"Population of {len(population)} citizens attached to {self.name}.")
+
+    @property
+    def tick(self) -> int:
+        """
+        The number of ticks simulated so far.
+        """
+        return self.scheduler.tick
+
+    def wake(self, organism):
+        """
+        Make a dormant organism due on the next step, e.g. after re-enabling its learning.
+        """
+        self.scheduler.wake(organism)
+
+    def _on_organism_change(self, organism, attribute, old, new):
+        # A status change may give a dormant organism something to do again
+        if attribute == "status" and not self._is_dormant(organism):
+            self.scheduler.wake(organism)
+
+    @staticmethod
+    def _is_dormant(organism) -> bool:
+        """
+        A stock citizen that can no longer learn and is not ready to evolve does nothing on a
+        tick but log, so it sleeps until its status changes. Organisms with their own learn/act
+        stay scheduled on every tick.
+        """
+        return (type(organism).learn is BaseCitizen.learn and type(organism).act is BaseCitizen.act
+                and not organism.learning_enabled and organism.status != "ready to evolve")
+
     def step(self):
         """
         Advance the simulation one tick.
-        Each organism learns or acts depending on its current state.
+        Only organisms due on this tick learn or act, depending on their current state;
+        dormant citizens are skipped until something wakes them.
         Citizens learn from the environment in this step.
         """
-        for organism in self.organisms:
-            if hasattr(organism, "learn"):
-                organism.learn(self)  # Pass the environment to the citizen for learning
-            if hasattr(organism, "act"):
+        if self.population is not None:
+            self.population.step()
+        due = self.scheduler.pop_due()
+
+        # Citizens using the stock learning behaviour receive their facts in one bulk draw
+        learners = []
+        for organism in due:
+            if isinstance(organism, BaseCitizen) and type(organism).learn is BaseCitizen.learn:
+                if organism.learning_enabled:
+                    learners.append(organism)
+            elif hasattr(organism, "learn"):
+                organism.learn(self)  # Pass the environment to the organism for learning
+        for organism, fact in zip(learners, self.get_random_facts(len(learners))):
+            organism.learn_many((fact,))
+
+        if self.evolution_pipeline is not None:
+            self.evolution_pipeline.run_environment(self)
+
+        evolution_rng = self.rng.stream("evolution")
+        for organism in due:
+            if isinstance(organism, BaseCitizen) and type(organism).act is BaseCitizen.act:
+                organism.act(evolution_rng)
+            elif hasattr(organism, "act"):
                 organism.act()
 
-    def add_market(self, market_name, market_data):
+        next_tick = self.scheduler.tick + 1
+        for organism in due:
+            if organism._registry is not self.organisms or self._is_dormant(organism):
+                self.scheduler.cancel(organism)  # Drop wake-ups queued while it was still busy this tick
+            else:
+                self.scheduler.schedule(organism, next_tick)
+        self.scheduler.advance()
+
+    def add_market(self, market_name, market_data=None, **market_params):
         """
         Add a market into the world for agents to interact with.
+        Markets draw from the world's "market.<name>" random stream: a market is built on it when
+        none is given, and a Market built without rng= is reseeded with it, so seeded worlds
+        reproduce every market's prices.
+        :param market_params: Market arguments used when `market_data` is None.
         """
+        if market_data is None:
+            market_data = Market(rng=self.rng.stream(f"market.{market_name}"), **market_params)
+        elif isinstance(market_data, Market) and not market_data.seeded:
+            market_data.reseed(self.rng.stream(f"market.{market_name}"))
         self.markets[market_name] = market_data
         log_info(f"Market '{market_name}' added to {self.name}.")
 
@@ -57,12 +191,25 @@ class Environment:
         """
         return self.markets.get(market_name, None)
 
+    def get_market_data(self, market_name, ticks: int = None):
+        """
+        Recent prices of a market's assets for agents to analyse: read-only views of the
+        market's tick store that also carry its precomputed rolling statistics.
+        :param ticks: Number of recent ticks (defaults to the market's rolling statistics window).
+        :return: Asset name -> prices, or an empty dict for an unknown market.
+        """
+        market = self.markets.get(market_name)
+        if market is None:
+            log_error(f"Market '{market_name}' not found in {self.name}.")
+            return {}
+        return market.get_market_data(ticks)
+
     def simulate_event(self):
         """
         Simulate a scenario, like a data shift or market change.
         """
         if self.scenarios:
-            scenario = random.choice(self.scenarios)
+            scenario = self.scenarios[self.rng.stream("scenarios").integers(len(self.scenarios))]
             scenario_name, data = scenario
             log_info(f"Simulating scenario: {scenario_name}")
             return scenario_name, data
@@ -78,17 +225,44 @@ class Environment:
         self.external_data_sources.append(source)
         log_info("External data source added to environment.")
 
-    def run(self, steps: int = 1):
+    def run(self, steps: int = 1, shards: int = None, seed=None):
         """
         Run the simulation for a number of steps.
+        :param shards: If greater than one, step the citizens in parallel across this many processes.
+        :param seed: Root seed for a sharded run; defaults to the world's RNG registry.
+                     Results are reproducible for a seed and shard count.
         """
+        if shards and shards > 1:
+            history = ShardedRunner(shards, seed=seed).run(self, steps)
+            self.scheduler.advance(steps)
+            return history
+
         log_info(f"Starting simulation in {self.name} for {steps} steps.")
         for _ in range(steps):
             self.step()
         log_info(f"Simulation completed.")
 
-    def get_random_facts(self):
+    def get_random_facts(self, count: int = None):
         """
         Retrieve a random fact from the basic data source.
+        :param count: If given, return a list of `count` facts drawn in one call.
+        """
+        if count is None:
+            return self.basic_data_source.get_random_fact()
+        return self.basic_data_source.get_random_facts(count)
+
+    def snapshot(self, path: str, incremental: bool = False) -> str:
+        """
+        Checkpoint the world (organisms, population, markets, scenarios and RNG state) to a
+        directory of compressed columnar files (see environment.snapshot).
+        :param incremental: Only write the organisms that changed since the last snapshot.
+        :return: The absolute path of the snapshot.
+        """
+        return write_snapshot(self, path, incremental=incremental)
+
+    @classmethod
+    def restore(cls, path: str) -> "Environment":
+        """
+        Resume a world from a snapshot written by snapshot().
         """
-        return self.basic_data_source.get_random_fact()
+        return restore_snapshot(cls, path)
@@ -1,37 +1,126 @@
 # NyXX/encephalon/environment/market.py
 
-import random
+import numpy as np
 from datetime import datetime
-from NyXX.utils.logging import log_info, log_error
+from environment.order_book import MatchingEngine
+from environment.tick_store import TickStore
+from utils.loggings import log_info, log_error, log_hot, get_logger
+
+logger = get_logger(__name__)
+
+# Price models understood by apply_price_model()
+MODELS = ("uniform", "gbm", "jump")
+
+# Default parameters of the price models (annualized drift and volatility, dt in years)
+MODEL_DEFAULTS = {
+    "dt": 1 / 252,
+    "drift": 0.05,
+    "volatility": 0.2,
+    "jump_intensity": 0.1,  # Expected jumps per unit of time
+    "jump_mean": -0.02,  # Mean log jump size
+    "jump_std": 0.05,  # Standard deviation of the log jump size
+}
+
+
+def apply_price_model(prices: np.ndarray, rng, model: str = "uniform", dt: float = MODEL_DEFAULTS["dt"],
+                      drift=MODEL_DEFAULTS["drift"], volatility=MODEL_DEFAULTS["volatility"],
+                      jump_intensity: float = MODEL_DEFAULTS["jump_intensity"],
+                      jump_mean: float = MODEL_DEFAULTS["jump_mean"],
+                      jump_std: float = MODEL_DEFAULTS["jump_std"]):
+    """
+    Move every price in `prices` (any shape) one step in place.
+    - "uniform": the original fluctuation, a uniform change between -5% and +5%.
+    - "gbm": geometric Brownian motion with the given drift and volatility (scalars or arrays
+      broadcastable to `prices`).
+    - "jump": Merton jump-diffusion, GBM plus Poisson-arriving log-normal jumps.
+    """
+    if model == "uniform":
+        prices *= 1 + rng.uniform(-0.05, 0.05, size=prices.shape)
+        return prices
+    if model not in MODELS:
+        raise ValueError(f"Unknown price model: {model}")
+    log_returns = rng.standard_normal(prices.shape)
+    log_returns *= volatility * np.sqrt(dt)
+    log_returns += (np.asarray(drift) - 0.5 * np.square(volatility)) * dt
+    if model == "jump":
+        jumps = rng.poisson(jump_intensity * dt, size=prices.shape)
+        jumped = np.flatnonzero(jumps)
+        if jumped.size:
+            counts = jumps.ravel()[jumped]
+            log_returns.ravel()[jumped] += counts * jump_mean + np.sqrt(counts) * jump_std * rng.standard_normal(jumped.size)
+    prices *= np.exp(log_returns, out=log_returns)
+    return prices
+
 
 class Market:
     """
     The Market class simulates a financial market in which trading agents can buy and sell assets.
     The market has fluctuating prices, supply/demand dynamics, and random events that affect asset prices.
+    Prices, traded volumes and recent price history are NumPy arrays indexed by asset, so price
+    models and events move every asset in one vectorized step; `assets` still reads as a
+    name -> price dict.
     """
 
-    def __init__(self, market_type="stock"):
+    def __init__(self, market_type="stock", rng=None, assets=None, model: str = "uniform",
+                 history_size: int = 256, stats_window: int = 64, **model_params):
         """
         Initialize the market.
         :param market_type: Type of the market (e.g., 'stock', 'real_estate', 'commodity').
+        :param rng: NumPy Generator for prices and events (e.g. environment.rng.stream("market")).
+        :param assets: Asset name -> initial price, or a number of generated assets; defaults to
+                       the five standard assets at random prices.
+        :param model: Price model used by simulate_market_fluctuations() (see MODELS).
+        :param history_size: Number of past price vectors kept in the tick store (0 for none).
+        :param stats_window: Ticks covered by the tick store's rolling statistics.
+        :param model_params: Overrides of MODEL_DEFAULTS.
         """
         self.market_type = market_type
-        self.assets = self._initialize_assets()
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.seeded = rng is not None  # False while prices are drawn from an unseeded generator
+        if model not in MODELS:
+            raise ValueError(f"Unknown price model: {model}")
+        self.model = model
+        self.model_params = {**MODEL_DEFAULTS, **model_params}
+        names, prices = self._initialize_assets(assets)
+        self._bind(names, prices, np.zeros(len(names)), history_size, stats_window)
+        self._drawn_assets = not isinstance(assets, dict)  # Initial prices were drawn from the rng
+        self._asset_count = assets
 
-    def _initialize_assets(self):
+    def _initialize_assets(self, assets=None):
         """
         Initialize the assets in the market. For a stock market, this could be a set of stocks or commodities.
-        :return: A dictionary of assets with initial prices.
+        :return: The asset names and their initial prices.
         """
         log_info(f"Initializing assets for {self.market_type} market.")
-        assets = {
-            "Stock A": random.uniform(50, 100),
-            "Stock B": random.uniform(30, 80),
-            "Stock C": random.uniform(20, 60),
-            "Commodity X": random.uniform(100, 200),
-            "Commodity Y": random.uniform(5, 20)
-        }
-        return assets
+        if isinstance(assets, dict):
+            return list(assets), np.array(list(assets.values()), dtype=float)
+        if assets is not None:
+            names = [f"Asset {i}" for i in range(assets)]
+            return names, self.rng.uniform(5, 200, size=assets)
+        names = ["Stock A", "Stock B", "Stock C", "Commodity X", "Commodity Y"]
+        low = np.array([50, 30, 20, 100, 5])
+        high = np.array([100, 80, 60, 200, 20])
+        return names, self.rng.uniform(low, high)
+
+    def _bind(self, names: list, prices: np.ndarray, volumes: np.ndarray, history_size: int,
+              stats_window: int = 64):
+        """
+        Attach the market to its asset arrays (which may be rows of a MarketEngine).
+        """
+        self.names = names
+        self.index = {name: i for i, name in enumerate(names)}
+        self.prices = prices
+        self.volumes = volumes  # Units bought and sold per asset
+        # Price history with rolling statistics, recorded every fluctuation step
+        self.ticks = TickStore(names, history_size, min(stats_window, history_size)) if history_size else None
+        self.order_book = None  # MatchingEngine, opened by enable_order_book()
+
+    @property
+    def assets(self) -> dict:
+        """
+        Asset name -> current price.
+        """
+        return dict(zip(self.names, self.prices.tolist()))
 
     def get_asset_price(self, asset_name):
         """
@@ -39,11 +128,11 @@ class Market:
         :param asset_name: Name of the asset (e.g., 'Stock A', 'Commodity X').
         :return: The current price of the asset.
         """
-        price = self.assets.get(asset_name)
-        if price is None:
+        index = self.index.get(asset_name)
+        if index is None:
             log_error(f"Asset {asset_name} not found in market.")
             return None
-        return price
+        return float(self.prices[index])
 
     def buy_asset(self, asset_name, quantity):
         """
@@ -56,7 +145,8 @@ class Market:
         if price is None:
             return None
         total_cost = price * quantity
-        log_info(f"Bought {quantity} units of {asset_name} at {price} each. Total cost: {total_cost}")
+        self.volumes[self.index[asset_name]] += quantity
+        log_hot(logger, "Bought %s units of %s at %s each. Total cost: %s", quantity, asset_name, price, total_cost)
         return total_cost
 
     def sell_asset(self, asset_name, quantity):
@@ -70,28 +160,96 @@ class Market:
         if price is None:
             return None
         total_earnings = price * quantity
-        log_info(f"Sold {quantity} units of {asset_name} at {price} each. Total earnings: {total_earnings}")
+        self.volumes[self.index[asset_name]] += quantity
+        log_hot(logger, "Sold %s units of %s at %s each. Total earnings: %s", quantity, asset_name, price, total_earnings)
         return total_earnings
 
+    def enable_order_book(self, trade_system=None) -> MatchingEngine:
+        """
+        Open a limit order book per asset. Fills are recorded with `trade_system` (if given)
+        and move the asset's price to the last traded price.
+        """
+        if self.order_book is None:
+            self.order_book = MatchingEngine(self.names, trade_system)
+        elif trade_system is not None:
+            self.order_book.trade_system = trade_system
+        return self.order_book
+
+    def submit_orders(self, orders) -> list:
+        """
+        Match a tick's batch of limit orders, given as (owner, asset, side, price, quantity)
+        tuples (price None for a market order), against the market's order books.
+        :return: The fills.
+        """
+        engine = self.enable_order_book()
+        accepted = []
+        for order in orders:
+            if order[1] in self.index:
+                accepted.append(order)
+            else:
+                log_error(f"Asset {order[1]} not found in market.")
+        fills = engine.submit_batch(accepted)
+        for fill in fills:
+            index = self.index[fill.asset]
+            self.prices[index] = fill.price
+            self.volumes[index] += fill.quantity
+        return fills
+
+    def record_tick(self):
+        """
+        Append the current prices to the tick store.
+        """
+        if self.ticks is not None:
+            self.ticks.append(self.prices)
+
+    def get_price_history(self, asset_name=None) -> np.ndarray:
+        """
+        Recorded prices, oldest first (at most history_size ticks), as a read-only view.
+        :param asset_name: Restrict to one asset; by default every asset (one column each).
+        """
+        if self.ticks is None:
+            return np.empty((0,) if asset_name is not None else (0, len(self.names)))
+        return self.ticks.view(self.ticks.capacity, asset_name)
+
+    def get_market_data(self, ticks: int = None):
+        """
+        Asset name -> recent prices, as zero-copy views of the tick store with its shared
+        rolling statistics (see MarketData); without a tick store, the current prices.
+        :param ticks: Number of recent ticks (defaults to the rolling statistics window).
+        """
+        if self.ticks is None:
+            return {name: [price] for name, price in self.assets.items()}
+        return self.ticks.market_data(ticks)
+
     def simulate_market_fluctuations(self):
         """
-        Simulate price fluctuations in the market. This can simulate the influence of supply/demand, 
+        Simulate price fluctuations in the market. This can simulate the influence of supply/demand,
         news, or market sentiment.
         :return: None
         """
-        log_info("Simulating market fluctuations...")
-        for asset in self.assets:
-            fluctuation = random.uniform(-0.05, 0.05)  # Random fluctuation between -5% and +5%
-            self.assets[asset] += self.assets[asset] * fluctuation
+        log_hot(logger, "Simulating market fluctuations...")
+        # Every asset moves at once under the market's price model
+        apply_price_model(self.prices, self.rng, self.model, **self.model_params)
+        self.record_tick()
+
+    def reseed(self, rng):
+        """
+        Draw prices and events from `rng` from now on (e.g. a stream of the environment's RNGRegistry).
+        Randomly generated initial prices are redrawn from `rng` as long as no tick has been recorded.
+        """
+        self.rng = rng
+        self.seeded = True
+        if getattr(self, "_drawn_assets", False) and (self.ticks is None or not self.ticks.count):
+            self.prices[:] = self._initialize_assets(self._asset_count)[1]
 
     def simulate_market_event(self):
         """
         Simulate a random event that could affect the market, such as a crash or a boom.
         :return: None
         """
-        event = random.choice(["boom", "crash", "neutral"])
+        event = ("boom", "crash", "neutral")[self.rng.integers(3)]
         log_info(f"Simulating market event: {event}")
-        
+
         if event == "boom":
             self._market_boost()
         elif event == "crash":
@@ -104,9 +262,8 @@ class Market:
         Simulate a market boom, causing all asset prices to increase by a fixed percentage.
         :return: None
         """
-        boost_factor = random.uniform(0.1, 0.3)
-        for asset in self.assets:
-            self.assets[asset] *= (1 + boost_factor)
+        boost_factor = self.rng.uniform(0.1, 0.3)
+        self.prices *= (1 + boost_factor)
         log_info(f"Market boom! All asset prices have increased by {boost_factor * 100:.2f}%.")
 
     def _market_crash(self):
@@ -114,11 +271,10 @@ class Market:
         Simulate a market crash, causing all asset prices to decrease drastically.
         :return: None
         """
-        crash_factor = random.uniform(0.3, 0.6)
-        for asset in self.assets:
-            self.assets[asset] *= (1 - crash_factor)
+        crash_factor = self.rng.uniform(0.3, 0.6)
+        self.prices *= (1 - crash_factor)
         log_info(f"Market crash! All asset prices have decreased by {crash_factor * 100:.2f}%.")
-    
+
     def get_market_status(self):
         """
         Get the current status of the market, including the prices of all assets.
@@ -126,3 +282,60 @@ class Market:
         """
         log_info("Fetching market status...")
         return self.assets
+
+
+class MarketEngine:
+    """
+    Many markets stepped together.
+    Prices and volumes of all markets live in (markets x assets) arrays, so one call to step()
+    moves every asset of every market under the price model. Markets handed out by market()
+    are ordinary Markets whose arrays are rows of the engine's, so the per-market API
+    (get_asset_price, buy_asset, ...) reads and writes the shared state.
+    """
+
+    def __init__(self, markets: int, assets: int, rng=None, model: str = "gbm", low: float = 5.0,
+                 high: float = 200.0, **model_params):
+        """
+        :param markets: Number of markets.
+        :param assets: Number of assets per market.
+        :param rng: NumPy Generator for prices.
+        :param model: Price model applied by step() (see MODELS).
+        :param low, high: Range of the uniformly drawn initial prices.
+        :param model_params: Overrides of MODEL_DEFAULTS; drift and volatility may be arrays
+                             broadcastable to (markets, assets).
+        """
+        if model not in MODELS:
+            raise ValueError(f"Unknown price model: {model}")
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.model = model
+        self.model_params = {**MODEL_DEFAULTS, **model_params}
+        self.prices = self.rng.uniform(low, high, size=(markets, assets))
+        self.volumes = np.zeros((markets, assets))
+        self.names = [f"Asset {i}" for i in range(assets)]
+        self.ticks = 0
+        log_info("Market engine initialized with %d markets of %d assets.", markets, assets)
+
+    def step(self, steps: int = 1):
+        """
+        Move every price of every market `steps` times.
+        """
+        for _ in range(steps):
+            apply_price_model(self.prices, self.rng, self.model, **self.model_params)
+        self.ticks += steps
+        log_hot(logger, "Market engine stepped to tick %d.", self.ticks)
+
+    def market(self, row: int, market_type: str = "stock") -> Market:
+        """
+        A Market view of one row of the engine; it keeps no history of its own.
+        """
+        market = Market.__new__(Market)
+        market.market_type = market_type
+        market.rng = self.rng
+        market.seeded = True
+        market.model = self.model
+        market.model_params = self.model_params
+        market._bind(self.names, self.prices[row], self.volumes[row], 0)
+        return market
+
+    def __len__(self):
+        return len(self.prices)
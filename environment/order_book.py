@@ -0,0 +1,243 @@
+# NyXX/environment/order_book.py
+
+import heapq
+import itertools
+from utils.loggings import log_error, log_hot, get_logger
+
+logger = get_logger(__name__)
+
+BUY, SELL = "buy", "sell"
+
+
+class Order:
+    """
+    A limit order (or a market order when price is None). `quantity` is what is left to fill.
+    """
+
+    __slots__ = ("order_id", "owner", "asset", "side", "price", "quantity", "sequence", "active")
+
+    def __init__(self, order_id: int, owner, asset: str, side: str, price, quantity: float, sequence: int):
+        self.order_id = order_id
+        self.owner = owner
+        self.asset = asset
+        self.side = side
+        self.price = price
+        self.quantity = quantity
+        self.sequence = sequence
+        self.active = True
+
+    def __repr__(self):
+        return f"Order({self.order_id}, {self.side} {self.quantity} {self.asset} @ {self.price})"
+
+
+class Fill:
+    """
+    One match between a buy and a sell order, at the resting order's price.
+    """
+
+    __slots__ = ("asset", "price", "quantity", "buyer", "seller", "buy_order_id", "sell_order_id", "aggressor")
+
+    def __init__(self, asset, price, quantity, buyer, seller, buy_order_id, sell_order_id, aggressor):
+        self.asset = asset
+        self.price = price
+        self.quantity = quantity
+        self.buyer = buyer
+        self.seller = seller
+        self.buy_order_id = buy_order_id
+        self.sell_order_id = sell_order_id
+        self.aggressor = aggressor  # Side of the incoming order
+
+    def __repr__(self):
+        return f"Fill({self.quantity} {self.asset} @ {self.price})"
+
+
+class OrderBook:
+    """
+    Limit order book of one asset with price-time priority.
+    Bids and asks are binary heaps keyed by (price, arrival), so inserting an order is
+    O(log n). Cancelling only marks the order inactive (O(1)); inactive orders are dropped
+    when they reach the top of their heap, and the heaps are rebuilt once cancelled orders
+    outnumber resting ones, keeping cancels at amortized O(log n) and memory bounded.
+    """
+
+    def __init__(self, asset: str):
+        self.asset = asset
+        self._bids = []  # (-price, sequence, order)
+        self._asks = []  # (price, sequence, order)
+        self._orders = {}  # order_id -> resting order
+        self._cancelled = 0  # Cancelled orders possibly still in the heaps
+        self.last_price = None
+
+    def _top(self, heap):
+        # Filled orders leave the heap as they fill, so inactive entries are cancelled orders
+        while heap and not heap[0][2].active:
+            heapq.heappop(heap)
+            self._cancelled -= 1
+        return heap[0][2] if heap else None
+
+    def best_bid(self):
+        order = self._top(self._bids)
+        return order.price if order is not None else None
+
+    def best_ask(self):
+        order = self._top(self._asks)
+        return order.price if order is not None else None
+
+    def spread(self):
+        bid, ask = self.best_bid(), self.best_ask()
+        return ask - bid if bid is not None and ask is not None else None
+
+    def submit(self, order: Order) -> list:
+        """
+        Match an incoming order against the opposite side, best price first and oldest first
+        within a price, then rest whatever is left of a limit order.
+        :return: The fills, in execution order.
+        """
+        fills = []
+        buying = order.side == BUY
+        opposite = self._asks if buying else self._bids
+        while order.quantity > 0:
+            resting = self._top(opposite)
+            if resting is None or (order.price is not None and
+                                   (resting.price > order.price if buying else resting.price < order.price)):
+                break
+            quantity = min(order.quantity, resting.quantity)
+            order.quantity -= quantity
+            resting.quantity -= quantity
+            if buying:
+                fills.append(Fill(self.asset, resting.price, quantity, order.owner, resting.owner,
+                                  order.order_id, resting.order_id, BUY))
+            else:
+                fills.append(Fill(self.asset, resting.price, quantity, resting.owner, order.owner,
+                                  resting.order_id, order.order_id, SELL))
+            if resting.quantity <= 0:
+                resting.active = False
+                heapq.heappop(opposite)
+                del self._orders[resting.order_id]
+        if fills:
+            self.last_price = fills[-1].price
+
+        if order.quantity > 0 and order.price is not None:
+            if buying:
+                heapq.heappush(self._bids, (-order.price, order.sequence, order))
+            else:
+                heapq.heappush(self._asks, (order.price, order.sequence, order))
+            self._orders[order.order_id] = order
+        else:
+            order.active = False
+        return fills
+
+    def cancel(self, order_id: int) -> bool:
+        """
+        :return: False if the order is not resting in this book.
+        """
+        order = self._orders.pop(order_id, None)
+        if order is None:
+            return False
+        order.active = False
+        self._cancelled += 1
+        if self._cancelled > 64 and self._cancelled > len(self._orders):
+            self._bids = [entry for entry in self._bids if entry[2].active]
+            self._asks = [entry for entry in self._asks if entry[2].active]
+            heapq.heapify(self._bids)
+            heapq.heapify(self._asks)
+            self._cancelled = 0
+        return True
+
+    def depth(self, levels: int = 5) -> dict:
+        """
+        Aggregated quantity of the best `levels` price levels on each side.
+        Orders are popped from a copy of each heap until the next level would be one too many,
+        so only the orders at or just past those levels are visited.
+        """
+        def side(heap):
+            heap = list(heap)
+            totals = {}
+            while heap:
+                order = heapq.heappop(heap)[2]
+                if order.active:
+                    if order.price not in totals and len(totals) == levels:
+                        break
+                    totals[order.price] = totals.get(order.price, 0) + order.quantity
+            return list(totals.items())
+
+        return {"bids": side(self._bids), "asks": side(self._asks)}
+
+    def __len__(self):
+        return len(self._orders)
+
+
+class MatchingEngine:
+    """
+    Order books for a set of assets, matched in batches.
+    Orders submitted in a batch are matched in submission order, so time priority holds
+    across the batch. Every fill is recorded with the TradeSystem, if one is attached.
+    """
+
+    def __init__(self, assets=(), trade_system=None):
+        """
+        :param assets: Asset names to open books for (more are opened on first use).
+        :param trade_system: Optional economy.trade_system.TradeSystem receiving every fill.
+        """
+        self.books = {asset: OrderBook(asset) for asset in assets}
+        self.trade_system = trade_system
+        self._ids = itertools.count(1)
+        self._sequence = itertools.count()
+        self._order_assets = {}  # order_id -> asset of orders that may still rest
+        self.fills = 0
+
+    def book(self, asset: str) -> OrderBook:
+        book = self.books.get(asset)
+        if book is None:
+            book = self.books[asset] = OrderBook(asset)
+        return book
+
+    def submit(self, owner, asset: str, side: str, price, quantity: float):
+        """
+        Submit one order.
+        :param price: Limit price, or None for a market order.
+        :return: The order id and its fills.
+        """
+        if side not in (BUY, SELL):
+            raise ValueError(f"Unknown order side: {side}")
+        if quantity <= 0:
+            raise ValueError("Order quantity must be positive.")
+        order = Order(next(self._ids), owner, asset, side, price, quantity, next(self._sequence))
+        book = self.book(asset)
+        fills = book.submit(order)
+        if order.active:
+            self._order_assets[order.order_id] = asset
+        for fill in fills:
+            resting_id = fill.sell_order_id if fill.aggressor == BUY else fill.buy_order_id
+            if resting_id not in book._orders:
+                self._order_assets.pop(resting_id, None)
+        self._record(fills)
+        return order.order_id, fills
+
+    def submit_batch(self, orders) -> list:
+        """
+        Submit a tick's orders, given as (owner, asset, side, price, quantity) tuples.
+        Invalid orders are logged and skipped.
+        :return: All fills of the batch, in execution order.
+        """
+        fills = []
+        for owner, asset, side, price, quantity in orders:
+            try:
+                fills.extend(self.submit(owner, asset, side, price, quantity)[1])
+            except ValueError as e:
+                log_error(f"Rejected order for {asset}: {str(e)}")
+        log_hot(logger, "Matched order batch into %d fills.", len(fills))
+        return fills
+
+    def cancel(self, order_id: int) -> bool:
+        asset = self._order_assets.pop(order_id, None)
+        return asset is not None and self.books[asset].cancel(order_id)
+
+    def _record(self, fills):
+        self.fills += len(fills)
+        trade_system = self.trade_system
+        if trade_system is None:
+            return
+        for fill in fills:
+            fee = trade_system.get_trade_fee(fill.price * fill.quantity)
+            trade_system.record_trade(fill.buyer, fill.seller, fill.asset, fill.quantity, fill.price, fee)
@@ -0,0 +1,320 @@
+# NyXX/environment/population.py
+
+from collections.abc import MutableMapping
+import logging
+import numpy as np
+from organisms.citizen import Citizen, ROLES, normalize_role
+
+# Status codes used by the population arrays, indexed by code
+STATUSES = ("idle", "ready to evolve", "evolved")
+IDLE, READY, EVOLVED = 0, 1, 2
+STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+
+# Role code 0 means "no role yet"; codes 1..n map onto ROLES
+ROLE_CODES = {role: code for code, role in enumerate(ROLES, start=1)}
+
+# Array columns that together hold the state of a population
+COLUMNS = ("status", "age", "role", "learning", "knowledge_total", "evolution_threshold", "knowledge")
+
+# Views share a single logger instead of registering one logger per row
+_VIEW_LOGGER = logging.getLogger("Citizen")
+
+
+class Population:
+    """
+    A structure-of-arrays store for a large number of citizens.
+    Status, age, knowledge counts and learning flags live in NumPy arrays so that a whole
+    population can be advanced with a handful of array operations per tick, instead of
+    calling learn() and act() on one Citizen object at a time.
+    """
+
+    def __init__(self, size: int, facts: list, threshold: int = 5, seed=None, names: list = None):
+        """
+        Create a population of `size` idle citizens.
+        :param size: Number of citizens in the population.
+        :param facts: The vocabulary of facts citizens can learn.
+        :param threshold: Total knowledge required before a citizen is ready to evolve (the
+                          evolution_threshold of every row, which can be changed per citizen).
+        :param seed: Seed for the population's random number generator.
+        :param names: Optional list of citizen names (defaults to "Citizen<index>").
+        """
+        if names is not None and len(names) != size:
+            raise ValueError("The number of names must match the population size.")
+        self.size = size
+        self.facts = list(facts)
+        self.fact_index = {fact: code for code, fact in enumerate(self.facts)}
+        self.threshold = threshold
+        self.names = names
+        self.rng = np.random.default_rng(seed)
+
+        self.status = np.zeros(size, dtype=np.int8)
+        self.age = np.zeros(size, dtype=np.int32)
+        self.role = np.zeros(size, dtype=np.int8)
+        self.learning = np.ones(size, dtype=bool)
+        self.knowledge_total = np.zeros(size, dtype=np.int32)
+        self.evolution_threshold = np.full(size, threshold, dtype=np.int32)
+        self.knowledge = np.zeros((size, len(self.facts)), dtype=np.uint16)
+
+        # Per-row Python state, only allocated for citizens that actually use it
+        self._memories = {}
+        self._metadata = {}
+
+    @classmethod
+    def from_citizens(cls, citizens: list, facts: list, threshold: int = 5, seed=None):
+        """
+        Build a population holding the state of existing Citizen objects, each row keeping its
+        citizen's evolution_threshold. Facts a citizen knows that are not in `facts` are added
+        to the vocabulary.
+        """
+        population = cls(len(citizens), facts, threshold=threshold, seed=seed,
+                         names=[citizen.name for citizen in citizens])
+        for index, citizen in enumerate(citizens):
+            population.status[index] = STATUS_CODES[citizen.status]
+            population.age[index] = citizen.age
+            population.role[index] = ROLE_CODES.get(citizen.role, 0)
+            population.learning[index] = citizen.learning_enabled
+            population.evolution_threshold[index] = citizen.evolution_threshold
+            for fact, count in citizen.knowledge.items():
+                code = population.fact_code(fact)  # May grow the knowledge matrix
+                population.knowledge[index, code] = count
+        population.knowledge_total[:] = population.knowledge.sum(axis=1)
+        return population
+
+    @classmethod
+    def from_arrays(cls, arrays: dict, facts: list, threshold: int = 5, seed=None):
+        """
+        Rebuild a population from the columns produced by to_arrays().
+        Rows without an evolution_threshold column get `threshold`.
+        """
+        population = cls(0, facts, threshold=threshold, seed=seed)
+        population.size = len(arrays["status"])
+        for column in COLUMNS:
+            if column in arrays:
+                setattr(population, column, arrays[column])
+            elif column == "evolution_threshold":
+                population.evolution_threshold = np.full(population.size, threshold, dtype=np.int32)
+        return population
+
+    def to_arrays(self) -> dict:
+        """
+        Return the state columns of the population (without copying).
+        """
+        return {column: getattr(self, column) for column in COLUMNS}
+
+    def split(self, parts: int) -> list:
+        """
+        Partition the population into `parts` contiguous blocks of columns.
+        """
+        bounds = np.linspace(0, self.size, parts + 1).astype(int)
+        return [{column: getattr(self, column)[start:stop] for column in COLUMNS}
+                for start, stop in zip(bounds[:-1], bounds[1:])]
+
+    def write_back(self, citizens: list):
+        """
+        Copy the state of each row onto the matching Citizen object.
+        """
+        for index, citizen in enumerate(citizens):
+            citizen.status = STATUSES[self.status[index]]
+            citizen.age = int(self.age[index])
+            code = self.role[index]
+            citizen.role = ROLES[code - 1] if code else None
+            citizen.learning_enabled = bool(self.learning[index])
+            row = self.knowledge[index]
+            citizen.knowledge = {self.facts[fact]: int(row[fact]) for fact in np.flatnonzero(row)}
+            citizen.knowledge_total = int(self.knowledge_total[index])
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index: int) -> "CitizenView":
+        """
+        Return a Citizen view over a single row of the population.
+        """
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("Population index out of range.")
+        return CitizenView(self, index)
+
+    def __iter__(self):
+        for index in range(self.size):
+            yield CitizenView(self, index)
+
+    def step(self, evolve: bool = True):
+        """
+        Advance every citizen by one tick.
+        Learning citizens pick up one random fact each, citizens that cross their threshold become
+        ready to evolve, and ready citizens evolve into a random role, mirroring Citizen.learn()
+        followed by Citizen.act().
+        :param evolve: False leaves ready citizens ready, for an EvolutionPipeline to evolve later.
+        """
+        learners = np.flatnonzero(self.learning)
+        if learners.size:
+            facts = self.rng.integers(0, len(self.facts), size=learners.size)
+            self.knowledge[learners, facts] += 1
+            self.knowledge_total[learners] += 1
+            reached = learners[self.knowledge_total[learners] >= self.evolution_threshold[learners]]
+            self.status[reached] = READY
+            self.learning[reached] = False
+
+        ready = np.flatnonzero(self.status == READY) if evolve else ()
+        if len(ready):
+            self.role[ready] = self.rng.integers(1, len(ROLES) + 1, size=ready.size)
+            self.status[ready] = EVOLVED
+
+        self.age += 1
+
+    def count_by_status(self) -> dict:
+        """
+        Return the number of citizens in each status.
+        """
+        counts = np.bincount(self.status, minlength=len(STATUSES))
+        return {status: int(counts[code]) for code, status in enumerate(STATUSES)}
+
+    def fact_code(self, fact: str) -> int:
+        """
+        Return the column used for a fact, growing the knowledge matrix for unseen facts.
+        """
+        code = self.fact_index.get(fact)
+        if code is None:
+            code = len(self.facts)
+            self.facts.append(fact)
+            self.fact_index[fact] = code
+            self.knowledge = np.pad(self.knowledge, ((0, 0), (0, 1)))
+        return code
+
+
+class _KnowledgeRow(MutableMapping):
+    """
+    Dict-like access to one citizen's knowledge counts inside a Population.
+    Only facts with a non-zero count are visible, matching the plain dict a Citizen keeps.
+    """
+
+    def __init__(self, population: Population, index: int):
+        self._population = population
+        self._index = index
+
+    def __getitem__(self, fact):
+        code = self._population.fact_index.get(fact)
+        if code is None or not self._population.knowledge[self._index, code]:
+            raise KeyError(fact)
+        return int(self._population.knowledge[self._index, code])
+
+    def __setitem__(self, fact, count):
+        population = self._population
+        code = population.fact_code(fact)
+        population.knowledge[self._index, code] = count
+
+    def __delitem__(self, fact):
+        self[fact]  # raise KeyError for unknown facts
+        self[fact] = 0
+
+    def __iter__(self):
+        population = self._population
+        for code in np.flatnonzero(population.knowledge[self._index]):
+            yield population.facts[code]
+
+    def __len__(self):
+        return int(np.count_nonzero(self._population.knowledge[self._index]))
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class CitizenView(Citizen):
+    """
+    A lightweight Citizen backed by a row of a Population.
+    All state lives in the population arrays, so existing code that works with Citizen objects
+    (learn, act, update_status, get_summary, ...) keeps working on top of the vectorized store.
+    """
+
+    def __init__(self, population: Population, index: int):
+        # Citizen.__init__ is deliberately not called: the state already lives in the population.
+        self._population = population
+        self._index = index
+        self.learning_data = []
+
+    @property
+    def name(self):
+        if self._population.names is not None:
+            return self._population.names[self._index]
+        return f"Citizen{self._index}"
+
+    @property
+    def citizen_id(self):
+        return f"{self.name}#{self._index}"
+
+    @property
+    def logger(self):
+        return _VIEW_LOGGER
+
+    @property
+    def status(self):
+        return STATUSES[self._population.status[self._index]]
+
+    @status.setter
+    def status(self, value):
+        self._population.status[self._index] = STATUS_CODES[value]
+
+    @property
+    def age(self):
+        return int(self._population.age[self._index])
+
+    @age.setter
+    def age(self, value):
+        self._population.age[self._index] = value
+
+    @property
+    def role(self):
+        code = self._population.role[self._index]
+        return ROLES[code - 1] if code else None
+
+    @role.setter
+    def role(self, value):
+        self._population.role[self._index] = ROLE_CODES[normalize_role(value)] if value else 0
+
+    @property
+    def learning_enabled(self):
+        return bool(self._population.learning[self._index])
+
+    @learning_enabled.setter
+    def learning_enabled(self, value):
+        self._population.learning[self._index] = value
+
+    @property
+    def knowledge(self):
+        return _KnowledgeRow(self._population, self._index)
+
+    @property
+    def knowledge_total(self):
+        return int(self._population.knowledge_total[self._index])
+
+    @knowledge_total.setter
+    def knowledge_total(self, value):
+        self._population.knowledge_total[self._index] = value
+
+    @property
+    def evolution_threshold(self):
+        return int(self._population.evolution_threshold[self._index])
+
+    @evolution_threshold.setter
+    def evolution_threshold(self, value):
+        self._population.evolution_threshold[self._index] = value
+
+    @property
+    def memory(self):
+        memory = self._population._memories.get(self._index)
+        if memory is None:
+            memory = self._population._memories[self._index] = self.memory_factory()
+        return memory
+
+    @property
+    def metadata(self):
+        return self._population._metadata.setdefault(self._index, {})
+
+    def __eq__(self, other):
+        return (isinstance(other, CitizenView)
+                and other._population is self._population and other._index == self._index)
+
+    def __hash__(self):
+        return hash((id(self._population), self._index))
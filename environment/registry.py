@@ -0,0 +1,162 @@
+# NyXX/environment/registry.py
+
+from organisms.citizen import Citizen, normalize_role
+from organisms.agent import Agent, BaseAgent
+
+
+class OrganismRegistry:
+    """
+    Holds every organism in the world and keeps hash indexes over them by id, status and role.
+    Registered citizens report their own status and role changes (see Citizen.status), so the
+    indexes are updated incrementally and lookups, removals and queries such as "all citizens
+    ready to evolve" cost time proportional to the result, not to the population.
+    Organisms are keyed by identity, so registering a CompactCitizen does not generate its
+    uuid; the citizen id index is only built the first time an organism is looked up by id.
+    The registry iterates like the plain list it replaces, in insertion order.
+    """
+
+    def __init__(self, organisms=None, on_change=None):
+        """
+        :param organisms: Organisms to register straight away.
+        :param on_change: Optional callback(organism, attribute, old, new) run after a status or role change.
+        """
+        self.on_change = on_change
+        self._by_key = {}  # id(organism) -> organism
+        self._by_citizen_id = None  # citizen_id -> organism, built on the first lookup by id
+        self._by_agent_id = {}  # agent_id -> agent
+        self._by_status = {}  # status -> {id(organism): organism}
+        self._by_role = {}  # role -> {id(organism): organism}
+        for organism in organisms or ():
+            self.add(organism)
+
+    def add(self, organism: Citizen):
+        """
+        Register an organism and index it. Re-adding a registered organism does nothing.
+        """
+        if organism._registry is self:
+            return
+        if organism._registry is not None:
+            raise ValueError(f"{organism.name} is already registered in another environment.")
+        key = id(organism)
+        self._by_key[key] = organism
+        if self._by_citizen_id is not None:
+            self._by_citizen_id[organism.citizen_id] = organism
+        if isinstance(organism, BaseAgent):
+            self._by_agent_id[organism.agent_id] = organism
+        self._by_status.setdefault(organism.status, {})[key] = organism
+        self._by_role.setdefault(organism.role, {})[key] = organism
+        organism._registry = self
+
+    # Drop-in for code that still treats Environment.organisms as a list
+    append = add
+
+    def remove(self, organism_or_id):
+        """
+        Remove an organism, given the organism itself or its citizen or agent id.
+        :return: The removed organism.
+        """
+        organism = self.get(organism_or_id) if isinstance(organism_or_id, str) else organism_or_id
+        if organism is None or organism._registry is not self:
+            raise KeyError(organism_or_id)
+        key = id(organism)
+        del self._by_key[key]
+        if self._by_citizen_id is not None:
+            self._by_citizen_id.pop(organism.citizen_id, None)
+        if isinstance(organism, BaseAgent):
+            self._by_agent_id.pop(organism.agent_id, None)
+        self._discard(self._by_status, organism.status, key)
+        self._discard(self._by_role, organism.role, key)
+        organism._registry = None
+        return organism
+
+    def index_agent(self, agent: Agent):
+        """
+        Index a registered citizen under its agent id once it has become an agent in place.
+        """
+        if agent._registry is self:
+            self._by_agent_id[agent.agent_id] = agent
+
+    def get(self, organism_id: str, default=None):
+        """
+        Look up an organism by its citizen id, or an agent by its agent id.
+        """
+        organism = self._citizen_ids().get(organism_id)
+        if organism is None:
+            organism = self._by_agent_id.get(organism_id, default)
+        return organism
+
+    def _citizen_ids(self) -> dict:
+        """
+        The citizen id index, built from every registered organism when first needed and
+        kept up to date afterwards.
+        """
+        if self._by_citizen_id is None:
+            self._by_citizen_id = {organism.citizen_id: organism for organism in self._by_key.values()}
+        return self._by_citizen_id
+
+    def by_status(self, status: str) -> list:
+        """
+        Return the organisms currently in a status.
+        The result is a snapshot, so it is safe to change statuses while iterating over it.
+        """
+        return list(self._by_status.get(status, {}).values())
+
+    def by_role(self, role) -> list:
+        """
+        Return the organisms currently holding a role (None for citizens without one), in any spelling.
+        """
+        return list(self._by_role.get(normalize_role(role), {}).values())
+
+    def count_by_status(self) -> dict:
+        """
+        Return the number of organisms in each status.
+        """
+        return {status: len(members) for status, members in self._by_status.items() if members}
+
+    def ready_to_evolve(self) -> list:
+        """
+        Return every citizen that has learned enough to evolve.
+        """
+        return self.by_status("ready to evolve")
+
+    @property
+    def agents(self) -> list:
+        """
+        Return every registered agent.
+        """
+        return list(self._by_agent_id.values())
+
+    def reindex(self, organism: Citizen, attribute: str, old, new):
+        """
+        Move an organism between index buckets. Called by Citizen when its status or role changes.
+        """
+        if old == new:
+            return
+        index = self._by_status if attribute == "status" else self._by_role
+        key = id(organism)
+        self._discard(index, old, key)
+        index.setdefault(new, {})[key] = organism
+        if self.on_change is not None:
+            self.on_change(organism, attribute, old, new)
+
+    @staticmethod
+    def _discard(index: dict, value, key: int):
+        members = index.get(value)
+        if members is not None:
+            members.pop(key, None)
+            if not members:
+                del index[value]
+
+    def __contains__(self, organism) -> bool:
+        if isinstance(organism, str):
+            return organism in self._citizen_ids() or organism in self._by_agent_id
+        return getattr(organism, "_registry", None) is self
+
+    def __iter__(self):
+        return iter(list(self._by_key.values()))
+
+    def __len__(self) -> int:
+        return len(self._by_key)
+
+    def __repr__(self):
+        return f"<OrganismRegistry organisms={len(self._by_key)}, agents={len(self._by_agent_id)}>"
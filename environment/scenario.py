@@ -1,6 +1,6 @@
 # NyXX/encephalon/environment/scenario.py
 
-import random
+import numpy as np
 from datetime import datetime
 from NyXX.utils.logging import log_info, log_error
 from NyXX.environment.data_provider import DataProvider
@@ -11,12 +11,14 @@ class Scenario:
     that agents will operate in. Scenarios are dynamic and affect the agents' decisions and strategies.
     """
 
-    def __init__(self, scenario_type):
+    def __init__(self, scenario_type, rng=None):
         """
         Initialize a specific scenario based on type.
         :param scenario_type: Type of the scenario (e.g., 'market_crash', 'weather_change').
+        :param rng: NumPy Generator for the scenario's random effects (e.g. environment.rng.stream("scenarios")).
         """
         self.scenario_type = scenario_type
+        self.rng = rng if rng is not None else np.random.default_rng()
         self.data_provider = DataProvider()
 
     def activate_scenario(self):
@@ -43,7 +45,7 @@ class Scenario:
         """
         log_info("Simulating a market crash...")
         crash_data = self.data_provider.simulate_stock_data()
-        crash_data['price'] *= random.uniform(0.1, 0.3)  # Reduce the price drastically to simulate a crash
+        crash_data['price'] *= self.rng.uniform(0.1, 0.3)  # Reduce the price drastically to simulate a crash
         crash_data['event'] = "Market Crash"
         return crash_data
 
@@ -54,8 +56,8 @@ class Scenario:
         """
         log_info("Simulating a dramatic weather change...")
         weather_data = self.data_provider.simulate_weather_data()
-        weather_data['temperature'] = random.uniform(-20, 50)  # Extreme temperature change
-        weather_data['condition'] = random.choice(['stormy', 'flooding', 'heatwave'])
+        weather_data['temperature'] = self.rng.uniform(-20, 50)  # Extreme temperature change
+        weather_data['condition'] = ('stormy', 'flooding', 'heatwave')[self.rng.integers(3)]
         weather_data['event'] = "Weather Change"
         return weather_data
 
@@ -65,8 +67,8 @@ class Scenario:
         :return: Simulated event affecting agent behavior.
         """
         log_info("Simulating political tensions...")
-        political_event = random.choice(['election', 'war', 'treaty', 'embargo'])
-        tension_level = random.uniform(0.5, 1.5)  # Random tension multiplier
+        political_event = ('election', 'war', 'treaty', 'embargo')[self.rng.integers(4)]
+        tension_level = self.rng.uniform(0.5, 1.5)  # Random tension multiplier
         event_data = {
             'event': "Political Tension",
             'type': political_event,
@@ -81,8 +83,8 @@ class Scenario:
         :return: Simulated technology event.
         """
         log_info("Simulating new technological breakthrough...")
-        tech_breakthrough = random.choice(['quantum_computing', 'artificial_intelligence', 'blockchain'])
-        breakthrough_impact = random.uniform(0.3, 2.0)  # Random multiplier for market impact
+        tech_breakthrough = ('quantum_computing', 'artificial_intelligence', 'blockchain')[self.rng.integers(3)]
+        breakthrough_impact = self.rng.uniform(0.3, 2.0)  # Random multiplier for market impact
         tech_data = {
             'event': "New Technology",
             'type': tech_breakthrough,
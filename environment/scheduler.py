@@ -0,0 +1,81 @@
+# NyXX/environment/scheduler.py
+
+import heapq
+from itertools import count
+
+
+class TickScheduler:
+    """
+    A wake-up queue of organisms keyed by the tick at which they next need attention.
+    Only organisms that are due are handed back on a tick; everyone else is dormant and costs
+    nothing until their wake-up tick arrives or something wakes them early. Rescheduling an
+    organism leaves its old heap entry behind, which is skipped lazily when it surfaces.
+    """
+
+    def __init__(self, tick: int = 0):
+        """
+        :param tick: The tick the simulation starts at.
+        """
+        self.tick = tick
+        self._queue = []  # Heap of (tick, sequence, organism)
+        self._wake_ticks = {}  # id(organism) -> the tick its live heap entry is for
+        self._sequence = count()  # Tie-breaker: organisms due on the same tick keep scheduling order
+
+    def schedule(self, organism, tick: int = None):
+        """
+        Wake an organism at the given tick (the current tick by default).
+        If it is already scheduled earlier, the earlier wake-up stands.
+        """
+        tick = self.tick if tick is None else max(tick, self.tick)
+        current = self._wake_ticks.get(id(organism))
+        if current is not None and current <= tick:
+            return
+        self._wake_ticks[id(organism)] = tick
+        heapq.heappush(self._queue, (tick, next(self._sequence), organism))
+
+    def sleep(self, organism, ticks: int):
+        """
+        Put an organism to sleep for a number of ticks, replacing any earlier wake-up.
+        """
+        self.cancel(organism)
+        self.schedule(organism, self.tick + ticks)
+
+    def wake(self, organism):
+        """
+        Make an organism due on the current tick.
+        """
+        self.schedule(organism)
+
+    def cancel(self, organism):
+        """
+        Drop an organism's pending wake-up; it stays dormant until scheduled again.
+        """
+        self._wake_ticks.pop(id(organism), None)
+
+    def pop_due(self) -> list:
+        """
+        Remove and return every organism due on or before the current tick, in wake-up order.
+        """
+        due = []
+        queue, wake_ticks = self._queue, self._wake_ticks
+        while queue and queue[0][0] <= self.tick:
+            tick, _, organism = heapq.heappop(queue)
+            if wake_ticks.get(id(organism)) == tick:  # Skip entries that were rescheduled or cancelled
+                del wake_ticks[id(organism)]
+                due.append(organism)
+        return due
+
+    def advance(self, ticks: int = 1):
+        """
+        Move the clock forward.
+        """
+        self.tick += ticks
+
+    def is_scheduled(self, organism) -> bool:
+        return id(organism) in self._wake_ticks
+
+    def __len__(self) -> int:
+        """
+        The number of organisms with a pending wake-up.
+        """
+        return len(self._wake_ticks)
@@ -0,0 +1,142 @@
+# NyXX/environment/sharding.py
+
+import multiprocessing
+import numpy as np
+from organisms.citizen import BaseCitizen
+from environment.population import Population, STATUS_CODES
+from utils.loggings import log_info, log_error
+from utils.telemetry import get_event_sink
+
+
+def _shard_worker(connection, arrays, facts, seed, evolve):
+    """
+    Worker loop for a single shard.
+    The shard's state stays inside this process for the whole run; only commands and
+    per-tick status counts cross the process boundary until the final collect.
+    """
+    population = Population.from_arrays(arrays, facts, seed=seed)
+    while True:
+        command = connection.recv()
+        if command == "step":
+            population.step(evolve)
+            connection.send(population.count_by_status())
+        elif command == "collect":
+            connection.send(population.to_arrays())
+        elif command == "stop":
+            break
+    connection.close()
+
+
+class ShardedRunner:
+    """
+    Runs an Environment's citizens across a pool of worker processes.
+    Plain citizens are converted once into Population columns, partitioned into contiguous
+    shards and stepped in parallel. The runner waits for every shard at each tick barrier and
+    merges their status counts, then writes the final state back onto the Citizen objects.
+    Results are deterministic for a given seed and shard count.
+    """
+
+    def __init__(self, shards: int, seed=None):
+        """
+        :param shards: Number of worker processes to partition the citizens across.
+        :param seed: Root seed; each shard gets an independent stream spawned from it.
+                     Defaults to the environment's RNG registry.
+        """
+        if shards < 1:
+            raise ValueError("A sharded run needs at least one shard.")
+        self.shards = shards
+        self.seed = seed
+
+    @staticmethod
+    def is_shardable(organism) -> bool:
+        """
+        A citizen can be sharded if it uses the stock learn/act behaviour and a known status.
+        """
+        return (isinstance(organism, BaseCitizen)
+                and type(organism).learn is BaseCitizen.learn
+                and type(organism).act is BaseCitizen.act
+                and organism.status in STATUS_CODES)
+
+    def run(self, environment, steps: int = 1) -> list:
+        """
+        Run the environment for a number of steps across the shards.
+        Organisms that cannot be sharded, and any attached population, are stepped in the
+        main process at each tick barrier. Each citizen keeps its own evolution_threshold.
+        With an evolution pipeline enabled, shards leave ready citizens ready and the pipeline
+        evolves them once the shards are collected (at the end of the run, not on the tick they
+        became ready); otherwise they evolve on the shards and "evolution" telemetry is emitted
+        for them after the run.
+        Note: facts learned on a shard are counted in knowledge but not appended to memory.
+        :return: A list with the merged status counts of the sharded citizens for each tick.
+        """
+        citizens = [organism for organism in environment.organisms if self.is_shardable(organism)]
+        local = [organism for organism in environment.organisms if not self.is_shardable(organism)]
+        population = Population.from_citizens(citizens, environment.basic_data_source.data)
+        pipeline = environment.evolution_pipeline
+        if self.seed is not None:
+            shard_seeds = np.random.SeedSequence(self.seed).spawn(self.shards)
+        else:
+            shard_seeds = environment.rng.shard_seeds("population", self.shards)
+
+        log_info(f"Starting sharded simulation of {len(citizens)} citizens on {self.shards} shards for {steps} steps.")
+        context = multiprocessing.get_context()
+        connections, workers = [], []
+        for arrays, shard_seed in zip(population.split(self.shards), shard_seeds):
+            parent, child = context.Pipe()
+            worker = context.Process(
+                target=_shard_worker,
+                args=(child, arrays, population.facts, shard_seed, pipeline is None),
+                daemon=True,
+            )
+            worker.start()
+            child.close()
+            connections.append(parent)
+            workers.append(worker)
+
+        history = []
+        try:
+            for _ in range(steps):
+                for connection in connections:
+                    connection.send("step")
+                if environment.population is not None:
+                    environment.population.step()
+                for organism in local:
+                    organism.learn(environment)
+                    organism.act()
+
+                # Tick barrier: wait for every shard before starting the next tick
+                merged = {}
+                for connection in connections:
+                    for status, count in connection.recv().items():
+                        merged[status] = merged.get(status, 0) + count
+                history.append(merged)
+
+            for connection in connections:
+                connection.send("collect")
+            shards = [connection.recv() for connection in connections]
+        except (EOFError, OSError) as e:
+            log_error(f"Shard worker failed: {str(e)}")
+            raise
+        finally:
+            for connection, worker in zip(connections, workers):
+                try:
+                    connection.send("stop")
+                except (BrokenPipeError, OSError):
+                    pass
+                connection.close()
+                worker.join()
+
+        for column in shards[0]:
+            setattr(population, column, np.concatenate([shard[column] for shard in shards]))
+        evolved_before = [citizen.status == "evolved" for citizen in citizens]
+        population.write_back(citizens)
+        if pipeline is not None:
+            pipeline.run_environment(environment)
+        else:
+            sink = get_event_sink()
+            if sink is not None:
+                for citizen, was_evolved in zip(citizens, evolved_before):
+                    if not was_evolved and citizen.status == "evolved":
+                        sink.emit("evolution", citizen_id=citizen.citizen_id, name=citizen.name, role=citizen.role)
+        log_info("Sharded simulation completed.")
+        return history
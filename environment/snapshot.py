@@ -0,0 +1,429 @@
+# NyXX/environment/snapshot.py
+
+import gc
+import gzip
+import hashlib
+import importlib
+import json
+import logging
+import os
+import pickle
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+import numpy as np
+from organisms.citizen import CompactCitizen
+from environment.population import Population, COLUMNS
+from utils.loggings import log_info
+
+FORMAT_VERSION = 1
+MANIFEST = "manifest.json"
+
+# Per-organism numeric columns of a segment and their on-disk dtypes
+SEGMENT_COLUMNS = {
+    "status": np.int16,
+    "role": np.int16,
+    "kind": np.int16,
+    "age": np.int32,
+    "knowledge_total": np.int32,
+    "evolution_threshold": np.int32,
+    "learning": np.bool_,
+    "created": np.float64,
+    "knowledge_indptr": np.int64,
+    "knowledge_facts": np.int32,
+    "knowledge_counts": np.int32,
+    "memory_indptr": np.int64,
+    "memory_facts": np.int32,
+}
+
+# Storage attributes that are written as columns instead of per-organism objects
+_COLUMN_STORAGE = frozenset((
+    "_status", "_role", "name", "age", "knowledge_total", "evolution_threshold", "learning_enabled",
+    "citizen_id", "_citizen_id", "creation_time", "_created", "memory", "_memory", "knowledge", "_knowledge",
+    "logger", "_registry", "uid",
+))
+# Citizen containers left out of a snapshot while empty, and recreated on restore
+_EMPTY_DEFAULTS = {"metadata": dict, "learning_data": list}
+
+_slot_cache = {}
+
+
+@contextmanager
+def _gc_paused():
+    """
+    Pause the cyclic garbage collector while millions of objects are created or walked;
+    otherwise its generational passes rescan the growing heap over and over.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _dump(obj, path: str):
+    with gzip.open(path, "wb", compresslevel=3) as file:
+        pickle.dump(obj, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _load(path: str):
+    with gzip.open(path, "rb") as file:
+        return pickle.load(file)
+
+
+def _class_path(cls) -> str:
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def _load_class(path: str):
+    module, _, qualname = path.partition(":")
+    obj = importlib.import_module(module)
+    for name in qualname.split("."):
+        obj = getattr(obj, name)
+    return obj
+
+
+def _slots(cls) -> dict:
+    """
+    Return the slot descriptors of a class and its bases, by slot name.
+    """
+    slots = _slot_cache.get(cls)
+    if slots is None:
+        slots = {}
+        for klass in reversed(cls.__mro__):
+            names = klass.__dict__.get("__slots__", ())
+            for name in (names,) if isinstance(names, str) else names:
+                if name not in ("__dict__", "__weakref__"):
+                    slots[name] = klass.__dict__[name]
+        _slot_cache[cls] = slots
+    return slots
+
+
+def _storage(organism) -> dict:
+    """
+    Return the raw stored attributes of an organism, from its instance dict and its slots.
+    """
+    state = dict(getattr(organism, "__dict__", {}))
+    for name, descriptor in _slots(type(organism)).items():
+        try:
+            state[name] = descriptor.__get__(organism, type(organism))
+        except AttributeError:
+            pass
+    return state
+
+
+def _digest(organism) -> bytes:
+    """
+    Fingerprint of an organism's stored state. Comparing fingerprints finds every organism
+    changed since the last snapshot, however it was changed (learn_many, update_status or a
+    direct edit of its knowledge or metadata).
+    """
+    organism.citizen_id  # Snapshots store the id, so generate a lazy one before fingerprinting
+    state = _storage(organism)
+    state.pop("logger", None)
+    state.pop("_registry", None)
+    return hashlib.blake2b(pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL), digest_size=16).digest()
+
+
+class _Codes:
+    """
+    Assigns consecutive integer codes to the values of a string table.
+    """
+
+    def __init__(self, values=()):
+        self.values = list(values)
+        self.index = {value: code for code, value in enumerate(self.values)}
+
+    def __call__(self, value) -> int:
+        code = self.index.get(value)
+        if code is None:
+            code = self.index[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+def _write_segment(directory: str, organisms: list):
+    """
+    Write organisms as one columnar segment: numeric .npy columns, knowledge and string memories
+    as CSR arrays over a fact vocabulary, and the remaining per-organism state as compressed pickles.
+    """
+    os.makedirs(directory, exist_ok=True)
+    size = len(organisms)
+    columns = {name: np.zeros(size + 1 if name.endswith("_indptr") else size, dtype=dtype)
+               for name, dtype in SEGMENT_COLUMNS.items() if name not in ("knowledge_facts", "knowledge_counts", "memory_facts")}
+    statuses, roles, classes, facts = _Codes(), _Codes([None]), _Codes(), _Codes()
+    knowledge_facts, knowledge_counts, memory_facts = [], [], []
+    names, ids, extras = [], [], {}
+
+    for row, organism in enumerate(organisms):
+        cls = type(organism)
+        state = _storage(organism)
+        slots = _slots(cls)
+        names.append(organism.name)
+        ids.append(organism.citizen_id)
+        columns["status"][row] = statuses(organism.status)
+        columns["role"][row] = roles(organism.role)
+        columns["kind"][row] = classes(_class_path(cls))
+        columns["age"][row] = organism.age
+        columns["knowledge_total"][row] = organism.knowledge_total
+        columns["evolution_threshold"][row] = organism.evolution_threshold
+        columns["learning"][row] = organism.learning_enabled
+        if "_created" in state:
+            columns["created"][row] = state["_created"]
+        else:
+            columns["created"][row] = state["creation_time"].replace(tzinfo=timezone.utc).timestamp()
+
+        knowledge = state.get("_knowledge", state.get("knowledge")) or {}
+        for fact, count in knowledge.items():
+            knowledge_facts.append(facts(fact))
+            knowledge_counts.append(count)
+        columns["knowledge_indptr"][row + 1] = len(knowledge_facts)
+
+        row_extras = {}
+        memory_key = "_memory" if "_memory" in slots else "memory"
+        memory = state.get(memory_key)
+        if type(memory) is list and all(type(entry) is str for entry in memory):
+            memory_facts.extend(facts(entry) for entry in memory)
+        elif memory is not None:
+            row_extras[memory_key] = memory
+        columns["memory_indptr"][row + 1] = len(memory_facts)
+
+        logger = state.get("logger")
+        if logger is not None and logger.name != f"Citizen-{organism.name}":
+            row_extras["logger"] = logger  # Loggers pickle by name
+        for key, value in state.items():
+            if key in _COLUMN_STORAGE or (key in slots and value is None):
+                continue
+            if key in _EMPTY_DEFAULTS and not value:
+                continue
+            row_extras[key] = value
+        if row_extras:
+            extras[row] = row_extras
+
+    columns["knowledge_facts"] = np.asarray(knowledge_facts, dtype=np.int32)
+    columns["knowledge_counts"] = np.asarray(knowledge_counts, dtype=np.int32)
+    columns["memory_facts"] = np.asarray(memory_facts, dtype=np.int32)
+    for name, values in columns.items():
+        np.save(os.path.join(directory, f"{name}.npy"), values)
+    _dump({
+        "names": names,
+        "ids": ids,
+        "statuses": statuses.values,
+        "roles": roles.values,
+        "classes": classes.values,
+        "facts": facts.values,
+        "extras": extras,
+    }, os.path.join(directory, "objects.pkl.gz"))
+
+
+def _read_segment(directory: str) -> list:
+    """
+    Rebuild the organisms of a segment. Every organism becomes a Python object, so the columns
+    are read whole and converted to lists in one pass each.
+    """
+    objects = _load(os.path.join(directory, "objects.pkl.gz"))
+    columns = {name: np.load(os.path.join(directory, f"{name}.npy")).tolist()
+               for name in SEGMENT_COLUMNS}
+    statuses, roles, facts, extras = objects["statuses"], objects["roles"], objects["facts"], objects["extras"]
+    classes = [_load_class(path) for path in objects["classes"]]
+    slotted = {cls: _slots(cls) for cls in classes}
+    knowledge_indptr, knowledge_facts, knowledge_counts = (
+        columns["knowledge_indptr"], columns["knowledge_facts"], columns["knowledge_counts"])
+    memory_indptr, memory_facts = columns["memory_indptr"], columns["memory_facts"]
+
+    organisms = []
+    for row, (name, citizen_id) in enumerate(zip(objects["names"], objects["ids"])):
+        cls = classes[columns["kind"][row]]
+        slots = slotted[cls]
+        organism = cls.__new__(cls)
+        for descriptor in slots.values():
+            descriptor.__set__(organism, None)
+
+        start, stop = knowledge_indptr[row], knowledge_indptr[row + 1]
+        knowledge = {facts[fact]: count for fact, count in
+                     zip(knowledge_facts[start:stop], knowledge_counts[start:stop])}
+        memory = [facts[fact] for fact in memory_facts[memory_indptr[row]:memory_indptr[row + 1]]]
+        created = columns["created"][row]
+        if "_created" in slots:  # Compact layout (see CompactCitizen)
+            state = {"uid": next(CompactCitizen._next_uid), "_citizen_id": citizen_id, "_created": created,
+                     "_knowledge": knowledge or None, "_memory": memory or None}
+        else:
+            state = {"citizen_id": citizen_id, "creation_time": datetime.utcfromtimestamp(created),
+                     "knowledge": knowledge, "memory": memory, "logger": logging.getLogger(f"Citizen-{name}")}
+            for key, factory in _EMPTY_DEFAULTS.items():
+                state[key] = factory()
+        state["name"] = name
+        state["_status"] = statuses[columns["status"][row]]
+        state["_role"] = roles[columns["role"][row]]
+        state["age"] = columns["age"][row]
+        state["knowledge_total"] = columns["knowledge_total"][row]
+        state["evolution_threshold"] = columns["evolution_threshold"][row]
+        state["learning_enabled"] = columns["learning"][row]
+        state.update(extras.get(row, ()))
+
+        if slots:
+            for key, value in state.items():
+                object.__setattr__(organism, key, value)
+        else:
+            organism.__dict__.update(state)
+        organisms.append(organism)
+    return organisms
+
+
+def _base_chain(path: str) -> list:
+    """
+    Real paths of a snapshot and every base it is restored on top of, newest first.
+    Raises ValueError if the chain loops back on itself.
+    """
+    chain = []
+    while path:
+        real = os.path.realpath(path)
+        if real in chain:
+            raise ValueError(f"Snapshot {path} is its own base.")
+        chain.append(real)
+        with open(os.path.join(real, MANIFEST)) as file:
+            path = json.load(file)["base"]
+    return chain
+
+
+def _read_organisms(path: str) -> dict:
+    """
+    Return the organisms of a snapshot by citizen id, applying incremental snapshots on top of their base.
+    """
+    organisms = {}
+    for directory in reversed(_base_chain(path)):
+        _apply_segment(organisms, directory)
+    return organisms
+
+
+def _apply_segment(organisms: dict, path: str):
+    """
+    Apply one snapshot's removals and organisms to the organisms restored from its base.
+    """
+    with open(os.path.join(path, MANIFEST)) as file:
+        manifest = json.load(file)
+    for citizen_id in manifest["removed"]:
+        organisms.pop(citizen_id, None)
+    for organism in _read_segment(os.path.join(path, "organisms")):
+        organisms[organism.citizen_id] = organism
+
+
+def write_snapshot(environment, path: str, incremental: bool = False) -> str:
+    """
+    Write an environment to a snapshot directory.
+    :param incremental: Only write the organisms added or changed since the environment's last
+                        snapshot, which becomes the base this snapshot is restored on top of.
+                        Changes are found by comparing each organism's state fingerprint with
+                        the one recorded at the last snapshot (or restore).
+    :return: The absolute path of the snapshot.
+    """
+    base = environment._last_snapshot if incremental else None
+    if incremental and base is None:
+        raise ValueError("An incremental snapshot needs an earlier snapshot of the same environment.")
+    if base is not None and os.path.realpath(path) in _base_chain(base):
+        # Writing into the base would overwrite the organisms it is restored from
+        raise ValueError(f"An incremental snapshot cannot be written into its own base chain ({path}).")
+    start = time.perf_counter()
+    os.makedirs(path, exist_ok=True)
+
+    with _gc_paused():
+        digests = {organism: _digest(organism) for organism in environment.organisms}
+        if base is None:
+            organisms, removed = list(digests), []
+        else:
+            previous = environment._digests
+            organisms = [organism for organism, digest in digests.items() if previous.get(organism) != digest]
+            removed = sorted(environment._removed)
+        _write_segment(os.path.join(path, "organisms"), organisms)
+    _dump({"markets": environment.markets, "scenarios": environment.scenarios}, os.path.join(path, "world.pkl.gz"))
+
+    population = environment.population
+    if population is not None:
+        directory = os.path.join(path, "population")
+        os.makedirs(directory, exist_ok=True)
+        for column, values in population.to_arrays().items():
+            np.save(os.path.join(directory, f"{column}.npy"), values)
+        _dump({
+            "facts": population.facts,
+            "threshold": population.threshold,
+            "names": population.names,
+            "rng": population.rng.bit_generator.state,
+            "memories": population._memories,
+            "metadata": population._metadata,
+        }, os.path.join(directory, "population.pkl.gz"))
+
+    pipeline = environment.evolution_pipeline
+    manifest = {
+        "version": FORMAT_VERSION,
+        "name": environment.name,
+        "tick": environment.tick,
+        "created": time.time(),
+        "base": base,
+        "removed": removed,
+        "organisms": len(organisms),
+        "rng": environment.rng.get_state(),
+        "population": population is not None,
+        "evolution_pipeline": pipeline.get_stats() if pipeline is not None else None,
+    }
+    with open(os.path.join(path, MANIFEST), "w") as file:
+        json.dump(manifest, file)
+
+    path = os.path.abspath(path)
+    environment._last_snapshot = path
+    environment._digests = digests
+    environment._removed.clear()
+    log_info("Snapshot of %s written to %s (%d organisms, %s) in %.2fs.", environment.name, path, len(organisms),
+             "incremental" if base else "full", time.perf_counter() - start)
+    return path
+
+
+def restore_snapshot(environment_class, path: str):
+    """
+    Rebuild an environment from a snapshot directory written by write_snapshot().
+    Population columns are memory-mapped copy-on-write, so they are paged in as they are used
+    and never written back to the snapshot.
+    """
+    start = time.perf_counter()
+    with open(os.path.join(path, MANIFEST)) as file:
+        manifest = json.load(file)
+    if manifest["version"] != FORMAT_VERSION:
+        raise ValueError(f"Unsupported snapshot format version {manifest['version']}.")
+
+    environment = environment_class(name=manifest["name"])
+    environment.rng.set_state(manifest["rng"])
+    world = _load(os.path.join(path, "world.pkl.gz"))
+    environment.markets = world["markets"]
+    environment.scenarios = world["scenarios"]
+
+    if manifest["population"]:
+        directory = os.path.join(path, "population")
+        state = _load(os.path.join(directory, "population.pkl.gz"))
+        arrays = {column: np.load(os.path.join(directory, f"{column}.npy"), mmap_mode="c") for column in COLUMNS
+                  if os.path.exists(os.path.join(directory, f"{column}.npy"))}
+        population = Population.from_arrays(arrays, state["facts"], threshold=state["threshold"])
+        population.names = state["names"]
+        population.rng.bit_generator.state = state["rng"]
+        population._memories = state["memories"]
+        population._metadata = state["metadata"]
+        environment.population = population
+
+    stats = manifest["evolution_pipeline"]
+    if stats is not None:
+        pipeline = environment.enable_evolution_pipeline()
+        pipeline.evolved, pipeline.converted, pipeline.elapsed = stats["evolved"], stats["converted"], stats["elapsed"]
+
+    scheduler = environment.scheduler
+    scheduler.tick = manifest["tick"]
+    with _gc_paused():
+        for organism in _read_organisms(path).values():
+            environment.organisms.add(organism)
+            if not environment._is_dormant(organism):
+                scheduler.wake(organism)
+        environment._digests = {organism: _digest(organism) for organism in environment.organisms}
+
+    environment._last_snapshot = os.path.abspath(path)
+    log_info("Restored %s from %s (%d organisms) in %.2fs.", environment.name, path,
+             len(environment.organisms), time.perf_counter() - start)
+    return environment
@@ -0,0 +1,174 @@
+# NyXX/environment/tick_store.py
+
+from collections.abc import Mapping
+import numpy as np
+
+
+class TickStore:
+    """
+    Fixed-size price history of a market with rolling statistics.
+    Each tick is one row of prices (one column per asset) written twice into a buffer of
+    2 x capacity rows, so the latest `k` ticks are always one contiguous slice: appending is
+    O(assets) with no copying of history, and windows are handed out as read-only views.
+    Rolling mean and variance over the last `window` ticks are updated with every append
+    (from sums shifted by the first prices, to keep the variance accurate); rolling min and
+    max are computed at most once per tick, when first asked for, and shared by every reader.
+    """
+
+    def __init__(self, names: list, capacity: int = 1024, window: int = 64):
+        """
+        :param names: Asset names, one per price column.
+        :param capacity: Number of ticks kept.
+        :param window: Ticks covered by the rolling statistics (at most `capacity`).
+        """
+        if not 0 < window <= capacity:
+            raise ValueError("window must be between 1 and capacity.")
+        self.names = list(names)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.capacity = capacity
+        self.window = window
+        self._buffer = np.zeros((2 * capacity, len(self.names)))
+        self.count = 0  # Ticks appended so far
+        self._shift = None
+        self._sum = np.zeros(len(self.names))
+        self._sumsq = np.zeros(len(self.names))
+        self._stats = None  # Statistics cached for the current tick
+        self._stats_count = -1
+
+    def append(self, prices):
+        """
+        Record one tick of prices (array-like, one per asset).
+        """
+        prices = np.asarray(prices, dtype=float)
+        if self._shift is None:
+            self._shift = prices.copy()
+        position = self.count % self.capacity
+        if self.count >= self.window:
+            # The tick leaving the rolling window is still in the buffer (window <= capacity)
+            leaving = self._buffer[(self.count - self.window) % self.capacity] - self._shift
+            self._sum -= leaving
+            self._sumsq -= leaving * leaving
+        self._buffer[position] = prices
+        self._buffer[position + self.capacity] = prices
+        self.count += 1
+        if position == self.capacity - 1:
+            # Once per lap, recompute the sums exactly so rounding errors cannot accumulate
+            shifted = self.view() - self._shift
+            self._sum = shifted.sum(axis=0)
+            self._sumsq = np.square(shifted).sum(axis=0)
+        else:
+            entering = prices - self._shift
+            self._sum += entering
+            self._sumsq += entering * entering
+
+    def view(self, ticks: int = None, asset: str = None) -> np.ndarray:
+        """
+        Read-only, zero-copy view of the latest ticks, oldest first.
+        :param ticks: Number of ticks (defaults to the rolling window; capped by what is stored).
+        :param asset: Restrict to one asset's column.
+        """
+        ticks = min(self.window if ticks is None else ticks, self.count, self.capacity)
+        end = self.count % self.capacity + self.capacity
+        window = self._buffer[end - ticks:end]
+        if asset is not None:
+            window = window[:, self.index[asset]]
+        window = window.view()
+        window.flags.writeable = False
+        return window
+
+    def latest(self) -> np.ndarray:
+        return self.view(1)[0] if self.count else None
+
+    def stats(self) -> dict:
+        """
+        Rolling count, mean, variance, std, min and max of every asset over the window.
+        The arrays are shared between callers and must not be modified.
+        """
+        if self._stats_count == self.count:
+            return self._stats
+        n = min(self.count, self.window)
+        if n:
+            mean_shifted = self._sum / n
+            variance = np.maximum(self._sumsq / n - mean_shifted * mean_shifted, 0.0)
+            window = self.view()
+            stats = {"count": n, "mean": mean_shifted + self._shift, "variance": variance,
+                     "std": np.sqrt(variance), "min": window.min(axis=0), "max": window.max(axis=0)}
+        else:
+            empty = np.full(len(self.names), np.nan)
+            stats = {"count": 0, "mean": empty, "variance": empty, "std": empty, "min": empty, "max": empty}
+        for value in stats.values():
+            if isinstance(value, np.ndarray):
+                value.flags.writeable = False
+        self._stats, self._stats_count = stats, self.count
+        return stats
+
+    def asset_stats(self, asset: str) -> dict:
+        """
+        The rolling statistics of one asset, as floats.
+        """
+        stats = self.stats()
+        index = self.index[asset]
+        return {key: value if key == "count" else float(value[index]) for key, value in stats.items()}
+
+    def market_data(self, ticks: int = None) -> "MarketData":
+        return MarketData(self, ticks)
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+
+class MarketData(Mapping):
+    """
+    What agents get from Environment.get_market_data(): asset name -> read-only view of its
+    recent prices, plus the store's shared rolling statistics, so many agents reading the same
+    market neither copy the history nor recompute the statistics. The views alias the store's
+    buffer, so they describe the tick they were taken at; take a new MarketData every tick.
+    """
+
+    def __init__(self, store: TickStore, ticks: int = None):
+        self.store = store
+        self.ticks = ticks if ticks is not None else store.window
+        self._window = store.view(self.ticks)
+
+    def __getitem__(self, asset):
+        return self._window[:, self.store.index[asset]]
+
+    def __iter__(self):
+        return iter(self.store.names)
+
+    def __len__(self):
+        return len(self.store.names)
+
+    def stats(self, asset: str = None) -> dict:
+        """
+        Rolling statistics over the store's window, for one asset (as floats) or all (as arrays).
+        """
+        return self.store.asset_stats(asset) if asset is not None else self.store.stats()
+
+
+def price_insights(market_data) -> dict:
+    """
+    Average price and volatility (price range) of every asset with more than one price.
+    A MarketData covering the store's window answers from the shared rolling statistics, one
+    covering any other number of ticks from its own prices; plain asset -> price list dicts
+    are computed directly.
+    """
+    if isinstance(market_data, MarketData):
+        window = market_data._window
+        if len(window) < 2:
+            return {}
+        if market_data.ticks == market_data.store.window:
+            stats = market_data.stats()
+            means, lows, highs = stats["mean"], stats["min"], stats["max"]
+        else:
+            means, lows, highs = window.mean(axis=0), window.min(axis=0), window.max(axis=0)
+        return {item: {"average_price": mean, "volatility": high - low}
+                for item, mean, low, high in zip(market_data, means.tolist(), lows.tolist(), highs.tolist())}
+    insights = {}
+    for item, prices in market_data.items():
+        if len(prices) > 1:
+            insights[item] = {
+                "average_price": sum(prices) / len(prices),
+                "volatility": max(prices) - min(prices)
+            }
+    return insights
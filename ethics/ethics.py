@@ -1,7 +1,8 @@
 # NyXX/encephalon/ethics/ethics.py
 
-from NyXX.agents.agent import Agent
-from NyXX.utils.logging import log_info, log_error
+from organisms.agent import Agent
+from utils.loggings import log_info, log_error
+from utils.telemetry import get_event_sink
 
 class EthicsSystem:
     """
@@ -60,6 +61,9 @@ class EthicsSystem:
         # Penalties could range from reputation loss to restricted access to resources.
         agent.reputation -= 10
         log_error(f"Agent {agent.agent_id} has been penalized for unethical behavior. Reputation reduced.")
+        sink = get_event_sink()
+        if sink is not None:
+            sink.emit("penalty", agent_id=agent.agent_id, reason="unethical behavior", amount=10)
     
     def reward_ethics(self, agent: Agent):
         """
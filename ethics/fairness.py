@@ -1,7 +1,8 @@
 # NyXX/ethics/fairness.py
 
-from NyXX.agents.agent import Agent
-from NyXX.utils.logging import log_info, log_error
+from organisms.agent import Agent
+from utils.loggings import log_info, log_error
+from utils.telemetry import get_event_sink
 
 class FairnessSystem:
     """
@@ -47,3 +48,6 @@ class FairnessSystem:
         # Penalties could involve loss of resources or reputation.
         agent.reputation -= 30
         log_error(f"Agent {agent.agent_id} has been penalized for unfair behavior.")
+        sink = get_event_sink()
+        if sink is not None:
+            sink.emit("penalty", agent_id=agent.agent_id, reason="unfair behavior", amount=30)
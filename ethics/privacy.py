@@ -1,7 +1,8 @@
 # NyXX/encephalon/ethics/privacy.py
 
-from NyXX.agents.agent import Agent
-from NyXX.utils.logging import log_info, log_error
+from organisms.agent import Agent
+from utils.loggings import log_info, log_error
+from utils.telemetry import get_event_sink
 
 class PrivacySystem:
     """
@@ -43,3 +44,6 @@ class PrivacySystem:
         # Privacy violation penalties could include reputational damage or restricted access to systems.
         agent.reputation -= 20
         log_error(f"Agent {agent.agent_id} has been penalized for privacy violation. Reputation reduced.")
+        sink = get_event_sink()
+        if sink is not None:
+            sink.emit("penalty", agent_id=agent.agent_id, reason="privacy violation", amount=20)
@@ -1,32 +1,29 @@
 # NyXX/organisms/agent.py
 
-from organisms.citizen import Citizen
+from organisms.citizen import BaseCitizen, Citizen, CompactCitizen
 from abc import ABC, abstractmethod
 from datetime import datetime
 import logging
+import time
 import uuid
+from utils.loggings import log_hot
 
 
-class Agent(Citizen, ABC):
+class BaseAgent(BaseCitizen, ABC):
     """
-    An Agent is an evolved Citizen that has acquired sufficient foundational knowledge
-    to assume a specific role and perform specialized tasks.
+    The behaviour shared by every kind of agent. Like BaseCitizen it declares no instance
+    storage: Agent keeps its attributes in a __dict__, CompactAgent in __slots__.
     """
 
-    def __init__(self, citizen: Citizen, role: str, capabilities: list = None):
-        super().__init__(
-            name=citizen.name,
-            age=citizen.age,
-            metadata=citizen.metadata
-        )
-        self.agent_id = str(uuid.uuid4())
-        self.role = role
-        self.capabilities = capabilities if capabilities else []
-        self.knowledge_base = citizen.knowledge_base  # inherits what it learned as a citizen
-        self.status = "active"
-        self.creation_time = datetime.utcnow()
-        self.logger = logging.getLogger(f"Agent-{self.name}")
-        self.logger.info(f"[{self.creation_time}] Agent {self.name} (Role: {self.role}) initialized.")
+    __slots__ = ()
+
+    def init_role_state(self, rng=None):
+        """
+        Set up the role-specific state of the agent. Subclasses override this; it runs from
+        their __init__ and when the EvolutionPipeline turns a citizen into an agent in place.
+        :param rng: Optional NumPy Generator for agents that make random decisions.
+        """
+        pass
 
     @abstractmethod
     def perform_task(self, task: dict) -> dict:
@@ -54,16 +51,16 @@ class Agent(Citizen, ABC):
         """
         Send a message to another agent.
         """
-        self.logger.info(f"{self.name} -> {target_agent.name}: {message}")
+        log_hot(self.logger, "%s -> %s: %s", self.name, target_agent.name, message)
         target_agent.receive_message(message, self)
 
     def receive_message(self, message: str, sender: 'Agent'):
         """
         Receive and process a message from another agent.
         """
-        self.logger.info(f"{self.name} received message from {sender.name}: {message}")
+        log_hot(self.logger, "%s received message from %s: %s", self.name, sender.name, message)
         self.memory.append({
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": time.time(),
             "from": sender.name,
             "message": message
         })
@@ -79,10 +76,80 @@ class Agent(Citizen, ABC):
     def log_event(self, event: str):
         """
         Log any meaningful event in the agent’s lifetime.
+        Timestamps are stored as epoch floats to keep memory entries small.
         """
-        timestamp = datetime.utcnow()
-        self.logger.info(f"[{timestamp}] {self.name}: {event}")
+        timestamp = time.time()
+        log_hot(self.logger, "%s: %s", self.name, event)
         self.memory.append({
-            "timestamp": timestamp.isoformat(),
+            "timestamp": timestamp,
             "event": event
         })
+
+
+class Agent(Citizen, BaseAgent):
+    """
+    An Agent is an evolved Citizen that has acquired sufficient foundational knowledge
+    to assume a specific role and perform specialized tasks.
+    """
+
+    def __init__(self, citizen: BaseCitizen, role: str, capabilities: list = None):
+        super().__init__(name=citizen.name)
+        self.age = citizen.age
+        self.metadata = citizen.metadata
+        self.agent_id = str(uuid.uuid4())
+        self.role = role
+        self.capabilities = capabilities if capabilities else []
+        self.knowledge = citizen.knowledge  # inherits what it learned as a citizen
+        self.knowledge_total = citizen.knowledge_total
+        self.knowledge_base = getattr(citizen, "knowledge_base", [])
+        self.status = "active"
+        self.creation_time = datetime.utcnow()
+        self.logger = logging.getLogger(f"Agent-{self.name}")
+        self.logger.info(f"[{self.creation_time}] Agent {self.name} (Role: {self.role}) initialized.")
+
+
+class CompactAgent(BaseAgent, CompactCitizen):
+    """
+    The compact counterpart of Agent, built on CompactCitizen.
+    Agent state is slotted, the agent uuid is generated on demand, the citizen's knowledge and
+    metadata are shared rather than copied, and all compact agents log through one shared logger.
+    Subclasses implement perform_task() exactly like regular agents, and declare
+    `__slots__ = ()` (or their own slots) to stay free of a per-instance __dict__.
+    """
+
+    __slots__ = ("_agent_id", "capabilities", "_knowledge_base")
+
+    logger = logging.getLogger("Agent")
+
+    def __init__(self, citizen: BaseCitizen, role: str, capabilities: list = None):
+        CompactCitizen.__init__(self, name=citizen.name)
+        self.age = citizen.age
+        self.role = role
+        self.status = "active"
+        self._agent_id = None
+        self.capabilities = capabilities if capabilities else []
+        self._knowledge = citizen.knowledge  # inherits what it learned as a citizen
+        self.knowledge_total = citizen.knowledge_total
+        self._metadata = citizen.metadata
+        self._knowledge_base = getattr(citizen, "knowledge_base", None)
+        self.logger.debug("Agent %s (Role: %s) initialized.", self.name, role)
+
+    @property
+    def agent_id(self) -> str:
+        """
+        The agent's uuid, generated the first time it is needed.
+        """
+        if self._agent_id is None:
+            self._agent_id = str(uuid.uuid4())
+        return self._agent_id
+
+    @property
+    def knowledge_base(self):
+        if self._knowledge_base is None:
+            self._knowledge_base = []
+        return self._knowledge_base
+
+    @knowledge_base.setter
+    def knowledge_base(self, value):
+        self._knowledge_base = value
+
@@ -1,13 +1,20 @@
 # digital_civilization/agents/agent_types/analyst.py
 
 from ..agent import Agent
+from environment.tick_store import price_insights
 from datetime import datetime
 import numpy as np
 
 class AnalystAgent(Agent):
-    def __init__(self, name: str, domain: str = "strategy"):
-        super().__init__(name=name, role="Analyst", capabilities=["interpret", "predict", "recommend"])
+    default_capabilities = ("interpret", "predict", "recommend")
+
+    def __init__(self, citizen, domain: str = "strategy"):
+        super().__init__(citizen=citizen, role="Analyst", capabilities=list(self.default_capabilities))
+        self.init_role_state()
         self.domain = domain
+
+    def init_role_state(self, rng=None):
+        self.domain = "strategy"
         self.insights_archive = []
         self.resources = 100  # Add this if the agent doesn't manage resources.
         self.reputation = 3  # Reputation attribute.
@@ -34,16 +41,9 @@ class AnalystAgent(Agent):
         if not market_data:
             return {"agent_id": self.agent_id, "insights": None}
 
-        # Simple analysis: compute volatility or other stats
-        insights = {}
-        for item, prices in market_data.items():
-            if len(prices) > 1:
-                avg_price = sum(prices) / len(prices)
-                volatility = max(prices) - min(prices)
-                insights[item] = {
-                    "average_price": avg_price,
-                    "volatility": volatility
-                }
+        # Simple analysis: average price and volatility, shared with other agents when the
+        # data comes from the market's tick store
+        insights = price_insights(market_data)
 
         return {
             "agent_id": self.agent_id,
@@ -1,14 +1,21 @@
 # digital_civilization/agents/agent_types/optimizer.py
 
 from ..agent import Agent
+from environment.tick_store import price_insights
 import numpy as np
-import random
 from datetime import datetime
 
 class OptimizerAgent(Agent):
-    def __init__(self, name: str, objective: str = "maximize_output"):
-        super().__init__(name=name, role="Optimizer", capabilities=["tune", "evolve", "refactor"])
+    default_capabilities = ("tune", "evolve", "refactor")
+
+    def __init__(self, citizen, objective: str = "maximize_output", rng=None):
+        super().__init__(citizen=citizen, role="Optimizer", capabilities=list(self.default_capabilities))
+        self.init_role_state(rng)
         self.objective = objective
+
+    def init_role_state(self, rng=None):
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.objective = "maximize_output"
         self.optimization_log = []
         self.resources = 0  # Add this if the agent doesn't manage resources.
         self.reputation = 0  # Reputation attribute.
@@ -22,16 +29,9 @@ class OptimizerAgent(Agent):
         if not market_data:
             return {"agent_id": self.agent_id, "insights": None}
 
-        # Simple analysis: compute volatility or other stats
-        insights = {}
-        for item, prices in market_data.items():
-            if len(prices) > 1:
-                avg_price = sum(prices) / len(prices)
-                volatility = max(prices) - min(prices)
-                insights[item] = {
-                    "average_price": avg_price,
-                    "volatility": volatility
-                }
+        # Simple analysis: average price and volatility, shared with other agents when the
+        # data comes from the market's tick store
+        insights = price_insights(market_data)
 
         return {
             "agent_id": self.agent_id,
@@ -93,8 +93,8 @@ class OptimizerAgent(Agent):
         child = self._crossover(top[0][0], top[1][0])
 
         # "Mutation"
-        mutation_index = random.randint(0, len(child)-1)
-        child[mutation_index] = random.random()
+        mutation_index = int(self.rng.integers(len(child)))
+        child[mutation_index] = self.rng.random()
 
         self.log_event("Evolved next generation with crossover + mutation.")
         return {"status": "success", "next_gen": child, "top_fitness": top[0][1]}
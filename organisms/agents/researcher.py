@@ -1,14 +1,21 @@
 # digital_civilization/agents/agent_types/researcher.py
 
 from ..agent import Agent
-import random
+import numpy as np
 from datetime import datetime
 import math
 
 class ResearcherAgent(Agent):
-    def __init__(self, name: str, domain: str = "general"):
-        super().__init__(name=name, role="Researcher", capabilities=["analyze", "generate_hypothesis", "run_experiments"])
+    default_capabilities = ("analyze", "generate_hypothesis", "run_experiments")
+
+    def __init__(self, citizen, domain: str = "general", rng=None):
+        super().__init__(citizen=citizen, role="Researcher", capabilities=list(self.default_capabilities))
+        self.init_role_state(rng)
         self.domain = domain
+
+    def init_role_state(self, rng=None):
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.domain = "general"
         self.knowledge_base = {}  # concept -> insight
         self.research_log = []
         self.resources = 100  # Add this if the agent doesn't manage resources.
@@ -73,7 +80,7 @@ class ResearcherAgent(Agent):
         """
         Simulate a basic experiment using parameters.
         """
-        outcome = random.choice(["positive", "negative", "inconclusive"])
+        outcome = ("positive", "negative", "inconclusive")[self.rng.integers(3)]
         result = {
             "parameters": parameters,
             "outcome": outcome,
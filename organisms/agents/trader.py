@@ -1,8 +1,9 @@
 # NyXX/organisms/agents/trader.py
 
 from organisms.agent import Agent
-import random
 import logging
+import numpy as np
+from utils.loggings import log_hot
 
 
 class Trader(Agent):
@@ -12,14 +13,21 @@ class Trader(Agent):
     reinforcement learning-based pricing, or game-theoretic bargaining.
     """
 
-    def __init__(self, citizen, market_knowledge=None):
-        super().__init__(citizen=citizen, role="trader", capabilities=["trade", "negotiate", "evaluate"])
+    default_capabilities = ("trade", "negotiate", "evaluate")
+
+    def __init__(self, citizen, market_knowledge=None, rng=None):
+        super().__init__(citizen=citizen, role="Trader", capabilities=list(self.default_capabilities))
+        self.init_role_state(rng)
         self.market_knowledge = market_knowledge if market_knowledge else []
-        self.inventory = []  # Holds items available for trade
-        self.trade_history = []
         self.logger = logging.getLogger(f"Trader-{self.name}")
         self.logger.info(f"Trader {self.name} is ready to barter in the bazaar.")
 
+    def init_role_state(self, rng=None):
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.market_knowledge = []
+        self.inventory = []  # Holds items available for trade
+        self.trade_history = []
+
     def perform_task(self, task: dict) -> dict:
         """
         Perform a trading task. The task dict can include 'action', 'item', 'value', etc.
@@ -44,7 +52,7 @@ class Trader(Agent):
         """
         self.inventory.append(item)
         self.trade_history.append({"type": "buy", "item": item, "value": value})
-        self.logger.info(f"{self.name} bought {item} for {value}")
+        log_hot(self.logger, "%s bought %s for %s", self.name, item, value)
         return {"status": "success", "action": "buy", "item": item, "value": value}
 
     def sell(self, item, value):
@@ -54,7 +62,7 @@ class Trader(Agent):
         if item in self.inventory:
             self.inventory.remove(item)
             self.trade_history.append({"type": "sell", "item": item, "value": value})
-            self.logger.info(f"{self.name} sold {item} for {value}")
+            log_hot(self.logger, "%s sold %s for %s", self.name, item, value)
             return {"status": "success", "action": "sell", "item": item, "value": value}
         else:
             self.logger.warning(f"{self.name} tried to sell {item}, but it was not in inventory.")
@@ -65,7 +73,7 @@ class Trader(Agent):
         Use random market simulation to evaluate an item's potential value.
         Can be replaced by ML predictors later.
         """
-        estimated_value = random.uniform(10, 100)
+        estimated_value = self.rng.uniform(10, 100)
         self.market_knowledge.append({"item": item, "estimated_value": estimated_value})
-        self.logger.info(f"{self.name} evaluated {item} at {estimated_value}")
+        log_hot(self.logger, "%s evaluated %s at %s", self.name, item, estimated_value)
         return {"status": "success", "action": "evaluate", "item": item, "estimated_value": estimated_value}
@@ -3,6 +3,9 @@
 import json
 from datetime import datetime
 from typing import Any, Dict, List
+from utils.loggings import log_hot, get_logger
+
+logger = get_logger(__name__)
 
 class Message:
     """
@@ -52,11 +55,11 @@ class CommunicationModule:
     def send(self, receiver_id: str, msg_type: str, content: Dict[str, Any]):
         msg = Message(self.agent_id, receiver_id, msg_type, content)
         self.outbox.append(msg)
-        print(f"[{self.agent_id}] Queued message to {receiver_id}: {msg_type}")
+        log_hot(logger, "[%s] Queued message to %s: %s", self.agent_id, receiver_id, msg_type)
 
     def receive(self, message: Message):
         self.inbox.append(message)
-        print(f"[{self.agent_id}] Received message from {message.sender_id}: {message.msg_type}")
+        log_hot(logger, "[%s] Received message from %s: %s", self.agent_id, message.sender_id, message.msg_type)
 
     def process_inbox(self):
         responses = []
@@ -68,7 +71,7 @@ class CommunicationModule:
         return responses
 
     def _handle_message(self, message: Message) -> Any:
-        print(f"[{self.agent_id}] Processing message: {message.msg_type}")
+        log_hot(logger, "[%s] Processing message: %s", self.agent_id, message.msg_type)
         if message.msg_type == "request":
             return self._handle_request(message.content)
         elif message.msg_type == "negotiate":
@@ -85,4 +88,4 @@ class CommunicationModule:
         return {"status": "negotiated", "details": content}
 
     def _handle_broadcast(self, content: Dict[str, Any]) -> None:
-        print(f"[{self.agent_id}] Received broadcast: {content}")
+        log_hot(logger, "[%s] Received broadcast: %s", self.agent_id, content)
@@ -1,8 +1,11 @@
 # digital_civilization/agents/behavior/learning.py
 
-import random
+import time
 import numpy as np
 from collections import defaultdict
+from utils.loggings import log_hot, get_logger
+
+logger = get_logger(__name__)
 
 class LearningModule:
     """
@@ -10,7 +13,8 @@ class LearningModule:
     Supports Q-Learning for now. Can be extended to Deep RL, evolutionary strategies, imitation learning, etc.
     """
 
-    def __init__(self, learning_rate=0.1, discount_factor=0.95, exploration_rate=0.2):
+    def __init__(self, learning_rate=0.1, discount_factor=0.95, exploration_rate=0.2, rng=None):
+        self.rng = rng if rng is not None else np.random.default_rng()
         self.q_table = defaultdict(lambda: defaultdict(float))
         self.alpha = learning_rate
         self.gamma = discount_factor
@@ -21,14 +25,14 @@ class LearningModule:
         """
         Chooses an action using an epsilon-greedy strategy.
         """
-        if random.random() < self.epsilon:
-            action = random.choice(possible_actions)
-            self._log_event(f"Exploring: chose random action {action}")
+        if self.rng.random() < self.epsilon:
+            action = possible_actions[self.rng.integers(len(possible_actions))]
+            self._log_event("Exploring: chose random action %s", action)
             return action
         else:
             q_values = {a: self.q_table[state][a] for a in possible_actions}
             max_action = max(q_values, key=q_values.get)
-            self._log_event(f"Exploiting: chose best action {max_action} with Q-value {q_values[max_action]:.3f}")
+            self._log_event("Exploiting: chose best action %s with Q-value %.3f", max_action, q_values[max_action])
             return max_action
 
     def update(self, state, action, reward, next_state, possible_next_actions):
@@ -41,16 +45,21 @@ class LearningModule:
         self.q_table[state][action] = new_value
 
         self._log_event(
-            f"Updated Q({state}, {action}) from {old_value:.3f} to {new_value:.3f} with reward {reward}, next best {max_q_next:.3f}"
+            "Updated Q(%s, %s) from %.3f to %.3f with reward %s, next best %.3f",
+            state, action, old_value, new_value, reward, max_q_next
         )
 
     def get_q_table(self):
         return dict(self.q_table)
 
-    def _log_event(self, message):
-        self.learning_log.append({"timestamp": self._timestamp(), "message": message})
-        print(f"[LearningModule] {message}")
+    def get_learning_log(self):
+        """
+        Return the learning log with each message formatted.
+        """
+        return [{"timestamp": entry["timestamp"], "message": entry["message"] % entry["args"]}
+                for entry in self.learning_log]
 
-    def _timestamp(self):
-        from datetime import datetime
-        return datetime.utcnow().isoformat()
+    def _log_event(self, message, *args):
+        # Messages are kept unformatted (%-style template plus args) and only formatted on read
+        self.learning_log.append({"timestamp": time.time(), "message": message, "args": args})
+        log_hot(logger, "[LearningModule] " + message, *args)
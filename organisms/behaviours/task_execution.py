@@ -3,6 +3,9 @@
 from typing import Dict, Any, List
 from time import sleep
 import random
+from utils.loggings import log_info, log_error, log_hot, get_logger
+
+logger = get_logger(__name__)
 
 class Task:
     """
@@ -36,18 +39,18 @@ class TaskExecutor:
         self.task_queue: List[Task] = []
 
     def add_task(self, task: Task):
-        print(f"[{self.agent_id}] Task added to queue: {task.task_id} ({task.task_type})")
+        log_hot(logger, "[%s] Task added to queue: %s (%s)", self.agent_id, task.task_id, task.task_type)
         self.task_queue.append(task)
 
     def execute_all(self):
-        print(f"[{self.agent_id}] Executing all queued tasks...")
+        log_info("[%s] Executing all queued tasks...", self.agent_id)
         for task in self.task_queue:
             self._execute_task(task)
         self.task_queue.clear()
 
     def _execute_task(self, task: Task):
         task.status = "in_progress"
-        print(f"[{self.agent_id}] Executing task: {task.task_type} with params {task.parameters}")
+        log_hot(logger, "[%s] Executing task: %s with params %s", self.agent_id, task.task_type, task.parameters)
         
         try:
             # Simulate task execution time
@@ -64,11 +67,11 @@ class TaskExecutor:
                 task.result = {"note": "No-op or unknown task."}
 
             task.status = "completed"
-            print(f"[{self.agent_id}] Task {task.task_id} completed.")
+            log_hot(logger, "[%s] Task %s completed.", self.agent_id, task.task_id)
         except Exception as e:
             task.status = "failed"
             task.result = {"error": str(e)}
-            print(f"[{self.agent_id}] Task {task.task_id} failed: {e}")
+            log_error("[%s] Task %s failed: %s", self.agent_id, task.task_id, e)
 
     def _analyze_data(self, params: Dict[str, Any]) -> Dict[str, Any]:
         # Placeholder for data analysis logic
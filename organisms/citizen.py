@@ -1,44 +1,70 @@
 import uuid
 import logging
 from datetime import datetime
+from itertools import count, islice
 import random
+import time
+from utils.loggings import log_hot
+from utils.telemetry import get_event_sink
 
+# Roles a citizen can be assigned once it evolves
+ROLES = ['Trader', 'Researcher', 'Farmer', 'Medic', 'Engineer']
+_ROLE_NAMES = {role.lower(): role for role in ROLES}
 
-class Citizen:
+
+def normalize_role(role):
     """
-    A Citizen is a digital organism that starts its life in the environment, learns, and evolves into an agent when ready.
-    This class defines how a citizen is born, learns from data sources, and prepares to take on roles in the future.
+    The canonical spelling of a role name: as listed in ROLES, otherwise capitalized ("analyst" -> "Analyst").
     """
+    if not role:
+        return role
+    return _ROLE_NAMES.get(role.lower()) or role[:1].upper() + role[1:]
 
-    def __init__(self, name: str, learning_data: list = None):
-        """
-        Initialize a new citizen. 
-        Citizens start with a basic understanding and are learning organisms.
-        """
-        self.citizen_id = str(uuid.uuid4())
-        self.name = name
-        self.creation_time = datetime.utcnow()
-        self.memory = []  # Memory bank to store experiences
-        self.learning_data = learning_data if learning_data else []  # Data the citizen will learn from
-        self.knowledge = {}  # Holds knowledge accumulated by the citizen
-        self.status = "idle"  # Citizen starts in an idle state
-        self.age = 0  # Initial age (could be calculated or updated over time)
-        self.metadata = {}  # Metadata to store additional info like role and timestamps
-        self.logger = logging.getLogger(f"Citizen-{self.name}")
-        self.logger.info(f"[{self.creation_time}] Citizen {self.name} initialized.")
-        self.learning_enabled = True  # Flag to control if the citizen is still learning
-        self.role = None  # Role will be assigned when evolved
-        
-    def setup_logger(self):
-        # Logger setup (if you need it)
-        import logging
-        logger = logging.getLogger(self.name)
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter('%(asctime)s - %(message)s')
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        logger.setLevel(logging.INFO)
-        return logger
+
+class BaseCitizen:
+    """
+    The behaviour shared by every kind of citizen: learning, acting, evolving and the
+    registry-aware status and role. It declares no instance storage, so each subclass picks
+    its own layout: Citizen keeps its attributes in a per-instance __dict__, CompactCitizen
+    in __slots__.
+    """
+
+    __slots__ = ()
+
+    # Factory for the memory store of new citizens; swap for e.g. `lambda: RingMemory(500)`
+    # (see organisms.memory) to bound the memory of every citizen created afterwards.
+    memory_factory = list
+
+    # The OrganismRegistry (see environment.registry) indexing this citizen, if any.
+    # Status and role changes are reported to it so its indexes stay current.
+    _registry = None
+
+    @property
+    def status(self) -> str:
+        return self._status
+
+    @status.setter
+    def status(self, value: str):
+        registry = self._registry
+        if registry is None:
+            self._status = value
+        else:
+            old, self._status = self._status, value
+            registry.reindex(self, "status", old, value)
+
+    @property
+    def role(self):
+        return self._role
+
+    @role.setter
+    def role(self, value):
+        value = normalize_role(value)
+        registry = self._registry
+        if registry is None:
+            self._role = value
+        else:
+            old, self._role = self._role, value
+            registry.reindex(self, "role", old, value)
 
     def learn(self, environment):
         """
@@ -46,32 +72,53 @@ class Citizen:
         The citizen will "learn" by processing and storing knowledge from its environment.
         """
         if not self.learning_enabled:
-            self.logger.info(f"Citizen {self.name} has reached the learning threshold and can no longer learn.")
+            log_hot(self.logger, "Citizen %s has reached the learning threshold and can no longer learn.", self.name)
             return
 
         # Simulate learning from the environment
         data = environment.get_random_facts()  # Get a random fact from the environment
-        self.memory.append(data)
-        self.knowledge[data] = self.knowledge.get(data, 0) + 1  # Increase knowledge of that fact
-        self.logger.info(f"Citizen {self.name} learned: {data}. Knowledge: {self.knowledge[data]}")
+        self.learn_many((data,))
+
+    def learn_many(self, facts) -> int:
+        """
+        Apply a batch of observed facts in one call.
+        Each fact costs constant time; facts beyond the evolution threshold are ignored,
+        since the citizen stops learning once it is ready to evolve.
+        :return: The number of facts actually learned.
+        """
+        if not self.learning_enabled:
+            log_hot(self.logger, "Citizen %s has reached the learning threshold and can no longer learn.", self.name)
+            return 0
+
+        memory = self.memory
+        knowledge = self.knowledge
+        learned = 0
+        for data in islice(facts, max(self.evolution_threshold - self.knowledge_total, 0)):
+            memory.append(data)
+            knowledge[data] = knowledge.get(data, 0) + 1  # Increase knowledge of that fact
+            learned += 1
+        self.knowledge_total += learned
+        log_hot(self.logger, "Citizen %s learned %d facts. Knowledge: %d", self.name, learned, self.knowledge_total)
 
         # Check if the citizen has learned enough to evolve
-        if sum(self.knowledge.values()) >= 5:  # Threshold for evolution (can be adjusted)
+        if self.knowledge_total >= self.evolution_threshold:
             self.status = "ready to evolve"
             self.learning_enabled = False  # Stop learning once threshold is reached
-            self.logger.info(f"Citizen {self.name} has gained enough knowledge to evolve and will stop learning.")
+            log_hot(self.logger, "Citizen %s has gained enough knowledge to evolve and will stop learning.", self.name)
+        return learned
 
-    def act(self):
+    def act(self, rng=None):
         """
         Once a citizen has evolved enough, they can take action.
         For now, this function could be a placeholder for when the citizen is ready to become an agent.
+        :param rng: Optional NumPy Generator used for role assignment.
         """
         if self.status == "ready to evolve":
-            self.logger.info(f"Citizen {self.name} is now taking action as an agent.")
-            self.evolve_and_assign_role()  # Ensure evolution and role assignment
+            log_hot(self.logger, "Citizen %s is now taking action as an agent.", self.name)
+            self.evolve_and_assign_role(rng)  # Ensure evolution and role assignment
             self.status = "evolved"
         else:
-            self.logger.info(f"Citizen {self.name} is still idle, waiting to evolve.")
+            log_hot(self.logger, "Citizen %s is still idle, waiting to evolve.", self.name)
 
     def update_status(self, new_status: str):
         """
@@ -93,29 +140,163 @@ class Citizen:
             "metadata": self.metadata
         }
 
-    def evolve_and_assign_role(self):
+    def evolve_and_assign_role(self, rng=None):
         """
         Check if a citizen has gained enough knowledge to evolve. If so, assign a role and log the evolution.
+        :param rng: Optional NumPy Generator used to pick the role; the global `random` module is used otherwise.
         """
         if self.status != "ready to evolve":
-            self.logger.info(f"Citizen {self.name} has not reached the threshold to evolve.")
+            log_hot(self.logger, "Citizen %s has not reached the threshold to evolve.", self.name)
             return
 
         self.status = "evolved"
-        self.logger.info(f"Citizen {self.name} has evolved based on accumulated knowledge.")
+        log_hot(self.logger, "Citizen %s has evolved based on accumulated knowledge.", self.name)
 
         # Assign a random role to the citizen once they evolve
-        roles = ['Trader', 'Researcher', 'Farmer', 'Medic', 'Engineer']
+        roles = ROLES
 
         if not roles:
             self.logger.error("No roles available to assign!")
             return
 
         # Randomly choose a role
-        self.role = random.choice(roles)
+        self.role = roles[rng.integers(len(roles))] if rng is not None else random.choice(roles)
 
         # Log the assigned role
-        self.logger.info(f"Citizen {self.name} has evolved into a {self.role}.")
+        log_hot(self.logger, "Citizen %s has evolved into a %s.", self.name, self.role)
+        sink = get_event_sink()
+        if sink is not None:
+            sink.emit("evolution", citizen_id=self.citizen_id, name=self.name, role=self.role)
 
     def __repr__(self):
         return f"<Citizen name={self.name}, role={self.role if self.role else 'None'}, status={self.status}>"
+
+
+class Citizen(BaseCitizen):
+    """
+    A Citizen is a digital organism that starts its life in the environment, learns, and evolves into an agent when ready.
+    This class defines how a citizen is born, learns from data sources, and prepares to take on roles in the future.
+    """
+
+    def __init__(self, name: str, learning_data: list = None, evolution_threshold: int = 5, memory=None):
+        """
+        Initialize a new citizen. 
+        Citizens start with a basic understanding and are learning organisms.
+        :param evolution_threshold: Total knowledge needed before the citizen is ready to evolve.
+        :param memory: Optional memory store (e.g. a RingMemory); defaults to memory_factory().
+        """
+        self.citizen_id = str(uuid.uuid4())
+        self.name = name
+        self.creation_time = datetime.utcnow()
+        self.memory = memory if memory is not None else self.memory_factory()  # Memory bank to store experiences
+        self.learning_data = learning_data if learning_data else []  # Data the citizen will learn from
+        self.knowledge = {}  # Holds knowledge accumulated by the citizen
+        self.knowledge_total = 0  # Running sum of knowledge counts, kept in step by learn_many()
+        self.evolution_threshold = evolution_threshold
+        self.status = "idle"  # Citizen starts in an idle state
+        self.age = 0  # Initial age (could be calculated or updated over time)
+        self.metadata = {}  # Metadata to store additional info like role and timestamps
+        self.logger = logging.getLogger(f"Citizen-{self.name}")
+        self.logger.info(f"[{self.creation_time}] Citizen {self.name} initialized.")
+        self.learning_enabled = True  # Flag to control if the citizen is still learning
+        self.role = None  # Role will be assigned when evolved
+        
+    def setup_logger(self):
+        # Logger setup (if you need it)
+        import logging
+        logger = logging.getLogger(self.name)
+        handler = logging.StreamHandler()
+        formatter = logging.Formatter('%(asctime)s - %(message)s')
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        return logger
+
+
+class CompactCitizen(BaseCitizen):
+    """
+    A memory-compact Citizen for very large or fast-churning populations.
+    Attributes live in __slots__ (no class in its hierarchy has a __dict__), the
+    memory/knowledge/metadata containers are only created when first used, the citizen is
+    identified by a process-wide integer (its uuid is generated on demand), and all compact
+    citizens share one class-level logger instead of registering a new logger per name in the
+    global logging manager.
+    """
+
+    __slots__ = ("uid", "name", "_status", "age", "learning_enabled", "_role", "knowledge_total", "evolution_threshold",
+                 "_registry", "_citizen_id", "_created", "_memory", "_knowledge", "_metadata", "_learning_data")
+
+    logger = logging.getLogger("Citizen")
+    _next_uid = count(1)
+
+    def __init__(self, name: str, learning_data: list = None, evolution_threshold: int = 5, memory=None):
+        self.uid = next(CompactCitizen._next_uid)
+        self.name = name
+        self._registry = None
+        self._status = "idle"
+        self.age = 0
+        self.learning_enabled = True
+        self._role = None
+        self.knowledge_total = 0
+        self.evolution_threshold = evolution_threshold
+        self._citizen_id = None
+        self._created = time.time()
+        self._memory = memory
+        self._knowledge = None
+        self._metadata = None
+        self._learning_data = learning_data
+        self.logger.debug("Citizen %s initialized.", name)
+
+    @property
+    def citizen_id(self) -> str:
+        """
+        The citizen's uuid, generated the first time it is needed.
+        """
+        if self._citizen_id is None:
+            self._citizen_id = str(uuid.uuid4())
+        return self._citizen_id
+
+    @property
+    def creation_time(self) -> datetime:
+        return datetime.utcfromtimestamp(self._created)
+
+    @property
+    def memory(self):
+        if self._memory is None:
+            self._memory = self.memory_factory()
+        return self._memory
+
+    @memory.setter
+    def memory(self, value):
+        self._memory = value
+
+    @property
+    def knowledge(self):
+        if self._knowledge is None:
+            self._knowledge = {}
+        return self._knowledge
+
+    @knowledge.setter
+    def knowledge(self, value):
+        self._knowledge = value
+
+    @property
+    def metadata(self):
+        if self._metadata is None:
+            self._metadata = {}
+        return self._metadata
+
+    @metadata.setter
+    def metadata(self, value):
+        self._metadata = value
+
+    @property
+    def learning_data(self):
+        if self._learning_data is None:
+            self._learning_data = []
+        return self._learning_data
+
+    @learning_data.setter
+    def learning_data(self, value):
+        self._learning_data = value
+
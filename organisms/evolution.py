@@ -0,0 +1,125 @@
+# NyXX/organisms/evolution.py
+
+import time
+import uuid
+import numpy as np
+from organisms.citizen import ROLES, normalize_role
+from organisms.agent import BaseAgent
+from organisms.agents.trader import Trader
+from organisms.agents.researcher import ResearcherAgent
+from organisms.agents.analyst import AnalystAgent
+from organisms.agents.optimizer import OptimizerAgent
+from utils.loggings import log_info
+from utils.telemetry import get_event_sink
+
+# Agent classes by the role they hold
+AGENT_CLASSES = {
+    "Trader": Trader,
+    "Researcher": ResearcherAgent,
+    "Analyst": AnalystAgent,
+    "Optimizer": OptimizerAgent,
+}
+
+# Agent class each evolved citizen role turns into; roles without a class stay citizens holding the role.
+# Pipelines drawing more roles (e.g. "Analyst") pass their own mapping, such as AGENT_CLASSES.
+ROLE_CLASSES = {role: AGENT_CLASSES[role] for role in ROLES if role in AGENT_CLASSES}
+
+
+class EvolutionPipeline:
+    """
+    Evolves every ready citizen of a tick in one batch.
+    Roles for the whole batch are drawn in a single call, and each citizen is turned into the
+    agent class of its role in place: its class is switched and only the agent-specific state
+    is added, so knowledge, memory, metadata and logger are reused instead of copied by a
+    per-object Agent.__init__. Citizens whose memory layout cannot take the agent class
+    (e.g. slotted CompactCitizens) are evolved into their role without changing class.
+    """
+
+    def __init__(self, role_classes: dict = None, roles: list = None, rng=None):
+        """
+        :param role_classes: Role -> Agent subclass; defaults to ROLE_CLASSES.
+        :param roles: Roles to draw from; defaults to the citizen ROLES.
+        :param rng: NumPy Generator used to draw roles (and handed to the new agents).
+        """
+        role_classes = role_classes if role_classes is not None else ROLE_CLASSES
+        self.role_classes = {normalize_role(role): agent_class for role, agent_class in role_classes.items()}
+        self.roles = [normalize_role(role) for role in roles] if roles is not None else ROLES
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.evolved = 0  # Citizens evolved over the pipeline's lifetime
+        self.converted = 0  # Of those, citizens turned into agent classes
+        self.elapsed = 0.0  # Seconds spent evolving
+
+    def run(self, citizens) -> list:
+        """
+        Evolve every citizen in `citizens` that is ready to evolve.
+        :return: The evolved organisms (agents where a class exists for their role).
+        """
+        ready = [citizen for citizen in citizens if citizen.status == "ready to evolve"]
+        if not ready:
+            return []
+
+        start = time.perf_counter()
+        codes = self.rng.integers(len(self.roles), size=len(ready))
+        converted = 0
+        for citizen, code in zip(ready, codes.tolist()):
+            role = self.roles[code]
+            agent_class = self.role_classes.get(role)
+            if agent_class is not None and self._convert(citizen, agent_class, role):
+                converted += 1
+            else:
+                citizen.status = "evolved"
+                citizen.role = role
+        elapsed = time.perf_counter() - start
+
+        self.evolved += len(ready)
+        self.converted += converted
+        self.elapsed += elapsed
+        sink = get_event_sink()
+        if sink is not None:
+            for citizen in ready:
+                sink.emit("evolution", citizen_id=citizen.citizen_id, name=citizen.name, role=citizen.role)
+        log_info("Evolved %d citizens (%d into agents) at %.0f evolutions/s.",
+                 len(ready), converted, len(ready) / elapsed if elapsed else float("inf"))
+        return ready
+
+    def run_environment(self, environment) -> list:
+        """
+        Evolve every ready citizen registered in an environment.
+        """
+        return self.run(environment.organisms.ready_to_evolve())
+
+    def _convert(self, citizen, agent_class, role: str) -> bool:
+        """
+        Turn a citizen into an instance of `agent_class` without rebuilding it.
+        :return: False if the citizen's layout cannot take the agent class.
+        """
+        if isinstance(citizen, BaseAgent):
+            return False
+        try:
+            citizen.__class__ = agent_class
+        except TypeError:
+            return False
+        citizen.agent_id = str(uuid.uuid4())
+        citizen.capabilities = list(agent_class.default_capabilities)
+        citizen.knowledge_base = []
+        citizen.init_role_state(self.rng)
+        citizen.role = role
+        citizen.status = "active"
+        if citizen._registry is not None:
+            citizen._registry.index_agent(citizen)
+        return True
+
+    @property
+    def evolutions_per_second(self) -> float:
+        """
+        Throughput over the pipeline's lifetime.
+        """
+        return self.evolved / self.elapsed if self.elapsed else 0.0
+
+    def get_stats(self) -> dict:
+        return {
+            "evolved": self.evolved,
+            "converted": self.converted,
+            "elapsed": self.elapsed,
+            "evolutions_per_second": self.evolutions_per_second,
+        }
@@ -0,0 +1,159 @@
+# NyXX/organisms/memory.py
+
+import json
+import os
+import threading
+import weakref
+from collections import deque
+
+
+class _SpillWriter:
+    """
+    One append handle per spill file, shared by every RingMemory spilling to it.
+    Batches of lines are written under a lock, so memories sharing a file never interleave
+    partial lines, and thousands of memories cost one file descriptor per file.
+    """
+
+    _writers = {}  # Absolute path -> _SpillWriter
+    _writers_lock = threading.Lock()
+
+    def __init__(self, path: str):
+        self.path = path
+        self.users = 0
+        self._file = open(path, "a")
+        self._lock = threading.Lock()
+
+    @classmethod
+    def acquire(cls, path: str) -> "_SpillWriter":
+        path = os.path.abspath(path)
+        with cls._writers_lock:
+            writer = cls._writers.get(path)
+            if writer is None:
+                writer = cls._writers[path] = cls(path)
+            writer.users += 1
+            return writer
+
+    def write(self, lines: list):
+        if lines:
+            with self._lock:
+                self._file.write("".join(lines))
+
+    def flush(self):
+        with self._lock:
+            self._file.flush()
+
+    def release(self):
+        """
+        Drop one user; the file is closed when the last one is gone.
+        """
+        with self._writers_lock:
+            self.users -= 1
+            if self.users > 0:
+                return
+            self._writers.pop(self.path, None)
+        with self._lock:
+            self._file.close()
+
+
+def _finish_spill(writer: _SpillWriter, pending: list):
+    """
+    Write a memory's pending lines and release its writer; runs on close(), when the memory is
+    collected, or at interpreter exit.
+    """
+    writer.write(pending)
+    pending.clear()
+    writer.release()
+
+
+class RingMemory:
+    """
+    A fixed-capacity memory store for citizens and agents.
+    Behaves like the plain list a Citizen normally uses for its memory, but only keeps the
+    most recent `capacity` entries. Evicted entries can optionally be spilled to disk as
+    JSON lines, so long-running organisms keep a flat memory footprint without losing history.
+    Spilled lines are handed in batches to a writer shared by every memory spilling to the same file.
+    """
+
+    def __init__(self, capacity: int = 1000, spill_path: str = None, spill_batch: int = 100):
+        """
+        :param capacity: Maximum number of entries kept in memory.
+        :param spill_path: Optional file that evicted entries are appended to (one JSON object per line).
+        :param spill_batch: Number of evicted entries buffered before they are written.
+        """
+        if capacity < 1:
+            raise ValueError("RingMemory capacity must be at least 1.")
+        self.capacity = capacity
+        self.spill_path = spill_path
+        self.evicted = 0  # Number of entries pushed out of the ring so far
+        self.spill_batch = spill_batch
+        self._entries = deque(maxlen=capacity)
+        self._spill_writer = None
+        self._spill_pending = []  # Encoded lines not handed to the writer yet
+        self._spill_finalizer = None
+
+    def append(self, entry):
+        """
+        Store an entry, evicting (and optionally spilling) the oldest one when full.
+        """
+        if len(self._entries) == self.capacity:
+            self._evict(self._entries[0])
+        self._entries.append(entry)
+
+    def extend(self, entries):
+        for entry in entries:
+            self.append(entry)
+
+    def _evict(self, entry):
+        self.evicted += 1
+        if self.spill_path is None:
+            return
+        if self._spill_writer is None:
+            self._spill_writer = _SpillWriter.acquire(self.spill_path)
+            self._spill_pending = []
+            self._spill_finalizer = weakref.finalize(self, _finish_spill, self._spill_writer, self._spill_pending)
+        pending = self._spill_pending
+        pending.append(json.dumps(entry, default=str) + "\n")
+        if len(pending) >= self.spill_batch:
+            self._spill_writer.write(pending)
+            pending.clear()
+
+    def flush(self):
+        """
+        Write buffered spilled entries and flush them to disk.
+        """
+        if self._spill_writer is not None:
+            self._spill_writer.write(self._spill_pending)
+            self._spill_pending.clear()
+            self._spill_writer.flush()
+
+    def __getstate__(self):
+        # A writer is acquired again on the next eviction after unpickling
+        self.flush()
+        state = self.__dict__.copy()
+        state.update(_spill_writer=None, _spill_pending=[], _spill_finalizer=None)
+        return state
+
+    def close(self):
+        """
+        Write buffered spilled entries and release the shared spill file.
+        """
+        if self._spill_finalizer is not None:
+            self._spill_finalizer()
+            self._spill_writer = self._spill_finalizer = None
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self._entries)[index]
+        return self._entries[index]
+
+    def __repr__(self):
+        return f"<RingMemory {len(self._entries)}/{self.capacity}, evicted={self.evicted}>"
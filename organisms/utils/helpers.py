@@ -4,6 +4,7 @@ import random
 import json
 from datetime import datetime
 from typing import Any, Dict
+from utils.loggings import log_info
 
 
 def generate_unique_id(prefix: str = "task") -> str:
@@ -16,9 +17,9 @@ def generate_unique_id(prefix: str = "task") -> str:
 
 def pretty_print(data: Any):
     """
-    Nicely print any dictionary or JSON-like object.
+    Nicely log any dictionary or JSON-like object.
     """
-    print(json.dumps(data, indent=4, sort_keys=True))
+    log_info("%s", json.dumps(data, indent=4, sort_keys=True))
 
 
 def random_choice_weighted(choices: Dict[Any, float]) -> Any:
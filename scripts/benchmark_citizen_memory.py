@@ -0,0 +1,48 @@
+# NyXX/scripts/benchmark_citizen_memory.py
+
+import argparse
+import gc
+import logging
+import tracemalloc
+from organisms.citizen import Citizen, CompactCitizen
+from utils.loggings import log_info
+
+
+def measure(citizen_class, count: int) -> dict:
+    """
+    Create `count` citizens of the given class and measure the memory they retain,
+    including any loggers they register in the global logging manager.
+    """
+    gc.collect()
+    loggers_before = len(logging.Logger.manager.loggerDict)
+    tracemalloc.start()
+    citizens = [citizen_class(name=f"Bench-{citizen_class.__name__}-{i}") for i in range(count)]
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    loggers_added = len(logging.Logger.manager.loggerDict) - loggers_before
+    del citizens
+    return {
+        "class": citizen_class.__name__,
+        "bytes_per_citizen": retained / count,
+        "loggers_registered": loggers_added,
+    }
+
+
+def run_benchmark(count: int = 10000) -> list:
+    """
+    Compare bytes per citizen for the regular and the compact representation.
+    """
+    results = [measure(Citizen, count), measure(CompactCitizen, count)]
+    for result in results:
+        log_info(f"{result['class']:>15}: {result['bytes_per_citizen']:8.1f} bytes/citizen, "
+                 f"{result['loggers_registered']} loggers registered for {count} citizens")
+    ratio = results[0]["bytes_per_citizen"] / results[1]["bytes_per_citizen"]
+    log_info(f"CompactCitizen uses {ratio:.1f}x less memory per citizen.")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure memory used per Citizen.")
+    parser.add_argument("--count", type=int, default=10000, help="Number of citizens to create per class.")
+    args = parser.parse_args()
+    run_benchmark(args.count)
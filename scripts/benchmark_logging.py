@@ -0,0 +1,64 @@
+# NyXX/scripts/benchmark_logging.py
+
+import argparse
+import logging
+import os
+import time
+from environment.environment import Environment
+from organisms.citizen import CompactCitizen
+from utils.loggings import log_info, set_quiet_hot_path
+
+
+def ticks_per_second(citizens: int, ticks: int, quiet: bool) -> float:
+    """
+    Time `ticks` environment steps over `citizens` still-learning citizens.
+    """
+    environment = Environment(name="Logging-Benchmark")
+    for i in range(citizens):
+        # A high threshold keeps every citizen on the learning hot path for the whole run
+        environment.add_organism(CompactCitizen(name=f"Citizen{i}", evolution_threshold=ticks + 1))
+
+    set_quiet_hot_path(quiet)
+    try:
+        start = time.perf_counter()
+        for _ in range(ticks):
+            environment.step()
+        elapsed = time.perf_counter() - start
+    finally:
+        set_quiet_hot_path(False)
+    return ticks / elapsed
+
+
+def run_benchmark(citizens: int = 2000, ticks: int = 20) -> dict:
+    """
+    Compare simulation throughput with hot-path logging on and off.
+    Log records are written to os.devnull so the measurement covers formatting and
+    handler work without flooding the console.
+    """
+    root = logging.getLogger()
+    saved_handlers = root.handlers[:]
+    with open(os.devnull, "w") as devnull:
+        sink = logging.StreamHandler(devnull)
+        sink.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+        root.handlers = [sink]
+        try:
+            results = {
+                "logging_on": ticks_per_second(citizens, ticks, quiet=False),
+                "logging_off": ticks_per_second(citizens, ticks, quiet=True),
+            }
+        finally:
+            root.handlers = saved_handlers
+
+    log_info(f"{citizens} citizens, {ticks} ticks")
+    log_info(f"  hot-path logging on : {results['logging_on']:8.1f} ticks/s")
+    log_info(f"  hot-path logging off: {results['logging_off']:8.1f} ticks/s")
+    log_info(f"  speedup: {results['logging_off'] / results['logging_on']:.1f}x")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure ticks per second with logging on and off.")
+    parser.add_argument("--citizens", type=int, default=2000, help="Number of citizens in the world.")
+    parser.add_argument("--ticks", type=int, default=20, help="Number of ticks to run per measurement.")
+    args = parser.parse_args()
+    run_benchmark(args.citizens, args.ticks)
@@ -0,0 +1,70 @@
+# NyXX/scripts/benchmark_order_book.py
+
+import argparse
+import time
+import numpy as np
+from environment.order_book import MatchingEngine
+from utils.loggings import log_info
+
+
+def random_orders(count: int, assets: list, rng) -> list:
+    """
+    `count` limit orders around a mid price of 100, a tenth of them marketable market orders.
+    """
+    sides = np.where(rng.random(count) < 0.5, "buy", "sell")
+    prices = np.round(100 + rng.normal(0, 1, count), 2)
+    quantities = rng.integers(1, 100, count)
+    asset_codes = rng.integers(len(assets), size=count)
+    market = rng.random(count) < 0.1
+    return [(f"trader{i % 1000}", assets[code], side, None if is_market else price, quantity)
+            for i, (code, side, price, quantity, is_market)
+            in enumerate(zip(asset_codes.tolist(), sides.tolist(), prices.tolist(), quantities.tolist(),
+                             market.tolist()))]
+
+
+def run_benchmark(orders: int = 200000, assets: int = 10, batch: int = 1000, seed: int = 0) -> dict:
+    """
+    Submit `orders` random orders in per-tick batches of `batch` and report throughput and
+    the latency of matching a single order.
+    """
+    rng = np.random.default_rng(seed)
+    names = [f"Asset {i}" for i in range(assets)]
+    flow = random_orders(orders, names, rng)
+
+    # Throughput: whole batches, as a simulation tick submits them
+    engine = MatchingEngine(names)
+    start = time.perf_counter()
+    fills = 0
+    for i in range(0, orders, batch):
+        fills += len(engine.submit_batch(flow[i:i + batch]))
+    elapsed = time.perf_counter() - start
+
+    # Latency: one order at a time against an equally deep book
+    engine = MatchingEngine(names)
+    latencies = np.empty(orders)
+    clock = time.perf_counter_ns
+    for i, order in enumerate(flow):
+        begin = clock()
+        engine.submit(*order)
+        latencies[i] = clock() - begin
+    p50, p90, p99, p999 = np.percentile(latencies / 1000, [50, 90, 99, 99.9])
+
+    results = {
+        "orders_per_second": orders / elapsed,
+        "fills": fills,
+        "latency_us": {"p50": p50, "p90": p90, "p99": p99, "p99.9": p999},
+    }
+    log_info(f"{orders} orders over {assets} assets in batches of {batch}")
+    log_info(f"  throughput: {results['orders_per_second']:,.0f} orders/s ({fills} fills)")
+    log_info(f"  match latency: p50 {p50:.1f}us  p90 {p90:.1f}us  p99 {p99:.1f}us  p99.9 {p999:.1f}us")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure order book throughput and match latency.")
+    parser.add_argument("--orders", type=int, default=200000, help="Number of orders to submit.")
+    parser.add_argument("--assets", type=int, default=10, help="Number of assets (order books).")
+    parser.add_argument("--batch", type=int, default=1000, help="Orders submitted per tick.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the order flow.")
+    args = parser.parse_args()
+    run_benchmark(args.orders, args.assets, args.batch, args.seed)
@@ -2,7 +2,7 @@ import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../organisms')))
 
-from organisms.citizen import Citizen
+from organisms.citizen import BaseCitizen, Citizen
 from environment.environment import Environment
 from utils.loggings import log_info, log_error
 
@@ -30,7 +30,7 @@ def run_simulation(steps: int = 10):
 
         # Log the current knowledge of the citizens
         for organism in env.organisms:
-            if isinstance(organism, Citizen):
+            if isinstance(organism, BaseCitizen):
                 log_info(f"{organism.name}'s Knowledge: {organism.knowledge}")
 
     log_info("Simulation finished.")
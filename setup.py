@@ -12,6 +12,7 @@ setup(
     ],
     extras_require={
         'dev': ['pytest', 'black'],  # Development dependencies
+        'telemetry': ['msgpack'],  # Compact binary encoding for utils.telemetry event logs
     },
     entry_points={
         'console_scripts': [
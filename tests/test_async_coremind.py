@@ -0,0 +1,95 @@
+import unittest
+import asyncio
+import os
+import tempfile
+import threading
+from encephalon.async_coremind import AsyncCoreMind
+from encephalon.memory import Memory
+
+
+class BlockingMemory(Memory):
+    """
+    Memory whose state writes wait until `release` is set, recording the states it was given.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.states = []
+
+    def save_state(self, state):
+        self.states.append(state)
+        self.started.set()
+        self.release.wait(5)
+        super().save_state(state)
+
+
+class TestAsyncCoreMind(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "memory.jsonl")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_pulses_broadcast_and_persist(self):
+        async def scenario():
+            mind = AsyncCoreMind(pulse_interval=0, memory=Memory(self.path))
+            subscriber = mind.subscribe()
+            for i in range(5):
+                await mind.submit_report({"agent_id": f"agent{i}", "profit": i})
+            await mind.submit_feedback({"agent_id": "agent0", "profit": 1})
+            await mind.run(pulses=3)
+            decisions = [subscriber.get_nowait() for _ in range(subscriber.qsize())]
+            await mind.aclose()
+            return mind, decisions
+
+        mind, decisions = asyncio.run(scenario())
+        self.assertEqual(len(decisions), 3)
+        self.assertEqual(decisions[0]["action"], "maintain")
+        self.assertEqual(mind.pulses, 3)
+        self.assertEqual(set(mind.current_state["agent0"]["metrics"]), {"profit"})
+        self.assertIn("agent4", Memory(self.path).load_state())
+
+    def test_persistence_does_not_block_pulses(self):
+        async def scenario():
+            memory = BlockingMemory(self.path)
+            mind = AsyncCoreMind(pulse_interval=0, max_pending_reflections=10, memory=memory)
+            await mind.submit_report({"agent_id": "agent0", "profit": 1})
+            for _ in range(5):
+                await mind.pulse_async()
+            # Every pulse returned while no write could finish
+            self.assertFalse(memory.release.is_set())
+            self.assertEqual(mind.pulses, 5)
+
+            await asyncio.get_running_loop().run_in_executor(None, memory.started.wait, 5)
+            # The writer holds its own copy of the state, so values replaced meanwhile don't leak into it
+            mind._merge_state({"agent0": {"metrics": {"profit": "changed"}}})
+            memory.release.set()
+            await mind.aclose()
+            return mind, memory
+
+        mind, memory = asyncio.run(scenario())
+        self.assertGreaterEqual(len(memory.states), 1)
+        self.assertNotEqual(memory.states[0]["agent0"]["metrics"]["profit"], "changed")
+        self.assertEqual(Memory(self.path).load_state()["agent0"]["metrics"]["profit"], "changed")
+
+    def test_backpressure(self):
+        async def scenario():
+            mind = AsyncCoreMind(max_reports=2, subscriber_queue_size=1, memory=Memory(self.path))
+            accepted = [mind.submit_report_nowait({"agent_id": "a", "x": i}) for i in range(3)]
+            subscriber = mind.subscribe()
+            await mind.pulse_async()
+            await mind.pulse_async()
+            await mind.aclose()
+            return mind, accepted, subscriber
+
+        mind, accepted, subscriber = asyncio.run(scenario())
+        self.assertEqual(accepted, [True, True, False])
+        self.assertEqual((subscriber.qsize(), mind.dropped_decisions), (1, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+import unittest
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+from environment.environment import Environment
+from organisms.citizen import BaseCitizen, Citizen, CompactCitizen
+from organisms.agent import CompactAgent
+from organisms.memory import RingMemory
+
+
+class CompactTestAgent(CompactAgent):
+    __slots__ = ()
+
+    def perform_task(self, task: dict) -> dict:
+        return {"status": "success"}
+
+
+class TestCompactCitizen(unittest.TestCase):
+
+    def test_compact_citizen_has_no_instance_dict(self):
+        """All attributes are slotted and containers are created lazily."""
+        citizen = CompactCitizen(name="Compact")
+        self.assertIsInstance(citizen, BaseCitizen)
+        self.assertFalse(hasattr(citizen, "__dict__"))
+        self.assertIsNone(citizen._memory)
+        citizen.memory.append("fact")
+        self.assertEqual(citizen.memory, ["fact"])
+        with self.assertRaises(AttributeError):
+            citizen.nickname = "C"
+
+        # The whole instance is smaller than a regular citizen's attribute dict alone
+        regular = Citizen(name="Regular")
+        self.assertLess(sys.getsizeof(CompactCitizen(name="Fresh")), sys.getsizeof(regular.__dict__))
+
+    def test_ids_and_shared_logger(self):
+        """Integer ids are unique, the uuid is stable and no per-name logger is registered."""
+        loggers = len(logging.Logger.manager.loggerDict)
+        first, second = CompactCitizen(name="A"), CompactCitizen(name="B")
+        self.assertNotEqual(first.uid, second.uid)
+        self.assertIsNone(first._citizen_id)
+        self.assertEqual(first.citizen_id, first.citizen_id)
+        self.assertIs(first.logger, second.logger)
+        self.assertEqual(len(logging.Logger.manager.loggerDict), loggers)
+
+    def test_compact_agent_reuses_citizen_state(self):
+        """A compact agent shares the knowledge of the citizen it evolved from."""
+        citizen = CompactCitizen(name="Learner")
+        citizen.knowledge["fact1"] = 3
+        agent = CompactTestAgent(citizen, role="Trader")
+        self.assertIs(agent.knowledge, citizen.knowledge)
+        self.assertEqual(agent.status, "active")
+        self.assertFalse(hasattr(agent, "__dict__"))
+        agent.log_event("started")
+        self.assertEqual(len(agent.memory), 1)
+
+
+class TestCitizenLearning(unittest.TestCase):
+
+    def test_learn_many_keeps_running_total(self):
+        """learn_many applies a batch and tracks the total without summing the dict."""
+        citizen = Citizen(name="Learner", evolution_threshold=10)
+        learned = citizen.learn_many(["fact1", "fact2", "fact1"])
+        self.assertEqual(learned, 3)
+        self.assertEqual(citizen.knowledge_total, 3)
+        self.assertEqual(citizen.knowledge, {"fact1": 2, "fact2": 1})
+        self.assertEqual(citizen.status, "idle")
+
+    def test_learn_many_stops_at_threshold(self):
+        """Facts past the threshold are ignored and the citizen becomes ready to evolve."""
+        citizen = Citizen(name="Learner", evolution_threshold=3)
+        learned = citizen.learn_many(iter(["a", "b", "c", "d", "e"]))
+        self.assertEqual(learned, 3)
+        self.assertEqual(citizen.status, "ready to evolve")
+        self.assertFalse(citizen.learning_enabled)
+        self.assertEqual(citizen.learn_many(["f"]), 0)
+        self.assertEqual(len(citizen.memory), 3)
+
+    def test_environment_pushes_facts_in_bulk(self):
+        """Environment.step hands each learning citizen one fact per tick."""
+        environment = Environment()
+        citizens = [CompactCitizen(name=f"C{i}", evolution_threshold=2) for i in range(3)]
+        for citizen in citizens:
+            environment.add_organism(citizen)
+        environment.step()
+        self.assertTrue(all(citizen.knowledge_total == 1 for citizen in citizens))
+        environment.step()
+        self.assertTrue(all(citizen.status == "evolved" for citizen in citizens))
+
+
+class TestRingMemory(unittest.TestCase):
+
+    def test_ring_memory_keeps_most_recent_entries(self):
+        """The ring never grows past its capacity."""
+        memory = RingMemory(capacity=3)
+        memory.extend(range(10))
+        self.assertEqual(list(memory), [7, 8, 9])
+        self.assertEqual(memory[-1], 9)
+        self.assertEqual(memory.evicted, 7)
+
+    def test_evicted_entries_spill_to_disk(self):
+        """Evicted entries are appended to the spill file as JSON lines."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "spill.jsonl")
+            memory = RingMemory(capacity=2, spill_path=path)
+            memory.extend([{"event": i} for i in range(5)])
+            memory.close()
+            with open(path) as file:
+                spilled = [json.loads(line) for line in file]
+        self.assertEqual(spilled, [{"event": 0}, {"event": 1}, {"event": 2}])
+
+    def test_memories_share_one_spill_writer(self):
+        """Memories spilling to one file share a handle and never interleave lines."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "spill.jsonl")
+            memories = [RingMemory(capacity=1, spill_path=path, spill_batch=7) for _ in range(200)]
+
+            def fill(memory, owner):
+                memory.extend([{"owner": owner, "event": i, "payload": "x" * 100} for i in range(51)])
+
+            threads = [threading.Thread(target=lambda part=part: [fill(memories[n], n) for n in part])
+                       for part in (range(0, 100), range(100, 200))]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(len({id(memory._spill_writer) for memory in memories}), 1)
+            del memories[100:]  # Collected memories write what they still buffered
+            for memory in memories:
+                memory.close()
+            with open(path) as file:
+                spilled = [json.loads(line) for line in file]
+        self.assertEqual(len(spilled), 200 * 50)
+        self.assertEqual(sorted(entry["event"] for entry in spilled if entry["owner"] == 150), list(range(50)))
+
+    def test_agent_events_use_bounded_memory(self):
+        """Agents log events into the pluggable store with epoch timestamps."""
+        citizen = CompactCitizen(name="Bounded")
+        agent = CompactTestAgent(citizen, role="Trader")
+        agent.memory = RingMemory(capacity=5)
+        for i in range(20):
+            agent.log_event(f"event {i}")
+        self.assertEqual(len(agent.memory), 5)
+        self.assertIsInstance(agent.memory[0]["timestamp"], float)
+
+    def test_memory_factory(self):
+        """Citizens take their memory store from memory_factory or an explicit argument."""
+        citizen = Citizen(name="Explicit", memory=RingMemory(capacity=1))
+        citizen.learn_many(["a", "b"])
+        self.assertEqual(list(citizen.memory), ["b"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 from encephalon.coremind import CoreMind  # Corrected the class name to CoreMind
 from encephalon.strategy import Strategy
@@ -8,9 +10,10 @@ class TestCoreMindMethods(unittest.TestCase):  # Changed the test class name to
 
     def setUp(self):
         """Set up the test environment, instantiate CoreMind and related modules."""
-        self.coremind = CoreMind()  # Changed to CoreMind
+        self.directory = tempfile.TemporaryDirectory()
+        self.coremind = CoreMind(memory=Memory(os.path.join(self.directory.name, "coremind.jsonl")))  # Changed to CoreMind
         self.strategy = Strategy()
-        self.memory = Memory()
+        self.memory = Memory(os.path.join(self.directory.name, "memory.jsonl"))
         self.feedback_loop = FeedbackLoop()
 
     def test_coremind_initialization(self):
@@ -53,6 +56,7 @@ class TestCoreMindMethods(unittest.TestCase):  # Changed the test class name to
         del self.strategy
         del self.memory
         del self.feedback_loop
+        self.directory.cleanup()
 
 if __name__ == '__main__':
     unittest.main()
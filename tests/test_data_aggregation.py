@@ -0,0 +1,100 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from encephalon.data_aggregation import DataAggregator, RollingStats, ColumnarWindow
+from encephalon.coremind import CoreMind
+from encephalon.memory import Memory
+
+
+class TestRollingStats(unittest.TestCase):
+
+    def test_matches_numpy_over_sliding_window(self):
+        values = np.random.default_rng(4).normal(size=200)
+        stats = RollingStats()
+        for index, value in enumerate(values):
+            stats.add(index, value)
+            if index >= 20:
+                stats.remove(index - 20, values[index - 20])
+            window = values[max(index - 19, 0):index + 1]
+            self.assertEqual(stats.count, window.size)
+            self.assertAlmostEqual(stats.mean, window.mean())
+            self.assertAlmostEqual(stats.variance, window.var())
+            self.assertEqual((stats.min, stats.max), (window.min(), window.max()))
+
+
+class TestDataAggregator(unittest.TestCase):
+
+    def test_count_window(self):
+        aggregator = DataAggregator(window=3, last_n=2)
+        updated = aggregator.aggregate([{"agent_id": "a", "score": score} for score in (1, 2, 3, 4, 5)]
+                                       + [{"agent_id": "b", "score": 7}, {"score": 1}])
+        self.assertEqual(set(updated), {"a", "b"})
+        summary = updated["a"]
+        self.assertEqual(summary["count"], 3)
+        self.assertEqual(summary["metrics"]["score"]["mean"], 4)
+        self.assertEqual((summary["metrics"]["score"]["min"], summary["metrics"]["score"]["max"]), (3, 5))
+        self.assertEqual([report["score"] for report in summary["last"]], [4, 5])
+        # Only agents that reported are returned; the store keeps everyone
+        self.assertEqual(set(aggregator.aggregate([{"agent_id": "b", "score": 1}])), {"b"})
+        self.assertEqual(set(aggregator.get_aggregated_data()), {"a", "b"})
+
+    def test_time_window(self):
+        aggregator = DataAggregator(window=None, max_age=10)
+        aggregator.aggregate([{"agent_id": "a", "score": 1, "timestamp": 100.0},
+                              {"agent_id": "a", "score": 3, "timestamp": 105.0},
+                              {"agent_id": "a", "score": 5, "timestamp": 112.0}])
+        self.assertEqual(aggregator.get_agent_summary("a")["metrics"]["score"]["mean"], 4)
+        aggregator.expire(now=200.0)
+        self.assertIsNone(aggregator.get_agent_summary("a"))
+
+
+class TestColumnarWindow(unittest.TestCase):
+
+    def test_grouped_statistics_over_batch_window(self):
+        window = ColumnarWindow(window=2)
+        window.ingest({"agent_id": np.array(["a", "b", "a"]), "score": np.array([1.0, 10.0, 3.0])})
+        window.ingest({"agent_id": np.array(["a", "c"]), "score": np.array([5.0, np.nan]), "label": np.array(["x", "y"])})
+        stats = window.get("a")["score"]
+        self.assertEqual((stats["count"], stats["mean"], stats["min"], stats["max"]), (3, 3.0, 1.0, 5.0))
+        self.assertAlmostEqual(stats["variance"], 8 / 3)
+        self.assertEqual(window.get("c")["score"]["count"], 0)
+
+        # The first batch leaves the window; "b" changes although it did not report
+        changed = window.ingest({"agent_id": np.array(["c"]), "score": np.array([2.0])})
+        self.assertEqual(sorted(window.ids[row] for row in changed), ["a", "b", "c"])
+        summary = window.summary("score")
+        np.testing.assert_array_equal(summary["count"], [1, 0, 1])
+        np.testing.assert_array_equal(summary["max"], [5.0, np.nan, 2.0])
+
+    def test_coremind_perceive_columnar_batch(self):
+        coremind = CoreMind.__new__(CoreMind)
+        coremind.aggregator = DataAggregator()
+        coremind.current_state = {}
+        batch = {"agent_id": np.arange(1000) % 100, "profit": np.ones(1000)}
+        coremind.perceive(batch)
+        agents = coremind.current_state["agents"]
+        self.assertEqual(len(agents["ids"]), 100)
+        self.assertEqual(agents["metrics"]["profit"]["count"][agents["ids"].index(7)], 10)
+        self.assertEqual(coremind._merge_state({"agents": agents}), 0)
+        # The state holds a snapshot; later batches only change the live window
+        coremind.perceive({"agent_id": np.array([7]), "profit": np.ones(1)})
+        self.assertEqual(agents["metrics"]["profit"]["count"][agents["ids"].index(7)], 10)
+        self.assertEqual(coremind.aggregator.columns.get(7)["profit"]["count"], 11)
+
+    def test_columnar_state_survives_persistence(self):
+        path = os.path.join(tempfile.mkdtemp(), "memory.json")
+        coremind = CoreMind.__new__(CoreMind)
+        coremind.aggregator = DataAggregator()
+        coremind.memory = Memory(path)
+        coremind.current_state = {}
+        coremind.perceive({"agent_id": np.arange(4), "profit": np.arange(4.0)})
+        coremind.memory.save_state(coremind.current_state)
+        coremind.memory.close()
+        agents = Memory(path).load_state()["agents"]
+        self.assertEqual(agents["ids"], [0, 1, 2, 3])
+        self.assertEqual(agents["metrics"]["profit"]["mean"], [0.0, 1.0, 2.0, 3.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+import unittest
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from encephalon.coremind import CoreMind
+from encephalon.memory import Memory
+from encephalon.evaluation import PerformanceEvaluator
+from encephalon.data_aggregation import DataAggregator
+from encephalon.strategy import Strategy
+from utils.telemetry import EventSink, read_events, set_event_sink
+
+
+class ScoredAgent:
+
+    def __init__(self, agent_id, score, delay=0.0):
+        self.agent_id = agent_id
+        self.score = score
+        self.delay = delay
+
+    def evaluate_performance(self, environment):
+        if self.delay:
+            time.sleep(self.delay)
+        if self.score is None:
+            raise RuntimeError("evaluation failed")
+        return self.score
+
+
+class HungAgent:
+
+    agent_id = "hung"
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def evaluate_performance(self, environment):
+        self.release.wait()
+        return 1.0
+
+
+class FakeEnvironment:
+
+    def __init__(self, agents):
+        self.agents = agents
+
+
+class TestPerformanceEvaluator(unittest.TestCase):
+
+    def setUp(self):
+        self.agents = [ScoredAgent(f"agent{i}", float(i)) for i in range(50)]
+
+    def test_executors_agree(self):
+        for executor in ("serial", "thread", "process"):
+            with PerformanceEvaluator(executor=executor, max_workers=2, chunk_size=7) as evaluator:
+                np.testing.assert_array_equal(evaluator.evaluate(self.agents), np.arange(50.0))
+
+    def test_failures_and_timeouts_score_nan(self):
+        agents = [ScoredAgent("ok", 1.0), ScoredAgent("failing", None), ScoredAgent("slow", 3.0, delay=0.05),
+                  object()]
+        with PerformanceEvaluator(chunk_size=1, agent_timeout=0.02) as evaluator:
+            scores = evaluator.evaluate(agents)
+        self.assertEqual(scores[0], 1.0)
+        self.assertTrue(np.isnan(scores[1:]).all())
+
+    def test_hung_agent_is_cut_off(self):
+        hung = HungAgent()
+        agents = [hung, ScoredAgent("a", 1.0), ScoredAgent("b", 2.0), ScoredAgent("c", 3.0)]
+        evaluator = PerformanceEvaluator(max_workers=2, chunk_size=2, chunk_timeout=0.1)
+        try:
+            scores = evaluator.evaluate(agents)
+            # evaluate() returned while the hung agent is still blocked
+            self.assertFalse(hung.release.is_set())
+            self.assertTrue(np.isnan(scores[:2]).all())
+            np.testing.assert_array_equal(scores[2:], [2.0, 3.0])
+            self.assertEqual(evaluator.timed_out, 2)
+        finally:
+            hung.release.set()
+            evaluator.close()
+
+    def test_chunk_deadline_with_executor_instance(self):
+        """An executor passed in takes its width from max_workers, not from its private attributes."""
+        hung = HungAgent()
+        agents = [hung, ScoredAgent("a", 1.0), ScoredAgent("b", 2.0)]
+        pool = ThreadPoolExecutor(max_workers=3)
+        evaluator = PerformanceEvaluator(executor=pool, max_workers=3, chunk_size=1, chunk_timeout=0.1)
+        try:
+            start = time.perf_counter()
+            scores = evaluator.evaluate(agents)
+            self.assertLess(time.perf_counter() - start, 0.5)
+            self.assertTrue(np.isnan(scores[0]))
+            np.testing.assert_array_equal(scores[1:], [1.0, 2.0])
+        finally:
+            hung.release.set()
+            evaluator.close()
+            pool.shutdown()
+
+    def test_strategy_consumes_score_array(self):
+        strategy = Strategy()
+        scores = np.array([1.0, 1.0, 1.0, 1.0, -10.0, np.nan])
+        summary = strategy.adjust_based_on_performance(scores, ["a", "b", "c", "d", "e", "f"])
+        self.assertEqual((summary["evaluated"], summary["failed"]), (5, 1))
+        self.assertEqual(summary["min"], -10.0)
+        self.assertEqual(summary["underperformers"], ["e"])
+        self.assertEqual(strategy.adjust_based_on_performance({"a": 2.0})["mean"], 2.0)
+
+    def test_aggregate_data_skips_unscored_agents(self):
+        aggregator = DataAggregator(evaluator=PerformanceEvaluator(chunk_size=2))
+        environment = FakeEnvironment(self.agents[:3] + [ScoredAgent("failing", None)])
+        updated = aggregator.aggregate_data(environment)
+        self.assertEqual(set(updated), {"agent0", "agent1", "agent2"})
+        self.assertEqual(updated["agent2"]["metrics"]["performance"]["mean"], 2.0)
+
+    def test_coremind_evaluation_emits_telemetry(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "events.bin")
+            sink = EventSink(path, codec="json")
+            set_event_sink(sink)
+            try:
+                mind = CoreMind(memory=Memory(os.path.join(directory, "memory.jsonl")))
+                scores = mind.evaluate_performance(FakeEnvironment(self.agents[:4] + [ScoredAgent("failing", None)]))
+            finally:
+                set_event_sink(None)
+                sink.close()
+            np.testing.assert_array_equal(scores[:4], np.arange(4.0))
+            events = [event for event in read_events(path) if event["type"] == "strategy_performance"]
+            self.assertEqual(len(events), 1)
+            self.assertEqual((events[0]["evaluated"], events[0]["failed"], events[0]["mean"]), (4, 1, 1.5))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+from environment.environment import Environment
+from organisms.citizen import Citizen, CompactCitizen
+from organisms.evolution import EvolutionPipeline, ROLE_CLASSES, AGENT_CLASSES
+from organisms.agents.analyst import AnalystAgent
+from organisms.agent import Agent
+from organisms.agents.trader import Trader
+from organisms.agents.researcher import ResearcherAgent
+import numpy as np
+
+
+class TestEvolutionPipeline(unittest.TestCase):
+
+    def test_converts_ready_citizens_in_place(self):
+        """Ready citizens become agents of their role and keep their knowledge storage."""
+        citizens = [Citizen(name=f"Citizen{i}") for i in range(6)]
+        for citizen in citizens[:4]:
+            citizen.learn_many(["fact"] * 5)
+        knowledge = citizens[0].knowledge
+        pipeline = EvolutionPipeline(roles=["Trader", "Researcher"], rng=np.random.default_rng(0))
+
+        evolved = pipeline.run(citizens)
+        self.assertEqual(evolved, citizens[:4])
+        for agent in evolved:
+            self.assertIsInstance(agent, (Trader, ResearcherAgent))
+            self.assertEqual(agent.status, "active")
+            self.assertTrue(agent.agent_id)
+        self.assertIs(citizens[0].knowledge, knowledge)
+        self.assertEqual(citizens[4].status, "idle")
+        self.assertEqual(pipeline.evolved, 4)
+        self.assertGreater(pipeline.evolutions_per_second, 0)
+
+    def test_roles_without_class_and_compact_citizens(self):
+        """Citizens that cannot become agents still evolve into their role."""
+        citizen, compact = Citizen(name="Farmer"), CompactCitizen(name="Compact")
+        for organism in (citizen, compact):
+            organism.update_status("ready to evolve")
+        EvolutionPipeline(roles=["Farmer"]).run([citizen])
+        EvolutionPipeline(roles=["Trader"]).run([compact])
+        self.assertEqual((type(citizen), citizen.role, citizen.status), (Citizen, "Farmer", "evolved"))
+        self.assertEqual((type(compact), compact.role, compact.status), (CompactCitizen, "Trader", "evolved"))
+
+    def test_environment_batch_evolution(self):
+        environment = Environment(seed=8)
+        environment.enable_evolution_pipeline()
+        for i in range(20):
+            environment.add_organism(Citizen(name=f"Citizen{i}", evolution_threshold=2))
+        environment.run(steps=2)
+        agents = environment.agents
+        self.assertTrue(agents)
+        self.assertTrue(all(isinstance(agent, Agent) for agent in agents))
+        self.assertEqual(environment.organisms.ready_to_evolve(), [])
+        self.assertIs(environment.get_organism(agents[0].agent_id), agents[0])
+
+    def test_role_classes_match_drawn_roles(self):
+        """Every role with an agent class is drawn, and every agent class is reachable by its role."""
+        pipeline = EvolutionPipeline()
+        self.assertTrue(set(ROLE_CLASSES) <= set(pipeline.roles))
+        self.assertEqual(set(ROLE_CLASSES), {"Trader", "Researcher"})
+        analyst = Citizen(name="Ana")
+        analyst.update_status("ready to evolve")
+        EvolutionPipeline(roles=["analyst"], role_classes=AGENT_CLASSES).run([analyst])
+        self.assertIsInstance(analyst, AnalystAgent)
+        self.assertEqual(analyst.role, "Analyst")
+
+    def test_by_role_finds_evolved_agents(self):
+        """Evolved traders and directly built ones share one role bucket."""
+        environment = Environment(seed=3)
+        environment.enable_evolution_pipeline(roles=["Trader", "Researcher"])
+        for i in range(20):
+            environment.add_organism(Citizen(name=f"Citizen{i}", evolution_threshold=2))
+        environment.run(steps=2)
+        trader = Trader(Citizen(name="Direct"))
+        environment.add_agent(trader)
+        self.assertEqual(trader.role, "Trader")
+        traders = environment.organisms.by_role("Trader")
+        researchers = environment.organisms.by_role("researcher")
+        self.assertIn(trader, traders)
+        self.assertGreater(len(traders), 1)
+        self.assertTrue(all(isinstance(agent, Trader) for agent in traders))
+        self.assertTrue(researchers and all(isinstance(agent, ResearcherAgent) for agent in researchers))
+        self.assertEqual(len(traders) + len(researchers), len(environment.agents))
+
+
+if __name__ == '__main__':
+    unittest.main()
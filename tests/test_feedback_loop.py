@@ -0,0 +1,66 @@
+import unittest
+import numpy as np
+from encephalon.feedback_loop import FeedbackLoop, MetricTrend
+from encephalon.strategy import Strategy
+from environment.market import Market
+
+
+class TestMetricTrend(unittest.TestCase):
+
+    def test_batch_level_matches_sequential_updates(self):
+        batched, sequential = MetricTrend(alpha=0.2), MetricTrend(alpha=0.2)
+        batched.update(1.0)
+        sequential.update(1.0)
+        batched.update([3.0] * 4)
+        for _ in range(4):
+            sequential.update(3.0)
+        self.assertAlmostEqual(batched.level, sequential.level)
+        self.assertEqual(batched.count, 5)
+
+    def test_change_point(self):
+        rng = np.random.default_rng(1)
+        trend = MetricTrend(alpha=0.05)
+        changes = [trend.update(rng.normal(0, 1, 20)).change for _ in range(30)]
+        self.assertNotIn("up", changes)
+        changes = [trend.update(rng.normal(3, 1, 20)).change for _ in range(5)]
+        self.assertIn("up", changes)
+
+
+class TestFeedbackLoop(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = np.random.default_rng(2)
+        self.loop = FeedbackLoop(None, Strategy())
+
+    def feed(self, drift):
+        result = None
+        for step in range(40):
+            profits = self.rng.normal(drift * step, 0.5, 25)
+            result = self.loop.process([{"agent_id": i, "profit": p, "note": "x"} for i, p in enumerate(profits)])
+        return result
+
+    def test_rising_feedback_is_bullish(self):
+        decision, trends = self.feed(0.2)
+        self.assertTrue(trends["bullish"])
+        self.assertEqual(decision["action"], "expand")
+        self.assertEqual(set(trends["metrics"]), {"profit"})
+
+    def test_falling_feedback_is_bearish(self):
+        decision, trends = self.feed(-0.2)
+        self.assertTrue(trends["bearish"])
+        self.assertEqual(decision["action"], "contract")
+
+    def test_flat_feedback_is_neutral(self):
+        decision, trends = self.feed(0.0)
+        self.assertFalse(trends["bullish"] or trends["bearish"])
+        self.assertEqual(decision["action"], "maintain")
+
+    def test_observe_market(self):
+        market = Market(rng=np.random.default_rng(3))
+        self.loop.observe_market(market)
+        self.assertIn("price:Stock A", self.loop.trends)
+        self.assertEqual(self.loop.trends["price:Stock A"].level, market.assets["Stock A"])
+
+
+if __name__ == '__main__':
+    unittest.main()
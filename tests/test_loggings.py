@@ -0,0 +1,124 @@
+import unittest
+import logging
+import threading
+from utils.loggings import log_hot, set_quiet_hot_path, is_quiet_hot_path, get_logger
+from utils.loggings import enable_async_logging, flush_async_logging, disable_async_logging
+
+
+class _Unprintable:
+    """An argument that fails the test if it is ever formatted."""
+
+    def __str__(self):
+        raise AssertionError("hot-path argument was formatted")
+
+
+class TestLoggingFacade(unittest.TestCase):
+
+    def setUp(self):
+        self.logger = get_logger("NyXX.tests.hot")
+
+    def tearDown(self):
+        set_quiet_hot_path(False)
+        self.logger.setLevel(logging.NOTSET)
+
+    def test_log_hot_formats_lazily(self):
+        """Arguments are %-style and formatted into the record message."""
+        with self.assertLogs(self.logger, level="INFO") as captured:
+            log_hot(self.logger, "Citizen %s learned %d facts", "Ada", 3)
+        self.assertEqual(captured.records[0].getMessage(), "Citizen Ada learned 3 facts")
+
+    def test_quiet_hot_path_skips_formatting(self):
+        """In quiet mode nothing is formatted or emitted."""
+        set_quiet_hot_path(True)
+        self.assertTrue(is_quiet_hot_path())
+        log_hot(self.logger, "value %s", _Unprintable())
+
+    def test_disabled_level_skips_formatting(self):
+        """Records below the logger level are never built."""
+        self.logger.setLevel(logging.WARNING)
+        log_hot(self.logger, "value %s", _Unprintable())
+
+
+class _RecordingHandler(logging.Handler):
+    """Collects formatted messages and the thread that handled them."""
+
+    def __init__(self, gate: threading.Event = None):
+        super().__init__()
+        self.gate = gate
+        self.messages = []
+        self.threads = set()
+
+    def emit(self, record):
+        if self.gate is not None:
+            self.gate.wait()
+        self.messages.append(self.format(record))
+        self.threads.add(threading.current_thread().name)
+
+
+class TestAsyncLogging(unittest.TestCase):
+
+    def setUp(self):
+        self.logger = get_logger("NyXX.tests.async")
+        self.logger.propagate = False
+        self.logger.setLevel(logging.INFO)
+
+    def tearDown(self):
+        disable_async_logging(self.logger)
+        self.logger.handlers = []
+        self.logger.propagate = True
+
+    def test_records_are_written_on_background_thread(self):
+        """Handlers run on the listener thread and flush waits for them."""
+        handler = _RecordingHandler()
+        self.logger.addHandler(handler)
+        enable_async_logging(self.logger)
+        for i in range(100):
+            self.logger.info("record %d", i)
+        flush_async_logging()
+        self.assertEqual(handler.messages[-1], "record 99")
+        self.assertNotIn(threading.current_thread().name, handler.threads)
+
+    def test_arguments_are_merged_before_queueing(self):
+        """A mutable argument changed after the call does not change the queued message."""
+        gate = threading.Event()
+        handler = _RecordingHandler(gate)
+        self.logger.addHandler(handler)
+        enable_async_logging(self.logger)
+        state = {"step": 1}
+        self.logger.info("state %s", state)
+        state["step"] = 2
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            self.logger.exception("failed")
+        gate.set()
+        flush_async_logging()
+        self.assertEqual(handler.messages[0], "state {'step': 1}")
+        self.assertTrue(handler.messages[1].startswith("failed\nTraceback"))
+        self.assertIn("RuntimeError: boom", handler.messages[1])
+
+    def test_default_logger_is_nyxx_logger(self):
+        queue_handler = enable_async_logging()
+        try:
+            self.assertIn(queue_handler, logging.getLogger("NyXXLogger").handlers)
+            self.assertNotIn(queue_handler, logging.getLogger().handlers)
+        finally:
+            disable_async_logging()
+
+    def test_drop_policy_counts_overflow(self):
+        """A full queue drops records instead of blocking the caller."""
+        gate = threading.Event()
+        handler = _RecordingHandler(gate)
+        self.logger.addHandler(handler)
+        queue_handler = enable_async_logging(self.logger, queue_size=2, policy="drop")
+        for i in range(50):
+            self.logger.info("record %d", i)
+        self.assertGreater(queue_handler.dropped, 0)
+        gate.set()
+        disable_async_logging(self.logger)
+        self.assertEqual(len(handler.messages) + queue_handler.dropped, 50)
+        self.assertIn(handler, self.logger.handlers)
+
+
+if __name__ == '__main__':
+    unittest.main()
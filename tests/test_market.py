@@ -0,0 +1,80 @@
+import unittest
+import numpy as np
+from environment.market import Market, MarketEngine, apply_price_model
+from utils.loggings import set_quiet_hot_path
+
+
+class TestMarket(unittest.TestCase):
+
+    def test_dict_api(self):
+        market = Market(rng=np.random.default_rng(1))
+        self.assertEqual(list(market.assets), ["Stock A", "Stock B", "Stock C", "Commodity X", "Commodity Y"])
+        price = market.get_asset_price("Stock A")
+        self.assertIsInstance(price, float)
+        self.assertEqual(market.buy_asset("Stock A", 3), price * 3)
+        self.assertEqual(market.sell_asset("Stock A", 2), price * 2)
+        self.assertEqual(market.volumes[0], 5)
+        self.assertIsNone(market.get_asset_price("Unknown"))
+        self.assertEqual(market.get_market_status(), market.assets)
+
+    def test_trades_log_on_the_hot_path(self):
+        market = Market(rng=np.random.default_rng(1), assets={"x": 2.0})
+        with self.assertLogs("environment.market", level="INFO") as logs:
+            market.buy_asset("x", 3)
+        self.assertEqual(logs.records[0].args, (3, "x", 2.0, 6.0))
+        set_quiet_hot_path(True)
+        try:
+            with self.assertNoLogs("environment.market", level="INFO"):
+                market.sell_asset("x", 1)
+        finally:
+            set_quiet_hot_path(False)
+
+    def test_events_and_history(self):
+        market = Market(rng=np.random.default_rng(2), assets={"x": 10.0, "y": 20.0}, history_size=3)
+        for _ in range(5):
+            before = market.prices.copy()
+            market.simulate_market_fluctuations()
+            change = market.prices / before - 1
+            self.assertTrue((np.abs(change) <= 0.05).all())
+        history = market.get_price_history()
+        self.assertEqual(history.shape, (3, 2))
+        np.testing.assert_array_equal(history[-1], market.prices)
+        np.testing.assert_array_equal(market.get_price_history("y"), history[:, 1])
+
+        before = market.prices.copy()
+        market._market_crash()
+        ratio = market.prices / before
+        self.assertAlmostEqual(ratio[0], ratio[1])
+        self.assertTrue(0.4 <= ratio[0] <= 0.7)
+
+    def test_gbm_moments(self):
+        prices = np.full(200000, 100.0)
+        apply_price_model(prices, np.random.default_rng(3), "gbm", dt=1.0, drift=0.1, volatility=0.2)
+        log_returns = np.log(prices / 100.0)
+        self.assertAlmostEqual(log_returns.mean(), 0.1 - 0.02, places=2)
+        self.assertAlmostEqual(log_returns.std(), 0.2, places=2)
+
+    def test_jumps(self):
+        prices = np.full(100000, 100.0)
+        apply_price_model(prices, np.random.default_rng(4), "jump", dt=1.0, drift=0.0, volatility=0.0,
+                          jump_intensity=0.5, jump_mean=-0.1, jump_std=0.0)
+        self.assertAlmostEqual(np.log(prices / 100.0).mean(), -0.05, places=2)
+        with self.assertRaises(ValueError):
+            Market(model="random walk")
+
+
+class TestMarketEngine(unittest.TestCase):
+
+    def test_markets_share_engine_arrays(self):
+        engine = MarketEngine(markets=50, assets=1000, rng=np.random.default_rng(5), model="jump")
+        market = engine.market(7)
+        engine.step(3)
+        self.assertEqual(engine.ticks, 3)
+        self.assertEqual(market.get_asset_price("Asset 10"), engine.prices[7, 10])
+        market.buy_asset("Asset 10", 4)
+        self.assertEqual(engine.volumes[7, 10], 4)
+        self.assertTrue((engine.prices > 0).all())
+
+
+if __name__ == '__main__':
+    unittest.main()
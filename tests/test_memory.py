@@ -0,0 +1,196 @@
+import unittest
+import json
+import os
+import tempfile
+from datetime import datetime, timedelta
+from encephalon.memory import Memory, EventLog, SQLiteMemoryBackend
+
+
+class TestEventLog(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "memory.jsonl")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_range_queries_and_reopen(self):
+        """Events are indexed by timestamp, also when reopened from disk or appended out of order."""
+        log = EventLog(self.path)
+        for minute in (1, 3, 2, 5, 4):
+            log.append({"timestamp": f"2024-01-01T00:0{minute}:00", "value": minute})
+        self.assertEqual([event["value"] for event in log.range("2024-01-01T00:02:00", "2024-01-01T00:04:00")], [2, 3, 4])
+        self.assertEqual([event["value"] for event in log.recent(2)], [4, 5])
+        log.close()
+
+        log = EventLog(self.path)
+        self.assertEqual(len(log), 5)
+        self.assertEqual(log.get("2024-01-01T00:03:00")["value"], 3)
+        self.assertIsNone(log.get("2024-01-01T00:09:00"))
+        log.close()
+
+    def test_file_is_created_on_first_append(self):
+        log = EventLog(self.path)
+        self.assertEqual((len(log), log.recent(5)), (0, []))
+        log.close()
+        self.assertFalse(os.path.exists(self.path))
+
+        log = EventLog(self.path)
+        log.append({"timestamp": "2024-01-01T00:01:00"})
+        self.assertTrue(os.path.exists(self.path))
+        log.close()
+
+    def test_supersede_and_compact(self):
+        log = EventLog(self.path)
+        log.append({"timestamp": "2024-01-01T00:01:00", "value": "old"})
+        log.append({"timestamp": "2024-01-01T00:02:00", "value": "kept"})
+        log.append({"timestamp": "2024-01-01T00:01:00", "value": "new"})
+        self.assertEqual((len(log), log.superseded), (2, 1))
+        self.assertEqual(log.get("2024-01-01T00:01:00")["value"], "new")
+
+        log.compact()
+        with open(self.path) as file:
+            self.assertEqual(len(file.readlines()), 2)
+        log.compact(before="2024-01-01T00:02:00")
+        self.assertEqual([event["value"] for event in log.range()], ["kept"])
+        log.close()
+
+    def test_torn_record_is_dropped(self):
+        with open(self.path, "w") as file:
+            file.write('{"timestamp": "2024-01-01T00:01:00"}\n{"timestamp": "2024-01')
+        log = EventLog(self.path)
+        self.assertEqual(len(log), 1)
+        log.append({"timestamp": "2024-01-01T00:02:00"})
+        self.assertEqual(len(list(log.range())), 2)
+        log.close()
+
+    def test_legacy_json_memory_is_migrated(self):
+        """A memory.json written in the original format keeps its history under the log backend."""
+        legacy = {"2024-01-01T00:01:00": {"type": "trade", "timestamp": "2024-01-01T00:01:00"},
+                  "2024-01-01T00:02:00": {"type": "state", "state": {"market": "bullish"}}}
+        with open(self.path, "w") as file:
+            json.dump(legacy, file, indent=4)
+        memory = Memory(self.path)
+        self.assertEqual(len(memory), 2)
+        self.assertEqual(memory.load_state(), {"market": "bullish"})
+        memory.store_event({"type": "trade"})
+        memory.close()
+
+        with open(self.path) as file:
+            self.assertEqual(len([json.loads(line) for line in file]), 3)
+        with open(f"{self.path}.legacy") as file:
+            self.assertEqual(json.load(file), legacy)
+
+    def test_foreign_file_is_left_untouched(self):
+        content = "not\nan event log\n{"
+        with open(self.path, "w") as file:
+            file.write(content)
+        with self.assertRaises(ValueError):
+            EventLog(self.path)
+        with open(self.path) as file:
+            self.assertEqual(file.read(), content)
+
+
+class TestMemory(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_state_is_saved_as_deltas(self):
+        path = os.path.join(self.directory.name, "memory.jsonl")
+        memory = Memory(path, full_state_interval=3)
+        state = {f"agent{i}": {"profit": i} for i in range(50)}
+        memory.save_state(state)
+        state["agent1"] = {"profit": 100}
+        del state["agent2"]
+        memory.save_state(state)
+        memory.save_state(state)  # Nothing changed, nothing recorded
+        events = memory.query(event_type="state")
+        self.assertEqual([len(event["state"]) for event in events], [50, 1])
+        self.assertEqual(events[1]["removed"], ["agent2"])
+        self.assertEqual(Memory(path).load_state(), state)
+
+        state["agent3"] = {"profit": -1}
+        memory.save_state(state)
+        state["agent4"] = {"profit": -1}
+        memory.save_state(state)  # Third save after the full state: the whole state again
+        events = memory.query(event_type="state")
+        self.assertEqual([len(event["state"]) for event in events], [50, 1, 1, 49])
+        memory.close()
+        self.assertEqual(Memory(path).load_state(), state)
+
+    def test_backends_share_the_api(self):
+        for backend in ("log", "json", "sqlite"):
+            memory = Memory(os.path.join(self.directory.name, f"memory.{backend}"), backend=backend)
+            memory.store_event({"type": "decision", "action": "expand"})
+            event = memory.get_recent_events(1)[0]
+            self.assertEqual(memory.get_event_by_timestamp(event["timestamp"])["action"], "expand")
+            self.assertEqual(len(memory.get_events_between(start=event["timestamp"])), 1)
+            memory.close()
+
+    def test_state_round_trip(self):
+        path = os.path.join(self.directory.name, "memory.jsonl")
+        memory = Memory(path)
+        self.assertEqual(memory.load_state(), {})
+        memory.save_state({"market": "bullish"})
+        memory.store_event({"type": "decision"})
+        memory.close()
+        self.assertEqual(Memory(path).load_state(), {"market": "bullish"})
+
+
+class TestSQLiteMemory(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "memory.db")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_queries(self):
+        """Events are filtered by type, agent, time and payload fields inside the database."""
+        backend = SQLiteMemoryBackend(self.path, batch_size=2)
+        events = [
+            {"timestamp": "2024-01-01T10:00:00", "type": "strategy_decision", "market_trends": {"bearish": True}},
+            {"timestamp": "2024-01-01T10:30:00", "type": "strategy_decision", "market_trends": {"bearish": False}},
+            {"timestamp": "2024-01-01T11:00:00", "type": "trade", "agent_id": "agent-1"},
+            {"timestamp": "2024-01-01T11:30:00", "type": "trade", "agent_id": "agent-2"},
+            {"timestamp": "2024-01-01T12:00:00", "type": "strategy_decision", "market_trends": {"bearish": True}},
+        ]
+        for event in events:
+            backend.append(event)
+        self.assertEqual(len(backend), 5)
+
+        bearish = list(backend.query(event_type="strategy_decision", fields={"market_trends.bearish": True}))
+        self.assertEqual([event["timestamp"] for event in bearish], ["2024-01-01T10:00:00", "2024-01-01T12:00:00"])
+        self.assertEqual(list(backend.query(agent_id="agent-1", start="2024-01-01T10:45:00")), [events[2]])
+        self.assertEqual(list(backend.query(limit=1, newest_first=True)), [events[4]])
+        self.assertEqual(backend.count(event_type="trade"), 2)
+        self.assertEqual(backend.count(event_type="strategy_decision", fields={"market_trends.bearish": True},
+                                       end="2024-01-01T11:00:00"), 1)
+        backend.close()
+
+        reopened = SQLiteMemoryBackend(self.path)
+        self.assertEqual(reopened.get("2024-01-01T11:30:00")["agent_id"], "agent-2")
+        reopened.close()
+
+    def test_memory_query_matches_across_backends(self):
+        """Memory.query gives the same answers for the sqlite and log backends."""
+        results = []
+        for backend in ("sqlite", "log"):
+            memory = Memory(os.path.join(self.directory.name, f"memory.{backend}"), backend=backend)
+            for i in range(6):
+                memory.store_event({"type": "report", "agent_id": f"agent-{i % 2}", "value": i})
+            results.append([event["value"] for event in
+                            memory.query(event_type="report", agent_id="agent-1",
+                                         start=datetime.now() - timedelta(hours=1), newest_first=True)])
+            memory.close()
+        self.assertEqual(results, [[5, 3, 1], [5, 3, 1]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+import numpy as np
+from environment.order_book import OrderBook, MatchingEngine, Order
+from environment.market import Market
+from economy.trade_system import TradeSystem
+
+
+class TestOrderBook(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = MatchingEngine(["x"])
+
+    def test_price_time_priority(self):
+        engine = self.engine
+        engine.submit("s1", "x", "sell", 101, 5)
+        engine.submit("s2", "x", "sell", 100, 5)
+        engine.submit("s3", "x", "sell", 100, 5)
+        order_id, fills = engine.submit("b", "x", "buy", 101, 12)
+        self.assertEqual([(f.seller, f.price, f.quantity) for f in fills],
+                         [("s2", 100, 5), ("s3", 100, 5), ("s1", 101, 2)])
+        book = engine.books["x"]
+        self.assertEqual((book.best_ask(), book.best_bid(), book.last_price), (101, None, 101))
+        self.assertEqual(engine.fills, 3)
+
+    def test_resting_cancel_and_market_orders(self):
+        engine = self.engine
+        resting_id, fills = engine.submit("b1", "x", "buy", 99, 4)
+        self.assertEqual(fills, [])
+        engine.submit("b2", "x", "buy", 98, 4)
+        self.assertEqual(engine.books["x"].depth(), {"bids": [(99, 4), (98, 4)], "asks": []})
+        self.assertTrue(engine.cancel(resting_id))
+        self.assertFalse(engine.cancel(resting_id))
+        # A market sell sweeps what is left and never rests
+        order_id, fills = engine.submit("s", "x", "sell", None, 10)
+        self.assertEqual([(f.buyer, f.price, f.quantity) for f in fills], [("b2", 98, 4)])
+        self.assertEqual(len(engine.books["x"]), 0)
+        with self.assertRaises(ValueError):
+            engine.submit("s", "x", "short", 1, 1)
+
+    def test_matches_brute_force_reference(self):
+        rng = np.random.default_rng(6)
+        book = OrderBook("x")
+        resting = []  # [price, sequence, side, quantity]
+        for sequence in range(2000):
+            side = "buy" if rng.random() < 0.5 else "sell"
+            price, quantity = int(rng.integers(95, 106)), int(rng.integers(1, 10))
+            fills = book.submit(Order(sequence, sequence, "x", side, price, quantity, sequence))
+            expected = []
+            while quantity:
+                candidates = [r for r in resting if r[2] != side and (r[0] <= price if side == "buy" else r[0] >= price)]
+                if not candidates:
+                    break
+                best = min(candidates, key=lambda r: (r[0] if side == "buy" else -r[0], r[1]))
+                traded = min(quantity, best[3])
+                expected.append((best[0], traded))
+                quantity -= traded
+                best[3] -= traded
+                if not best[3]:
+                    resting.remove(best)
+            if quantity:
+                resting.append([price, sequence, side, quantity])
+            self.assertEqual([(f.price, f.quantity) for f in fills], expected)
+
+    def test_many_cancels_keep_heaps_bounded(self):
+        book = OrderBook("x")
+        for i in range(1000):
+            book.submit(Order(i, None, "x", "buy", 50 + i % 7, 1, i))
+        for i in range(900):
+            book.cancel(i)
+        self.assertEqual(len(book), 100)
+        self.assertLess(len(book._bids), 200)
+        expected = [(price, sum(1 for i in range(900, 1000) if 50 + i % 7 == price)) for price in (56, 55, 54)]
+        self.assertEqual(book.depth(levels=3)["bids"], expected)
+        self.assertEqual(len(book.depth(levels=10)["bids"]), 7)
+
+    def test_cancelled_count_tracks_the_heaps(self):
+        """Cancelled orders dropped from the top of a heap no longer count towards a rebuild."""
+        rng = np.random.default_rng(3)
+        book = OrderBook("x")
+        for i in range(3000):
+            if i > 10 and rng.random() < 0.4:
+                book.cancel(int(rng.integers(i)))
+            else:
+                side = "buy" if rng.random() < 0.5 else "sell"
+                book.submit(Order(i, None, "x", side, int(rng.integers(95, 106)), 1, i))
+            book.spread()
+            stale = sum(not entry[2].active for entry in book._bids + book._asks)
+            self.assertEqual(book._cancelled, stale)
+
+
+class TestMarketOrderBook(unittest.TestCase):
+
+    def test_fills_feed_trade_system_and_prices(self):
+        trade_system = TradeSystem()
+        market = Market(rng=np.random.default_rng(7))
+        market.enable_order_book(trade_system)
+        fills = market.submit_orders([("seller", "Stock A", "sell", 60.0, 3), ("buyer", "Stock A", "buy", 61.0, 2),
+                                      ("buyer", "Unknown", "buy", 1.0, 1)])
+        self.assertEqual(len(fills), 1)
+        self.assertEqual(market.get_asset_price("Stock A"), 60.0)
+        self.assertEqual(market.volumes[0], 2)
+        trade = trade_system.get_trade_history()[0]
+        self.assertEqual((trade["buyer_id"], trade["seller_id"], trade["amount"]), ("buyer", "seller", 2))
+        self.assertAlmostEqual(trade["trade_fee"], 120.0 * 0.02)
+
+
+if __name__ == '__main__':
+    unittest.main()
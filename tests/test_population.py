@@ -0,0 +1,141 @@
+import unittest
+import os
+import tempfile
+import numpy as np
+from environment.environment import Environment
+from environment.population import Population, CitizenView
+from environment.sharding import ShardedRunner
+from organisms.citizen import Citizen, ROLES
+from organisms.agent import BaseAgent
+from utils.telemetry import EventSink, read_events, set_event_sink
+
+
+class TestPopulationMethods(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a small population over the basic facts."""
+        self.environment = Environment()
+        self.facts = self.environment.basic_data_source.data
+        self.population = Population(100, self.facts, seed=42)
+
+    def test_population_initialization(self):
+        """All citizens start idle, learning and without knowledge."""
+        self.assertEqual(len(self.population), 100)
+        self.assertEqual(self.population.count_by_status()["idle"], 100)
+        self.assertTrue(self.population.learning.all())
+        self.assertEqual(int(self.population.knowledge_total.sum()), 0)
+
+    def test_step_reaches_threshold_and_evolves(self):
+        """Every citizen evolves after `threshold` steps, like Citizen.learn/act."""
+        for _ in range(4):
+            self.population.step()
+        self.assertEqual(self.population.count_by_status()["idle"], 100)
+        self.population.step()
+        self.assertEqual(self.population.count_by_status()["evolved"], 100)
+        self.assertFalse(self.population.learning.any())
+        np.testing.assert_array_equal(self.population.knowledge.sum(axis=1), 5)
+        self.assertTrue((self.population.role > 0).all())
+        self.assertEqual(int(self.population.age[0]), 5)
+
+    def test_step_is_deterministic_for_seed(self):
+        """Two populations with the same seed advance identically."""
+        other = Population(100, self.facts, seed=42)
+        for _ in range(5):
+            self.population.step()
+            other.step()
+        np.testing.assert_array_equal(self.population.knowledge, other.knowledge)
+        np.testing.assert_array_equal(self.population.role, other.role)
+
+    def test_citizen_view(self):
+        """Rows are exposed as Citizen objects that read and write the arrays."""
+        view = self.population[3]
+        self.assertIsInstance(view, Citizen)
+        self.assertIsInstance(view, CitizenView)
+        self.assertEqual(view.status, "idle")
+
+        view.learn(self.environment)
+        self.assertEqual(int(self.population.knowledge_total[3]), 1)
+        self.assertEqual(sum(view.knowledge.values()), 1)
+        self.assertEqual(len(view.memory), 1)
+
+        view.update_status("ready to evolve")
+        view.act()
+        self.assertEqual(view.status, "evolved")
+        self.assertIn(view.role, ROLES)
+        self.assertEqual(view.get_summary()["role"], view.role)
+
+    def test_environment_steps_population(self):
+        """An attached population is advanced by Environment.step."""
+        self.environment.attach_population(self.population)
+        self.environment.run(steps=5)
+        self.assertEqual(self.population.count_by_status()["evolved"], 100)
+
+
+class TestShardedRunner(unittest.TestCase):
+
+    def _world(self, size=40):
+        environment = Environment()
+        for i in range(size):
+            environment.add_organism(Citizen(name=f"Citizen{i}"))
+        return environment
+
+    def test_sharded_run_evolves_citizens(self):
+        """Citizen objects receive the state computed on the shards."""
+        environment = self._world()
+        history = environment.run(steps=5, shards=2, seed=7)
+        self.assertEqual(len(history), 5)
+        self.assertEqual(history[-1]["evolved"], 40)
+        for citizen in environment.organisms:
+            self.assertEqual(citizen.status, "evolved")
+            self.assertEqual(sum(citizen.knowledge.values()), 5)
+            self.assertIn(citizen.role, ROLES)
+
+    def test_sharded_run_keeps_each_citizens_threshold(self):
+        """Citizens evolve after their own evolution_threshold, not a run-wide one."""
+        environment = Environment()
+        for i in range(20):
+            environment.add_organism(Citizen(name=f"Citizen{i}", evolution_threshold=2 if i % 2 else 8))
+        history = environment.run(steps=4, shards=2, seed=3)
+        self.assertEqual(history[-1]["evolved"], 10)
+        for citizen in environment.organisms:
+            self.assertEqual(citizen.knowledge_total, 2 if citizen.evolution_threshold == 2 else 4)
+            self.assertEqual(citizen.status, "evolved" if citizen.evolution_threshold == 2 else "idle")
+
+    def test_sharded_run_with_facts_outside_the_vocabulary(self):
+        """Facts a citizen learned elsewhere grow the shard vocabulary instead of failing."""
+        environment = self._world(6)
+        citizen = next(iter(environment.organisms))
+        citizen.learn_many(["custom fact"])
+        environment.run(steps=2, shards=2, seed=5)
+        self.assertEqual(citizen.knowledge["custom fact"], 1)
+        self.assertEqual(citizen.knowledge_total, 3)
+
+    def test_sharded_evolution_reaches_pipeline_and_telemetry(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "events.bin")
+            sink = EventSink(path, codec="json")
+            set_event_sink(sink)
+            try:
+                self._world(8).run(steps=5, shards=2, seed=1)
+            finally:
+                set_event_sink(None)
+                sink.close()
+            self.assertEqual(len(list(read_events(path, "evolution"))), 8)
+
+        environment = self._world(8)
+        pipeline = environment.enable_evolution_pipeline()
+        environment.run(steps=5, shards=2, seed=1)
+        self.assertEqual(pipeline.evolved, 8)
+        self.assertTrue(all(citizen.status in ("evolved", "active") for citizen in environment.organisms))
+        self.assertTrue(any(isinstance(citizen, BaseAgent) for citizen in environment.organisms))
+
+    def test_sharded_run_is_deterministic(self):
+        """The same seed and shard count give the same world."""
+        first, second = self._world(), self._world()
+        ShardedRunner(3, seed=11).run(first, steps=3)
+        ShardedRunner(3, seed=11).run(second, steps=3)
+        self.assertEqual([c.knowledge for c in first.organisms], [c.knowledge for c in second.organisms])
+
+
+if __name__ == '__main__':
+    unittest.main()
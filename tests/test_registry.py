@@ -0,0 +1,74 @@
+import unittest
+from environment.environment import Environment
+from environment.registry import OrganismRegistry
+from organisms.citizen import Citizen, CompactCitizen
+from organisms.agents.trader import Trader
+
+
+class TestOrganismRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = OrganismRegistry()
+        self.citizens = [Citizen(name=f"Citizen{i}") for i in range(3)] + [CompactCitizen(name="Compact")]
+        for citizen in self.citizens:
+            self.registry.add(citizen)
+
+    def test_lookup_and_iteration(self):
+        self.assertEqual(len(self.registry), 4)
+        self.assertIs(self.registry.get(self.citizens[1].citizen_id), self.citizens[1])
+        self.assertIn(self.citizens[3], self.registry)
+        self.assertEqual(list(self.registry), self.citizens)
+
+    def test_compact_citizens_keep_their_uuid_lazy(self):
+        """Registering and indexing a CompactCitizen does not generate its uuid."""
+        compact = self.citizens[3]
+        compact.update_status("ready to evolve")
+        self.assertEqual(self.registry.ready_to_evolve(), [compact])
+        self.assertIsNone(compact._citizen_id)
+
+        # Lookups by id build the index once; later additions and removals keep it current
+        self.assertIs(self.registry.get(compact.citizen_id), compact)
+        late = CompactCitizen(name="Late")
+        self.registry.add(late)
+        self.assertIs(self.registry.get(late.citizen_id), late)
+        self.registry.remove(late.citizen_id)
+        self.assertNotIn(late.citizen_id, self.registry)
+        self.assertEqual(len(self.registry), 4)
+
+    def test_status_and_role_indexes_follow_changes(self):
+        """update_status and evolution move citizens between index buckets."""
+        self.citizens[0].update_status("ready to evolve")
+        self.citizens[3].update_status("ready to evolve")
+        self.assertEqual(self.registry.ready_to_evolve(), [self.citizens[0], self.citizens[3]])
+
+        self.citizens[0].act()
+        self.assertEqual(self.registry.ready_to_evolve(), [self.citizens[3]])
+        self.assertEqual(self.registry.by_status("evolved"), [self.citizens[0]])
+        self.assertEqual(self.registry.by_role(self.citizens[0].role), [self.citizens[0]])
+        self.assertEqual(self.registry.count_by_status(), {"idle": 2, "ready to evolve": 1, "evolved": 1})
+
+    def test_remove(self):
+        citizen = self.citizens[2]
+        self.assertIs(self.registry.remove(citizen.citizen_id), citizen)
+        self.assertNotIn(citizen, self.registry)
+        self.assertEqual(len(self.registry.by_status("idle")), 3)
+        citizen.update_status("evolved")  # No longer reported once removed
+        self.assertEqual(self.registry.by_status("evolved"), [])
+        with self.assertRaises(KeyError):
+            self.registry.remove(citizen)
+
+    def test_environment_agents(self):
+        environment = Environment()
+        citizen = Citizen(name="Ada")
+        environment.add_organism(citizen)
+        trader = Trader(citizen)
+        environment.add_agent(trader)
+        self.assertEqual(environment.agents, [trader])
+        self.assertIs(environment.get_organism(trader.agent_id), trader)
+        self.assertEqual(environment.organisms.by_role("trader"), [trader])
+        self.assertIs(environment.remove_organism(trader), trader)
+        self.assertEqual(environment.agents, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+import os
+import json
+import tempfile
+import numpy as np
+from encephalon.rules import RuleEngine
+from encephalon.strategy import Strategy
+
+
+class TestRuleEngine(unittest.TestCase):
+
+    def test_default_rules_match_original_heuristic(self):
+        engine = RuleEngine()
+        self.assertEqual(engine.decide({"market_trends": {"bullish": True, "bearish": True}})["action"], "expand")
+        self.assertEqual(engine.decide({"market_trends": {"bearish": True}})["action"], "contract")
+        self.assertEqual(engine.decide({})["action"], "maintain")
+
+    def test_operators_strings_and_priority(self):
+        engine = RuleEngine({
+            "default": {"action": "wait"},
+            "rules": [
+                {"name": "risky", "priority": 1, "when": {"risk": {">": 0.5, "<=": 0.9}}, "then": {"action": "hedge"}},
+                {"name": "panic", "priority": 5, "when": {"risk": {">": 0.9}}, "then": {"action": "sell"}},
+                {"name": "regime", "when": {"market.regime": "calm", "risk": {"!=": 0}}, "then": {"action": "buy"}},
+            ]})
+        self.assertEqual(engine.decide({"risk": 0.95})["action"], "sell")
+        self.assertEqual(engine.decide({"risk": 0.6, "market": {"regime": "calm"}})["action"], "hedge")
+        self.assertEqual(engine.decide({"risk": 0.1, "market": {"regime": "calm"}})["action"], "buy")
+        self.assertEqual(engine.decide({"risk": 0.1, "market": {"regime": "stormy"}})["action"], "wait")
+        self.assertEqual(engine.decide({"market": {"regime": "calm"}})["action"], "wait")  # missing risk
+        with self.assertRaises(ValueError):
+            RuleEngine({"rules": [{"when": {"regime": {"<": "calm"}}, "then": {}}]})
+
+    def test_thousands_of_rules_match_reference(self):
+        rng = np.random.default_rng(5)
+        thresholds = rng.uniform(size=(2000, 2))
+        rules = [{"name": str(i), "priority": i % 7, "when": {"a": {">": float(low)}, "b": {"<": float(high)}},
+                  "then": {"action": str(i)}} for i, (low, high) in enumerate(thresholds)]
+        engine = RuleEngine({"default": {"action": "none"}, "rules": rules})
+        for a, b in rng.uniform(size=(20, 2)):
+            matching = [i for i, (low, high) in enumerate(thresholds) if a > low and b < high]
+            expected = min(matching, key=lambda i: (-(i % 7), i)) if matching else "none"
+            self.assertEqual(engine.decide({"a": a, "b": b})["action"], str(expected))
+
+    def test_hot_reload(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "rules.json")
+            with open(path, "w") as f:
+                json.dump({"default": {"action": "hold"}}, f)
+            strategy = Strategy(rules_file=path)
+            self.assertEqual(strategy.decide({"x": 1})["action"], "hold")
+
+            with open(path, "w") as f:
+                json.dump({"default": {"action": "hold"}, "rules": [{"when": {"x": 1}, "then": {"action": "go"}}]}, f)
+            os.utime(path, ns=(1, 1))
+            self.assertEqual(strategy.decide({"x": 1})["action"], "go")
+
+            with open(path, "w") as f:
+                f.write("{not json")
+            os.utime(path, ns=(2, 2))
+            self.assertEqual(strategy.decide({"x": 1})["action"], "go")  # A broken file keeps the old rules
+
+            for broken in ({"rules": [{"when": {"x": None}, "then": {"action": "stop"}}]},
+                           {"rules": ["not a rule"]}, {"rules": {"when": {}}}, ["not a rule set"]):
+                with open(path, "w") as f:
+                    json.dump(broken, f)
+                os.utime(path, ns=(3, 3))
+                self.assertEqual(strategy.decide({"x": 1})["action"], "go")
+                os.utime(path, ns=(2, 2))
+
+    def test_malformed_rule_sets_raise_value_error(self):
+        for broken in ({"rules": [{"when": {"x": None}, "then": {}}]}, {"rules": [{"when": {"x": {">": [1]}}, "then": {}}]},
+                       {"rules": [1]}, {"rules": [{"when": [], "then": {}}]}, {"rules": [{"then": "go"}]},
+                       {"default": "go"}, []):
+            with self.assertRaises(ValueError):
+                RuleEngine(broken)
+
+    def test_rules_file_checked_once_per_decision(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "rules.json")
+            with open(path, "w") as f:
+                json.dump({"default": {"action": "hold"}}, f)
+            strategy = Strategy(rules_file=path)
+            calls = []
+            reload = strategy.rules.reload
+            strategy.rules.reload = lambda *args, **kwargs: calls.append(1) or reload(*args, **kwargs)
+            strategy.decide({"x": 1})
+            self.assertEqual(len(calls), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
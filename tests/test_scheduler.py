@@ -0,0 +1,77 @@
+import unittest
+from environment.environment import Environment
+from environment.scheduler import TickScheduler
+from organisms.citizen import Citizen
+
+
+class CountingCitizen(Citizen):
+    """A citizen with its own act(), which keeps it scheduled on every tick."""
+
+    def __init__(self, name):
+        super().__init__(name=name)
+        self.actions = 0
+
+    def act(self, rng=None):
+        self.actions += 1
+
+
+class TestTickScheduler(unittest.TestCase):
+
+    def test_wake_up_order_and_rescheduling(self):
+        scheduler = TickScheduler()
+        first, second, third = object(), object(), object()
+        scheduler.schedule(second, 2)
+        scheduler.schedule(first, 1)
+        scheduler.schedule(third, 5)
+        scheduler.schedule(third, 2)  # An earlier wake-up replaces the later one
+        self.assertEqual(scheduler.pop_due(), [])
+        scheduler.advance(2)
+        self.assertEqual(scheduler.pop_due(), [first, second, third])
+        self.assertEqual(len(scheduler), 0)
+
+        scheduler.schedule(first)
+        scheduler.sleep(first, 3)
+        scheduler.advance()
+        self.assertEqual(scheduler.pop_due(), [])
+        scheduler.cancel(first)
+        scheduler.advance(5)
+        self.assertEqual(scheduler.pop_due(), [])
+
+
+class TestEnvironmentScheduling(unittest.TestCase):
+
+    def setUp(self):
+        self.environment = Environment(seed=3)
+        self.citizens = [Citizen(name=f"Citizen{i}", evolution_threshold=2) for i in range(10)]
+        for citizen in self.citizens:
+            self.environment.add_organism(citizen)
+
+    def test_evolved_citizens_go_dormant(self):
+        self.environment.run(steps=2)
+        self.assertTrue(all(citizen.status == "evolved" for citizen in self.citizens))
+        self.assertEqual(len(self.environment.scheduler), 0)
+        self.assertEqual(self.environment.tick, 2)
+
+    def test_status_change_wakes_dormant_citizen(self):
+        citizen = self.citizens[0]
+        citizen.learning_enabled = False
+        self.environment.step()
+        self.assertFalse(self.environment.scheduler.is_scheduled(citizen))
+        citizen.update_status("ready to evolve")
+        self.assertTrue(self.environment.scheduler.is_scheduled(citizen))
+        self.environment.step()
+        self.assertEqual(citizen.status, "evolved")
+
+    def test_custom_organisms_stay_scheduled(self):
+        organism = CountingCitizen("Custom")
+        organism.learning_enabled = False
+        self.environment.add_organism(organism)
+        self.environment.run(steps=4)
+        self.assertEqual(organism.actions, 4)
+        self.environment.remove_organism(organism)
+        self.environment.step()
+        self.assertEqual(organism.actions, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+import unittest
+import os
+import tempfile
+import numpy as np
+from environment.environment import Environment
+from environment.market import Market
+from environment.population import Population
+from organisms.citizen import Citizen, CompactCitizen
+from organisms.agents.trader import Trader
+
+
+def summary(environment):
+    return [(type(organism).__name__, organism.citizen_id, organism.name, organism.status, organism.role,
+             organism.knowledge_total, dict(organism.knowledge), list(organism.memory), organism.learning_enabled)
+            for organism in environment.organisms]
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.environment = Environment(name="Saved", seed=11)
+        for i in range(10):
+            self.environment.add_organism(Citizen(name=f"Citizen{i}", evolution_threshold=3))
+        self.environment.add_organism(CompactCitizen(name="Compact", evolution_threshold=3))
+        trader = Trader(Citizen(name="Merchant"))
+        trader.inventory.append("Stock A")
+        self.environment.add_agent(trader)
+        self.environment.add_market("stock", Market(rng=self.environment.rng.stream("market")))
+        self.environment.run(steps=2)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def test_round_trip(self):
+        """A restored world matches the saved one and continues identically."""
+        self.environment.snapshot(self.path("full"))
+        restored = Environment.restore(self.path("full"))
+
+        self.assertEqual(restored.name, "Saved")
+        self.assertEqual(restored.tick, 2)
+        self.assertEqual(summary(restored), summary(self.environment))
+        self.assertEqual(restored.agents[0].inventory, ["Stock A"])
+        self.assertEqual(restored.get_market("stock").get_market_status(),
+                         self.environment.get_market("stock").get_market_status())
+
+        self.environment.run(steps=3)
+        restored.run(steps=3)
+        self.assertEqual(summary(restored), summary(self.environment))
+
+    def test_incremental_snapshot(self):
+        """An incremental snapshot only stores changed organisms and restores on top of its base."""
+        self.environment.run(steps=3)  # Everyone has evolved and gone dormant
+        self.environment.snapshot(self.path("base"))
+        with self.assertRaises(ValueError):
+            Environment().snapshot(self.path("orphan"), incremental=True)
+
+        removed = self.environment.organisms.by_status("evolved")[0]
+        self.environment.remove_organism(removed)
+        self.environment.add_organism(Citizen(name="Newcomer"))
+        self.environment.step()
+        self.environment.snapshot(self.path("delta"), incremental=True)
+
+        size = np.load(os.path.join(self.path("delta"), "organisms", "status.npy")).size
+        self.assertLess(size, len(self.environment.organisms))
+        restored = Environment.restore(self.path("delta"))
+        self.assertEqual(summary(restored), summary(self.environment))
+        self.assertIsNone(restored.get_organism(removed.citizen_id))
+
+    def test_incremental_snapshot_keeps_edits_made_outside_the_step(self):
+        """Knowledge and metadata changed by mutators or direct edits reach the incremental snapshot."""
+        self.environment.run(steps=3)
+        self.environment.snapshot(self.path("base"))
+        learner, edited, _ = self.environment.organisms.by_status("evolved")[:3]
+        learner.learning_enabled = True
+        learner.learn_many(["late fact"])
+        learner.update_status("evolved")
+        edited.knowledge["edited fact"] = 4
+        edited.metadata["note"] = "edited"
+        self.environment.snapshot(self.path("delta"), incremental=True)
+
+        self.assertEqual(np.load(os.path.join(self.path("delta"), "organisms", "status.npy")).size, 2)
+        restored = Environment.restore(self.path("delta"))
+        self.assertEqual(summary(restored), summary(self.environment))
+        self.assertEqual(restored.get_organism(learner.citizen_id).metadata, learner.metadata)
+        self.assertEqual(restored.get_organism(edited.citizen_id).metadata, {"note": "edited"})
+
+        # Restoring records the fingerprints, so an unchanged world writes an empty delta
+        restored.snapshot(self.path("again"), incremental=True)
+        self.assertEqual(np.load(os.path.join(self.path("again"), "organisms", "status.npy")).size, 0)
+
+    def test_incremental_snapshot_into_its_base_is_rejected(self):
+        self.environment.snapshot(self.path("ckpt"))
+        self.environment.run(steps=2)
+        with self.assertRaises(ValueError):
+            self.environment.snapshot(self.path("ckpt"), incremental=True)
+        self.environment.snapshot(self.path("delta"), incremental=True)
+        self.environment.run(steps=1)
+        with self.assertRaises(ValueError):
+            self.environment.snapshot(self.path("ckpt"), incremental=True)  # Base of the base
+        # The rejected writes left the chain intact
+        restored = Environment.restore(self.path("delta"))
+        self.assertEqual(restored.tick, self.environment.tick - 1)
+
+    def test_population_is_memory_mapped(self):
+        environment = Environment(seed=2)
+        environment.attach_population(Population(100, ["a", "b", "c"], seed=2))
+        environment.run(steps=3)
+        environment.snapshot(self.path("population"))
+
+        restored = Environment.restore(self.path("population"))
+        self.assertIsInstance(restored.population.knowledge, np.memmap)
+        np.testing.assert_array_equal(restored.population.knowledge, environment.population.knowledge)
+        restored.run(steps=2)
+        environment.run(steps=2)
+        np.testing.assert_array_equal(restored.population.status, environment.population.status)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+from encephalon.strategy import Strategy, DecisionHistory
+
+
+class TestDecisionCache(unittest.TestCase):
+
+    def test_cache_hits_on_unchanged_features(self):
+        strategy = Strategy(cache_size=2)
+        bullish = {"market_trends": {"bullish": True}, "agents": {"a": 1}}
+        first = strategy.decide(bullish)
+        self.assertEqual(first, {"action": "expand", "resource_allocation": "high"})
+        # State the strategy does not read is not part of the fingerprint
+        self.assertEqual(strategy.decide({"market_trends": {"bullish": True}, "agents": {"b": 2}}), first)
+        self.assertEqual(strategy.cache_info(), {"hits": 1, "misses": 1, "size": 1, "max_size": 2})
+
+        first["action"] = "changed"  # Returned decisions are copies
+        self.assertEqual(strategy.decide(bullish)["action"], "expand")
+
+    def test_lru_eviction(self):
+        strategy = Strategy(cache_size=2)
+        bullish, bearish, neutral = {"market_trends": {"bullish": True}}, {"market_trends": {"bearish": True}}, {}
+        for state in (bullish, bearish, bullish, neutral):  # neutral evicts bearish, the least recent
+            strategy.decide(state)
+        strategy.decide(bullish)
+        strategy.decide(bearish)
+        self.assertEqual((strategy.cache_hits, strategy.cache_misses), (2, 4))
+
+    def test_disabled_cache(self):
+        strategy = Strategy(cache_size=0)
+        self.assertEqual(strategy.decide({})["action"], "maintain")
+        self.assertEqual(strategy.cache_info()["size"], 0)
+
+
+class TestDecisionHistory(unittest.TestCase):
+
+    def test_run_length_encoded_and_bounded(self):
+        history = DecisionHistory(max_runs=2)
+        for decision in ["a"] * 5 + ["b"] * 2 + ["c"]:
+            history.append(decision)
+        self.assertEqual(list(history), ["b", "b", "c"])
+        self.assertEqual((len(history), len(history.runs), history.last()), (3, 2, "c"))
+
+    def test_strategy_history(self):
+        strategy = Strategy()
+        for _ in range(1000):
+            strategy.decide({})
+        self.assertEqual(len(strategy.strategy_history.runs), 1)
+        self.assertEqual(len(strategy.history()), 1000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+import os
+import tempfile
+from types import SimpleNamespace
+from utils.telemetry import EventSink, read_events, set_event_sink
+from organisms.citizen import Citizen
+from encephalon.strategy import Strategy
+from economy.trade_system import TradeSystem
+from economy.value_exchange import ValueExchangeSystem
+from ethics.ethics import EthicsSystem
+
+
+class TestEventSink(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "events.bin")
+
+    def tearDown(self):
+        set_event_sink(None)
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        """Events written by the sink stream back as typed dicts."""
+        with EventSink(self.path, codec="json", batch_size=2) as sink:
+            sink.emit("trade", buyer_id="a", seller_id="b", asset="Stock A", amount=2, price_per_unit=10.0, trade_fee=0.4)
+            sink.emit("penalty", agent_id="a", reason="unfair behavior", amount=30)
+            sink.emit("evolution", citizen_id="c", name="Ada", role="Trader")
+        events = list(read_events(self.path))
+        self.assertEqual([event["type"] for event in events], ["trade", "penalty", "evolution"])
+        self.assertEqual(events[0]["asset"], "Stock A")
+        self.assertEqual(events[1]["amount"], 30)
+        self.assertIsInstance(events[2]["timestamp"], float)
+        self.assertEqual([event["name"] for event in read_events(self.path, "evolution")], ["Ada"])
+
+    def test_unknown_event_type(self):
+        with EventSink(self.path, codec="json") as sink:
+            with self.assertRaises(ValueError):
+                sink.emit("unknown")
+
+    def test_simulation_hooks(self):
+        """Evolution, strategy, trade, exchange and penalty hooks write to the active sink."""
+        sink = EventSink(self.path, codec="json")
+        set_event_sink(sink)
+
+        citizen = Citizen(name="Hooked")
+        citizen.update_status("ready to evolve")
+        citizen.evolve_and_assign_role()
+        Strategy().decide({"market_trends": {"bearish": True}})
+
+        buyer = SimpleNamespace(agent_id="buyer", reputation=0)
+        seller = SimpleNamespace(agent_id="seller", receive_value=lambda value_type, value: None)
+        TradeSystem().record_trade(buyer, seller, "Stock A", 3, 10.0, 0.6)
+        ValueExchangeSystem().process_exchange(buyer, seller, "knowledge", "fact1", "none")
+        EthicsSystem().impose_penalty(buyer)
+        sink.close()
+
+        events = {event["type"]: event for event in read_events(self.path)}
+        self.assertEqual(events["evolution"]["role"], citizen.role)
+        self.assertEqual(events["strategy_decision"]["action"], "contract")
+        self.assertEqual(events["trade"]["amount"], 3)
+        self.assertEqual(events["exchange"]["value"], "fact1")
+        self.assertEqual(events["penalty"]["agent_id"], "buyer")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+import numpy as np
+from environment.tick_store import TickStore, MarketData, price_insights
+from environment.environment import Environment
+from environment.market import Market
+from organisms.citizen import Citizen
+from organisms.agents.analyst import AnalystAgent
+
+
+class TestTickStore(unittest.TestCase):
+
+    def test_rolling_statistics_match_numpy(self):
+        rng = np.random.default_rng(8)
+        prices = 1000 + rng.normal(size=(300, 4)).cumsum(axis=0)
+        store = TickStore(["a", "b", "c", "d"], capacity=50, window=20)
+        for tick, row in enumerate(prices):
+            store.append(row)
+            window = prices[max(tick - 19, 0):tick + 1]
+            stats = store.stats()
+            np.testing.assert_allclose(stats["mean"], window.mean(axis=0))
+            np.testing.assert_allclose(stats["variance"], window.var(axis=0), atol=1e-6)
+            np.testing.assert_array_equal(stats["max"], window.max(axis=0))
+        np.testing.assert_array_equal(store.view(50), prices[-50:])
+        np.testing.assert_array_equal(store.view(500, "c"), prices[-50:, 2])
+        self.assertEqual(store.asset_stats("b")["min"], prices[-20:, 1].min())
+
+    def test_views_are_zero_copy_and_read_only(self):
+        store = TickStore(["a"], capacity=4, window=2)
+        for price in range(6):
+            store.append([price])
+        view = store.view(3)
+        self.assertTrue(np.shares_memory(view, store._buffer))
+        self.assertFalse(view.flags.writeable)
+        np.testing.assert_array_equal(view[:, 0], [3, 4, 5])
+        self.assertIs(store.stats(), store.stats())  # Computed once per tick
+        with self.assertRaises(ValueError):
+            TickStore(["a"], capacity=4, window=5)
+
+
+class TestMarketData(unittest.TestCase):
+
+    def test_environment_market_data_feeds_agents(self):
+        environment = Environment()
+        market = Market(rng=np.random.default_rng(9), history_size=100, stats_window=10)
+        environment.add_market("default_market", market)
+        for _ in range(30):
+            market.simulate_market_fluctuations()
+
+        data = environment.get_market_data("default_market")
+        self.assertIsInstance(data, MarketData)
+        self.assertEqual(len(data["Stock A"]), 10)
+        np.testing.assert_array_equal(data["Stock A"], market.get_price_history("Stock A")[-10:])
+        self.assertEqual(environment.get_market_data("missing"), {})
+
+        analyst = AnalystAgent(Citizen(name="Analyst"))
+        insights = analyst.perform_task({"market_data": data})["insights"]
+        plain = price_insights({item: list(prices) for item, prices in data.items()})
+        for item in plain:
+            self.assertAlmostEqual(insights[item]["average_price"], plain[item]["average_price"])
+            self.assertAlmostEqual(insights[item]["volatility"], plain[item]["volatility"])
+
+    def test_price_insights_cover_the_requested_ticks(self):
+        store = TickStore(["A", "B"], capacity=50, window=10)
+        for tick in range(30):
+            store.append([tick, 100 - 2 * tick])
+        for ticks in (3, 25):
+            insights = price_insights(store.market_data(ticks))
+            plain = price_insights({item: list(prices) for item, prices in store.market_data(ticks).items()})
+            self.assertEqual(len(store.market_data(ticks)["A"]), ticks)
+            for item in ("A", "B"):
+                self.assertAlmostEqual(insights[item]["average_price"], plain[item]["average_price"])
+                self.assertAlmostEqual(insights[item]["volatility"], plain[item]["volatility"])
+        self.assertEqual(price_insights(store.market_data(3))["A"]["volatility"], 2)
+        self.assertEqual(price_insights(store.market_data(1)), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
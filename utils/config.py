@@ -1,5 +1,6 @@
 import json
 import os
+from utils.loggings import log_info
 
 class Config:
     """
@@ -48,7 +49,7 @@ if __name__ == "__main__":
 
     # Get a config value (e.g., a path or an integer setting)
     db_path = config.get("database_path")
-    print(f"Database path: {db_path}")
+    log_info(f"Database path: {db_path}")
 
     # Update a config value
     config.set("new_feature_enabled", True)
@@ -1,13 +1,17 @@
+import atexit
+import copy
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 
 # Define the log file location and max size before rotating logs
 LOG_FILE = "nyxx_log.log"
 LOG_MAX_SIZE = 10 * 1024 * 1024  # 10 MB
 LOG_BACKUP_COUNT = 5  # Keep 5 backup copies of the log file
+LOG_QUEUE_SIZE = 10000  # Records buffered between the simulation and the async log writer
 
 # Setting up the logger
-def setup_logger():
+def setup_logger(async_logging: bool = False, queue_size: int = LOG_QUEUE_SIZE, policy: str = "drop"):
     # Create a logger instance
     logger = logging.getLogger("NyXXLogger")
     
@@ -34,8 +38,128 @@ def setup_logger():
     logger.addHandler(console_handler)
     logger.addHandler(file_handler)
 
+    # Optionally move formatting and file I/O off the calling thread
+    if async_logging:
+        enable_async_logging(logger, queue_size=queue_size, policy=policy)
+
     return logger
 
+
+_exception_formatter = logging.Formatter()
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    A QueueHandler for a bounded queue.
+    With the "drop" policy, records that do not fit are discarded and counted in `dropped`;
+    with the "block" policy the caller waits for space (backpressure), up to `timeout` seconds.
+    The message is merged with its arguments (and any exception rendered) before the record is
+    queued, so later changes to mutable arguments cannot alter it; the handlers' formatting
+    (timestamps, levels, layout) still happens on the listener thread.
+    """
+
+    POLICIES = ("drop", "block")
+
+    def __init__(self, log_queue, policy: str = "drop", timeout: float = None):
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown queue policy '{policy}', expected one of {self.POLICIES}.")
+        super().__init__(log_queue)
+        self.policy = policy
+        self.timeout = timeout
+        self.dropped = 0
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = record.exc_text or _exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            if self.policy == "block":
+                self.queue.put(record, timeout=self.timeout)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _BlockingQueueListener(QueueListener):
+    """
+    A QueueListener whose stop sentinel waits for space, so stopping never fails on a full queue.
+    """
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+
+# Active async pipelines, keyed by logger name: (logger, queue_handler, listener, handlers)
+_async_pipelines = {}
+
+
+def enable_async_logging(logger=None, queue_size: int = LOG_QUEUE_SIZE, policy: str = "drop", timeout: float = None):
+    """
+    Put a queue between `logger` (the "NyXXLogger" logger by default) and its handlers.
+    The existing handlers are moved onto a QueueListener thread, so the caller only pays for
+    a queue put while formatting, stream flushes and file writes (including rotations)
+    happen in the background.
+    :param queue_size: Maximum number of records waiting to be written.
+    :param policy: "drop" to discard records when the queue is full, "block" to wait for space.
+    :return: The BoundedQueueHandler now attached to the logger.
+    """
+    logger = logger if logger is not None else logging.getLogger("NyXXLogger")
+    if logger.name in _async_pipelines:
+        return _async_pipelines[logger.name][1]
+
+    handlers = logger.handlers[:]
+    log_queue = queue.Queue(maxsize=queue_size)
+    queue_handler = BoundedQueueHandler(log_queue, policy=policy, timeout=timeout)
+    listener = _BlockingQueueListener(log_queue, *handlers, respect_handler_level=True)
+    for handler in handlers:
+        logger.removeHandler(handler)
+    logger.addHandler(queue_handler)
+    listener.start()
+    _async_pipelines[logger.name] = (logger, queue_handler, listener, handlers)
+    return queue_handler
+
+
+def flush_async_logging():
+    """
+    Block until every queued record has been written, then flush the handlers.
+    """
+    for _, queue_handler, _, handlers in list(_async_pipelines.values()):
+        queue_handler.queue.join()
+        for handler in handlers:
+            handler.flush()
+
+
+def disable_async_logging(logger=None):
+    """
+    Drain the queue of `logger` (the "NyXXLogger" logger by default) and reattach its handlers directly.
+    """
+    logger = logger if logger is not None else logging.getLogger("NyXXLogger")
+    pipeline = _async_pipelines.pop(logger.name, None)
+    if pipeline is None:
+        return
+    _, queue_handler, listener, handlers = pipeline
+    listener.stop()  # processes everything still queued before returning
+    logger.removeHandler(queue_handler)
+    for handler in handlers:
+        handler.flush()
+        logger.addHandler(handler)
+
+
+@atexit.register
+def shutdown_async_logging():
+    """
+    Flush-on-shutdown hook: drain every async pipeline so no queued record is lost at exit.
+    """
+    for logger, _, _, _ in list(_async_pipelines.values()):
+        disable_async_logging(logger)
+
 # Example logger instance
 logger = setup_logger()
 
@@ -46,10 +170,55 @@ logger.info("Logger initialized and ready.")
 # Set up a basic configuration for logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# When True, log_hot() drops hot-path messages before any formatting or record creation
+_quiet_hot_path = False
+
+
+def set_quiet_hot_path(quiet: bool = True):
+    """
+    Globally silence (or re-enable) logging from per-tick hot paths such as Citizen.learn,
+    Trader.buy or Market.simulate_market_fluctuations. Regular log_info/log_error calls are unaffected.
+    """
+    global _quiet_hot_path
+    _quiet_hot_path = quiet
+
+
+def is_quiet_hot_path() -> bool:
+    return _quiet_hot_path
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Return a named logger, for modules that log through log_hot().
+    """
+    return logging.getLogger(name)
+
+
+def log_hot(logger, message, *args, level=logging.INFO):
+    """
+    Log from a hot path.
+    Arguments are %-style and lazy: nothing is formatted unless hot-path logging is on and the
+    logger is enabled for the level.
+    """
+    if not _quiet_hot_path and logger.isEnabledFor(level):
+        logger.log(level, message, *args)
+
+
+# Function to log debug messages
+def log_debug(message, *args):
+    if logging.root.isEnabledFor(logging.DEBUG):
+        logging.debug(message, *args)
+
 # Function to log informational messages
-def log_info(message):
-    logging.info(message)
+def log_info(message, *args):
+    if logging.root.isEnabledFor(logging.INFO):
+        logging.info(message, *args)
+
+# Function to log warning messages
+def log_warning(message, *args):
+    if logging.root.isEnabledFor(logging.WARNING):
+        logging.warning(message, *args)
 
 # Function to log error messages
-def log_error(message):
-    logging.error(message)
+def log_error(message, *args):
+    logging.error(message, *args)
@@ -0,0 +1,73 @@
+# NyXX/utils/rng.py
+
+import zlib
+import numpy as np
+
+
+class RNGRegistry:
+    """
+    Hands out independent NumPy random streams for every subsystem of a simulation.
+    All streams derive from one root seed: a stream is identified by its name (and optionally
+    a shard number), so the same seed always gives the same stream for the same subsystem,
+    regardless of the order in which subsystems ask for them. Streams never share state,
+    which keeps parallel shards independent and lets subsystems draw random numbers in batches.
+    """
+
+    def __init__(self, seed=None):
+        """
+        :param seed: Root seed for the whole simulation. A fresh seed is drawn from the OS if omitted;
+                     it is then available as `registry.seed` so the run can be reproduced.
+        """
+        self.root = np.random.SeedSequence(seed)
+        self.seed = self.root.entropy
+        self._streams = {}
+
+    def seed_sequence(self, name: str, shard: int = None) -> np.random.SeedSequence:
+        """
+        Return the SeedSequence behind a stream, e.g. to seed a worker process.
+        """
+        spawn_key = (zlib.crc32(name.encode()),) if shard is None else (zlib.crc32(name.encode()), shard)
+        return np.random.SeedSequence(self.seed, spawn_key=spawn_key)
+
+    def stream(self, name: str, shard: int = None) -> np.random.Generator:
+        """
+        Return the Generator for a subsystem (and shard), creating it on first use.
+        """
+        key = (name, shard)
+        generator = self._streams.get(key)
+        if generator is None:
+            generator = self._streams[key] = np.random.default_rng(self.seed_sequence(name, shard))
+        return generator
+
+    def shard_seeds(self, name: str, shards: int) -> list:
+        """
+        Return one SeedSequence per shard for a sharded subsystem.
+        """
+        return [self.seed_sequence(name, shard) for shard in range(shards)]
+
+    def get_state(self) -> dict:
+        """
+        Return the root seed and the bit generator state of every stream created so far.
+        """
+        return {
+            "seed": self.seed,
+            "streams": [[name, shard, generator.bit_generator.state]
+                        for (name, shard), generator in self._streams.items()],
+        }
+
+    def set_state(self, state: dict):
+        """
+        Restore a registry from get_state(), continuing every stream where it left off.
+        Generators already handed out for a restored stream are updated in place, so
+        subsystems holding on to them follow the restored state.
+        """
+        self.root = np.random.SeedSequence(state["seed"])
+        self.seed = self.root.entropy
+        streams, self._streams = self._streams, {}
+        for name, shard, bit_state in state["streams"]:
+            key = (name, shard)
+            generator = streams.get(key)
+            if generator is None:
+                generator = np.random.default_rng(self.seed_sequence(name, shard))
+            generator.bit_generator.state = bit_state
+            self._streams[key] = generator
@@ -0,0 +1,153 @@
+# NyXX/utils/telemetry.py
+
+import json
+import struct
+import time
+
+try:
+    import msgpack
+except ImportError:  # msgpack is optional; JSON payloads are used without it
+    msgpack = None
+
+# File header: magic bytes followed by a single codec byte
+MAGIC = b"NYXXEV1\n"
+CODECS = {"json": 0, "msgpack": 1}
+_FRAME = struct.Struct("<I")  # Little-endian payload length prefix
+
+# Typed simulation events and their fields, in the order they are stored.
+# Every record also carries its event type and an epoch-float timestamp.
+EVENT_TYPES = {
+    "evolution": ("citizen_id", "name", "role"),
+    "trade": ("buyer_id", "seller_id", "asset", "amount", "price_per_unit", "trade_fee"),
+    "exchange": ("initiator_id", "receiver_id", "value_type", "value", "trade_terms"),
+    "strategy_decision": ("action", "resource_allocation", "decision"),
+    "penalty": ("agent_id", "reason", "amount"),
+    "strategy_performance": ("evaluated", "failed", "mean", "std", "min", "max", "median"),
+}
+_TYPE_CODES = {event_type: code for code, event_type in enumerate(EVENT_TYPES)}
+_TYPE_NAMES = list(EVENT_TYPES)
+
+
+def _encoder(codec: str):
+    if codec == "msgpack":
+        return lambda record: msgpack.packb(record, default=str, use_bin_type=True)
+    return lambda record: json.dumps(record, default=str, separators=(",", ":")).encode()
+
+
+def _decoder(codec: str):
+    if codec == "msgpack":
+        return lambda payload: msgpack.unpackb(payload, raw=False)
+    return json.loads
+
+
+class EventSink:
+    """
+    Writes typed simulation events to a binary file of length-prefixed records.
+    Each record is a compact positional list [type code, timestamp, *fields], encoded with
+    msgpack when it is installed and JSON otherwise. Records are buffered and written in
+    batches so emitting an event costs one encode and a list append.
+    """
+
+    def __init__(self, path: str, codec: str = None, batch_size: int = 512):
+        """
+        :param path: File to write events to (overwritten).
+        :param codec: "msgpack" or "json"; defaults to msgpack when available.
+        :param batch_size: Number of records buffered before they are written to disk.
+        """
+        codec = codec or ("msgpack" if msgpack is not None else "json")
+        if codec not in CODECS:
+            raise ValueError(f"Unknown event codec '{codec}'.")
+        if codec == "msgpack" and msgpack is None:
+            raise ImportError("The msgpack codec requires the 'msgpack' package.")
+        self.path = path
+        self.codec = codec
+        self.batch_size = batch_size
+        self.count = 0
+        self._encode = _encoder(codec)
+        self._buffer = []
+        self._file = open(path, "wb")
+        self._file.write(MAGIC + bytes([CODECS[codec]]))
+
+    def emit(self, event_type: str, **fields):
+        """
+        Record a single event. Fields missing from the event's schema are stored as None.
+        """
+        code = _TYPE_CODES.get(event_type)
+        if code is None:
+            raise ValueError(f"Unknown event type '{event_type}'.")
+        record = [code, time.time()]
+        record.extend(fields.get(name) for name in EVENT_TYPES[event_type])
+        payload = self._encode(record)
+        self._buffer.append(_FRAME.pack(len(payload)) + payload)
+        self.count += 1
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Write buffered records to disk.
+        """
+        if self._buffer:
+            self._file.write(b"".join(self._buffer))
+            self._buffer.clear()
+        self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def read_events(path: str, event_type: str = None):
+    """
+    Stream events back from a file written by EventSink, one dict at a time.
+    :param event_type: Optionally only yield events of this type.
+    """
+    with open(path, "rb") as file:
+        header = file.read(len(MAGIC) + 1)
+        if header[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a NyXX event log.")
+        codec = {code: name for name, code in CODECS.items()}[header[-1]]
+        if codec == "msgpack" and msgpack is None:
+            raise ImportError("Reading this event log requires the 'msgpack' package.")
+        decode = _decoder(codec)
+        wanted = _TYPE_CODES[event_type] if event_type is not None else None
+
+        while True:
+            prefix = file.read(_FRAME.size)
+            if len(prefix) < _FRAME.size:
+                return
+            (length,) = _FRAME.unpack(prefix)
+            record = decode(file.read(length))
+            if wanted is not None and record[0] != wanted:
+                continue
+            name = _TYPE_NAMES[record[0]]
+            event = {"type": name, "timestamp": record[1]}
+            event.update(zip(EVENT_TYPES[name], record[2:]))
+            yield event
+
+
+# The process-wide sink that simulation hooks emit to (None disables telemetry)
+_event_sink = None
+
+
+def set_event_sink(sink: EventSink = None):
+    """
+    Install the sink that simulation hooks write to, or pass None to disable telemetry.
+    """
+    global _event_sink
+    _event_sink = sink
+
+
+def get_event_sink():
+    """
+    Return the active sink, or None. Hooks check this first so that building an event
+    costs nothing while telemetry is off.
+    """
+    return _event_sink